@@ -1,13 +1,39 @@
 """Pytest configuration and fixtures"""
 import pytest
+from utils.startup_profile import StartupProfiler, requested as startup_profile_requested
+
+# Started ahead of the remaining imports so --startup-profile can attribute their cost
+_startup_profiler = StartupProfiler().start() if startup_profile_requested() else None
+
 import os
-from playwright.sync_api import sync_playwright
+import json
+import re
 from datetime import datetime
+from pages.base_page import BasePage
+from utils.artifact_policy import ArtifactRecorder, prune_artifacts
+from utils.artifact_writer import ArtifactWriter
+from utils.artifacts import artifact_dir, safe_filename, unique_timestamp
+from utils.auth_state_cache import AuthStateCache
+from utils import browser_server
+from utils.bdd_collection import BddCollectionPlugin
+from utils.context_pool import ContextPool
+from utils.duration_history import DurationHistory, DurationHistoryPlugin
+from utils.impact_index import ImpactIndex, ImpactPlugin
+from utils.page_metrics import PageMetricsCollector
+from utils.rerun_engine import RerunPlugin
+from utils.step_timing import StepTimingPlugin, StepTracer
+from utils.suite_orchestrator import SuiteOrchestratorPlugin, parse_suites
+from utils.test_data import DATA_TAG_PREFIX, workbook_data
+from utils.config_manager import config, resolve_tag_overrides
+from utils.network_recorder import NETWORK_MODES, UNMATCHED_POLICIES, apply_network_mode, har_path
+from utils.resource_blocker import ResourceBlocker, ResourceSizeTable
 
 
 @pytest.fixture(scope="session")
 def playwright_instance():
     """Create a Playwright instance for the test session"""
+    # Imported here so collection-only and filtered-out runs never load Playwright
+    from playwright.sync_api import sync_playwright
     with sync_playwright() as p:
         yield p
 
@@ -18,7 +44,7 @@ def pytest_addoption(parser):
         "--test-browser",
         action="store",
         default="chromium",
-        help="Browser to run tests on: chromium, firefox, webkit"
+        help="Browser(s) to run tests on: chromium, firefox, webkit, or a comma-separated list of them"
     )
     parser.addoption(
         "--headless",
@@ -26,17 +52,151 @@ def pytest_addoption(parser):
         default=False,
         help="Run browser in headless mode"
     )
+    parser.addoption(
+        "--slow-mo",
+        action="store",
+        type=int,
+        default=None,
+        help="Debug mode: delay every browser action by this many milliseconds (env SLOW_MO)"
+    )
+    parser.addoption(
+        "--wait-strategy",
+        action="store",
+        default="ready",
+        choices=("ready", "networkidle"),
+        help="Navigation wait: page readiness conditions (default) or legacy networkidle"
+    )
+    parser.addoption(
+        "--no-auth-cache",
+        action="store_true",
+        default=False,
+        help="Always perform the UI login instead of reusing cached storage state"
+    )
+    parser.addoption(
+        "--clear-auth-cache",
+        action="store_true",
+        default=False,
+        help="Invalidate all cached login storage states before the session"
+    )
+    parser.addoption(
+        "--no-context-pool",
+        action="store_true",
+        default=False,
+        help="Create a fresh browser context per test instead of leasing from the pool"
+    )
+    parser.addoption(
+        "--no-duration-history",
+        action="store_true",
+        default=False,
+        help="Neither record test durations nor schedule the slowest tests first"
+    )
+    parser.addoption(
+        "--page-action-spans",
+        action="store_true",
+        default=False,
+        help="Also time BasePage actions (click, fill, wait, navigate) as nested spans"
+    )
+    parser.addoption(
+        "--page-metrics",
+        action="store_true",
+        default=False,
+        help="Collect browser performance metrics even when page_metrics.enabled is false"
+    )
+    parser.addoption(
+        "--no-page-metrics",
+        action="store_true",
+        default=False,
+        help="Do not collect browser performance metrics on navigations and key actions"
+    )
+    parser.addoption(
+        "--network-mode",
+        action="store",
+        default=None,
+        choices=NETWORK_MODES,
+        help="Network mode: live (default), record HAR files per feature, or replay them offline"
+    )
+    parser.addoption(
+        "--har-unmatched",
+        action="store",
+        default=None,
+        choices=UNMATCHED_POLICIES,
+        help="In replay mode, abort requests missing from the HAR or let them fall through to the network"
+    )
+    parser.addoption(
+        "--no-resource-blocking",
+        action="store_true",
+        default=False,
+        help="Load every image, font, media and third-party request"
+    )
+    parser.addoption(
+        "--no-collection-cache",
+        action="store_true",
+        default=False,
+        help="Re-parse every feature file and use pytest-bdd's own step lookup"
+    )
+    parser.addoption(
+        "--changed-since",
+        action="store",
+        default=None,
+        metavar="GIT_REF",
+        help="Only run scenarios affected by changes since this git ref, according to the impact index"
+    )
+    parser.addoption(
+        "--suites",
+        action="store",
+        default=None,
+        metavar="TAGS",
+        help="Comma-separated tag expressions (or 'all'): run their union once and report per tag"
+    )
+    parser.addoption(
+        "--retries",
+        action="store",
+        type=int,
+        default=None,
+        help="Retry failed scenarios this many times at the end of the session (default from config.yaml)"
+    )
+    parser.addoption(
+        "--failure-budget",
+        action="store",
+        type=int,
+        default=None,
+        help="Stop the session once this many scenarios failed their first attempt, 0 disables it"
+    )
+    parser.addoption(
+        "--browser-server",
+        action="store_true",
+        default=False,
+        help="Connect to the shared browser server daemon, starting it if needed, instead of launching a browser (env BROWSER_SERVER=1)"
+    )
+    parser.addoption(
+        "--startup-profile",
+        action="store_true",
+        default=False,
+        help="Print an import-time and startup-phase breakdown after the run"
+    )
 
 
-@pytest.fixture(scope="session")
-def browser(playwright_instance, request):
-    """Create a browser instance for the test session"""
-    # Get browser type from command line argument or environment variable
-    browser_name = request.config.getoption("--test-browser") or os.getenv("BROWSER", "chromium")
-    browser_name = browser_name.lower()
-    
+BROWSER_NAMES = ("chromium", "firefox", "webkit")
+
+# Browsers connected to the shared server, so every test can postpone its idle shutdown
+_server_browsers = {}
+
+
+def _browser_names(config):
+    """Get the browsers to run on from --test-browser (comma-separated) or the BROWSER env variable"""
+    value = config.getoption("--test-browser") or os.getenv("BROWSER", "chromium")
+    names = list(dict.fromkeys(name.strip().lower() for name in value.split(",") if name.strip()))
+    unknown = [name for name in names if name not in BROWSER_NAMES]
+    if unknown or not names:
+        raise pytest.UsageError(f"--test-browser: unknown browser {', '.join(unknown)}, "
+                                f"expected a comma-separated list of {', '.join(BROWSER_NAMES)}")
+    return names
+
+
+def _launch_options(browser_name, config):
+    """Build the launch options for one browser engine"""
     # Get headless option from command line or environment
-    headless_option = request.config.getoption("--headless")
+    headless_option = config.getoption("--headless")
     is_ci = os.getenv("CI", "false").lower() == "true" or os.getenv("GITHUB_ACTIONS", "false").lower() == "true"
     
     # Browser launch options
@@ -88,23 +248,111 @@ def browser(playwright_instance, request):
     else:
         # Local development options
         launch_options["args"] = ["--start-maximized"]
-        launch_options["slow_mo"] = 500
     
-    # Launch the appropriate browser
-    if browser_name == "firefox":
-        browser = playwright_instance.firefox.launch(**launch_options)
-    elif browser_name == "webkit":
-        browser = playwright_instance.webkit.launch(**launch_options)
-    else:  # default to chromium
-        browser = playwright_instance.chromium.launch(**launch_options)
+    # Slow motion is an opt-in debug aid, never a default
+    slow_mo = config.getoption("--slow-mo")
+    if slow_mo is None:
+        slow_mo = int(os.getenv("SLOW_MO", "0"))
+    if slow_mo:
+        launch_options["slow_mo"] = slow_mo
+    return launch_options
+
+
+@pytest.fixture(scope="session", autouse=True)
+def browser_name(request):
+    """Browser engine of the current test, parametrized when --test-browser names several"""
+    return getattr(request, "param", None) or _browser_names(request.config)[0]
+
+
+@pytest.fixture(scope="session")
+def browser(playwright_instance, request, browser_name):
+    """Create a browser instance for the test session, one per engine in multi-browser runs"""
+    launch_options = _launch_options(browser_name, request.config)
+    browser_type = getattr(playwright_instance, browser_name)
+    
+    # Connect to the shared browser server when enabled, falling back to a local launch
+    server_settings = config.get_browser_server_settings()
+    endpoint = None
+    use_server = request.config.getoption("--browser-server") or os.getenv("BROWSER_SERVER") == "1"
+    if use_server or server_settings['enabled']:
+        if server_settings['auto_start']:
+            server_options = {key: value for key, value in launch_options.items() if key != "slow_mo"}
+            endpoint = browser_server.ensure_running(
+                browser_name, server_options, server_settings['idle_seconds'],
+                server_settings['directory'], server_settings['start_timeout_seconds']
+            )
+        else:
+            endpoint = browser_server.endpoint(browser_name, server_settings['directory'])
+        if endpoint is None:
+            print(f"Browser server for {browser_name} unavailable, launching a local browser")
+    
+    if endpoint:
+        browser = browser_type.connect(endpoint, slow_mo=launch_options.get("slow_mo"))
+        _server_browsers[browser] = (browser_name, server_settings['directory'])
+    else:
+        browser = browser_type.launch(**launch_options)
     
     yield browser
+    _server_browsers.pop(browser, None)
+    # For a server connection this only disconnects; the server keeps running
     browser.close()
 
 
-@pytest.fixture(scope="function")
-def browser_context(browser):
-    """Create a new browser context for each test"""
+@pytest.fixture(scope="session")
+def auth_state_cache(request):
+    """Create the authenticated storage-state cache, or None when disabled"""
+    settings = config.get_auth_cache_settings()
+    if not settings['enabled'] or request.config.getoption("--no-auth-cache"):
+        return None
+    
+    cache = AuthStateCache(settings['directory'], settings['ttl_seconds'])
+    if request.config.getoption("--clear-auth-cache"):
+        cache.clear()
+    return cache
+
+
+@pytest.fixture(scope="session")
+def resource_size_table():
+    """Known response sizes used to estimate bytes saved by resource blocking"""
+    size_table = ResourceSizeTable(config.get_resource_blocking_settings()['size_table'])
+    yield size_table
+    size_table.save()
+
+
+def _scenario_names(request):
+    """Get the (feature name, scenario name) of a pytest-bdd test"""
+    scenario = getattr(getattr(request.node, "function", None), "__scenario__", None)
+    if scenario is not None:
+        feature_file = os.path.basename(scenario.feature.filename)
+        return os.path.splitext(feature_file)[0], scenario.name
+    return request.node.module.__name__.split(".")[-1], request.node.name
+
+
+def _variant_id(request):
+    """Parametrization id of a test, e.g. its data row, without the browser id"""
+    callspec = getattr(request.node, "callspec", None)
+    if callspec is None:
+        return None
+    variant = callspec.id
+    if "browser_name" in callspec.params:
+        variant = re.sub(rf"^{re.escape(callspec.params['browser_name'])}(-|$)", "", variant)
+    return variant or None
+
+
+def _auth_cache_key(request, browser, auth_state_cache):
+    """Get the (user, base URL, browser) cache key for a test, or None if it must log in via UI"""
+    if auth_state_cache is None:
+        return None
+    
+    settings = config.get_auth_cache_settings()
+    for tag in settings['skip_tags']:
+        if request.node.get_closest_marker(tag):
+            return None
+    return (settings['user'], config.get_login_page_url(), browser.browser_type.name)
+
+
+def _context_options():
+    """Build the options every browser context is created with"""
     # Check if we're in CI environment
     is_ci = os.getenv("CI", "false").lower() == "true" or os.getenv("GITHUB_ACTIONS", "false").lower() == "true"
     
@@ -120,57 +368,164 @@ def browser_context(browser):
         "timezone_id": "America/New_York"
     }
     
-    # Add video recording only if not in CI to avoid storage issues
-    if not is_ci:
+    # Add video recording only if not in CI to avoid storage issues; the artifact
+    # policy deletes the videos of tests it does not retain
+    artifact_settings = config.get_artifact_settings()
+    if not is_ci and artifact_settings['video'] != "off":
         context_options.update({
-            "record_video_dir": "reports/videos/",
-            "record_video_size": {'width': 1920, 'height': 1080}
+            "record_video_dir": artifact_dir("videos"),
+            "record_video_size": artifact_settings['video_size']
         })
+    return context_options
+
+
+def _configure_context(context):
+    """Apply default timeouts to a new browser context"""
+    # Set longer timeouts for more stability
+    context.set_default_timeout(30000)  # 30 seconds
+    context.set_default_navigation_timeout(45000)  # 45 seconds
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, request):
+    """Create a pre-warmed pool of browser contexts, or None when pooling is disabled"""
+    settings = config.get_context_pool_settings()
+    network_mode = request.config.getoption("--network-mode") or config.get_network_settings()['mode']
+    # HAR recordings are only written when a context closes, so recording needs fresh contexts
+    if not settings['enabled'] or request.config.getoption("--no-context-pool") or network_mode == "record":
+        yield None
+        return
+    
+    pool = ContextPool(browser, _context_options(), settings['size'], settings['max_uses'], _configure_context)
+    pool.prewarm()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def browser_context(browser, request, auth_state_cache, resource_size_table, context_pool):
+    """Create or lease a browser context for each test"""
+    # Start already authenticated when a valid cached login state exists
+    auth_cache_key = _auth_cache_key(request, browser, auth_state_cache)
+    auth_state = auth_state_cache.get(*auth_cache_key) if auth_cache_key else None
+    blocker = None
+    if browser in _server_browsers:
+        browser_server.touch(*_server_browsers[browser])
     
     try:
-        context = browser.new_context(**context_options)
+        if context_pool:
+            context, page = context_pool.lease(auth_state)
+        else:
+            context_options = _context_options()
+            if auth_state:
+                context_options["storage_state"] = auth_state
+            context = browser.new_context(**context_options)
+            _configure_context(context)
+            page = None
+        
+        # Record or replay network traffic through HAR files
+        network_settings = config.get_network_settings()
+        network_mode = request.config.getoption("--network-mode") or network_settings['mode']
+        if network_mode != "live":
+            unmatched = request.config.getoption("--har-unmatched") or network_settings['unmatched']
+            feature_name, scenario_name = _scenario_names(request)
+            scenario_har = har_path(network_settings['har_directory'], feature_name, scenario_name,
+                                    browser.browser_type.name, _variant_id(request))
+            if not apply_network_mode(context, network_mode, scenario_har, unmatched) and unmatched == "abort":
+                pytest.fail(f"No HAR recording for '{scenario_name}' at {scenario_har}, run with --network-mode=record first")
         
-        # Set longer timeouts for more stability
-        context.set_default_timeout(30000)  # 30 seconds
-        context.set_default_navigation_timeout(45000)  # 45 seconds
+        # Abort requests the scenario does not need; registered last so it runs before HAR routing
+        tags = [marker.name for marker in request.node.iter_markers()]
+        blocking_settings = resolve_tag_overrides(config.get_resource_blocking_settings(), tags)
+        if blocking_settings['enabled'] and not request.config.getoption("--no-resource-blocking"):
+            blocker = ResourceBlocker(blocking_settings, resource_size_table, config.get_login_page_url())
+            blocker.attach(context)
         
-        page = context.new_page()
+        if page is None:
+            page = context.new_page()
         
-        # Additional page configurations for stability
-        page.set_viewport_size({"width": 1920, "height": 1080})
+        # Trace and video are recorded for every test and kept according to the artifact policy
+        artifact_settings = resolve_tag_overrides(config.get_artifact_settings(), tags)
+        artifacts = ArtifactRecorder(context, page, artifact_settings, request.node.name)
+        artifacts.start()
         
         # Create context dictionary to share between steps
         test_context = {
             'page': page,
             'context': context,
-            'browser': browser
+            'browser': browser,
+            'auth_cache': auth_state_cache if auth_cache_key else None,
+            'auth_cache_key': auth_cache_key,
+            'auth_state': auth_state,
+            'artifacts': artifacts,
+            'screenshot': artifact_settings['screenshot']
         }
+        # Hooks cannot rely on item.funcargs, pytest-bdd requests this fixture dynamically
+        request.node.test_context = test_context
+        if BasePage.metrics:
+            BasePage.metrics.current_test = request.node.nodeid
         
         yield test_context
         
+        if blocker:
+            # Stored on the report so the controller sees it under pytest-xdist too
+            request.node.user_properties.append(("resource_blocking", blocker.stats()))
+        
     except Exception as e:
         print(f"Error creating browser context: {e}")
         raise
     finally:
-        # Cleanup with proper error handling
+        test_failed = not getattr(getattr(request.node, "rep_call", None), "passed", False)
         try:
-            if 'page' in locals() and page:
-                page.close()
+            if 'artifacts' in locals():
+                artifacts.stop_tracing(test_failed)
         except Exception:
             pass
+        
+        if context_pool and 'context' in locals():
+            # Failed tests never hand their context to the next test
+            discard = test_failed
+            try:
+                if blocker:
+                    blocker.detach(context)
+            except Exception:
+                discard = True
+            context_pool.release(context, discard=discard)
+        else:
+            # Cleanup with proper error handling
+            try:
+                if 'page' in locals() and page:
+                    page.close()
+            except Exception:
+                pass
+            try:
+                if 'context' in locals() and context:
+                    context.close()
+            except Exception:
+                pass
+        
+        # Videos are only complete once the page is closed
         try:
-            if 'context' in locals() and context:
-                context.close()
+            if 'artifacts' in locals():
+                artifacts.finalize_video(test_failed)
         except Exception:
             pass
 
 
+@pytest.fixture
+def page_metrics(request):
+    """Performance metrics collector for budget assertions, skips when collection is disabled"""
+    if BasePage.metrics is None:
+        pytest.skip("Page metrics collection is disabled")
+    return BasePage.metrics
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """Setup test environment before running tests"""
-    # Create necessary directories
-    os.makedirs("reports/screenshots", exist_ok=True)
-    os.makedirs("reports/videos", exist_ok=True)
+    # Create necessary directories, namespaced per xdist worker
+    artifact_dir("screenshots")
+    artifact_dir("videos")
     os.makedirs("reports/html", exist_ok=True)
     
     print("Test environment setup completed")
@@ -194,8 +549,93 @@ def test_metadata(request):
     request.node.test_duration = duration.total_seconds()
 
 
+def _configure_runtime_plugins(config, framework_config):
+    """Register the plugins that only matter when tests actually run"""
+    config.pluginmanager.register(
+        ArtifactWriter(framework_config.get_artifact_settings()['writer_threads']), "artifact_writer"
+    )
+    
+    metrics_settings = framework_config.get_page_metrics_settings()
+    metrics_enabled = metrics_settings['enabled'] or config.getoption("--page-metrics")
+    if metrics_enabled and not config.getoption("--no-page-metrics"):
+        BasePage.metrics = PageMetricsCollector(metrics_settings['budgets'], metrics_settings['cdp'])
+        config.pluginmanager.register(BasePage.metrics, "page_metrics")
+    
+    timing_settings = framework_config.get_step_timing_settings()
+    if timing_settings['enabled']:
+        tracer = StepTracer()
+        if timing_settings['page_actions'] or config.getoption("--page-action-spans"):
+            BasePage.tracer = tracer
+        config.pluginmanager.register(StepTimingPlugin(
+            tracer, timing_settings['top'], controller=not hasattr(config, "workerinput")
+        ), "step_timing")
+    
+    rerun_settings = framework_config.get_rerun_settings()
+    retries = config.getoption("--retries")
+    failure_budget = config.getoption("--failure-budget")
+    retries = rerun_settings['retries'] if retries is None else retries
+    failure_budget = rerun_settings['failure_budget'] if failure_budget is None else failure_budget
+    if retries > 0 or failure_budget > 0:
+        config.pluginmanager.register(RerunPlugin(
+            retries, failure_budget, controller=not hasattr(config, "workerinput")
+        ), "reruns")
+
+
 def pytest_configure(config):
-    """Configure pytest with custom markers"""
+    """Configure pytest with custom markers and the navigation wait strategy"""
+    BasePage.wait_mode = config.getoption("--wait-strategy")
+    
+    if config.getoption("--startup-profile") and not hasattr(config, "workerinput"):
+        # Started late when pytest.main() was called without the option on the command line
+        config.pluginmanager.register(_startup_profiler or StartupProfiler().start(), "startup_profile")
+    elif _startup_profiler:
+        _startup_profiler.stop()
+    
+    # Longest-first ordering runs everywhere so xdist workers collect identically,
+    # durations are only recorded once, by the controller
+    from utils.config_manager import config as framework_config
+    history_settings = framework_config.get_duration_history_settings()
+    if history_settings['enabled'] and not config.getoption("--no-duration-history"):
+        config.pluginmanager.register(DurationHistoryPlugin(
+            DurationHistory(history_settings['path'], history_settings['keep_runs']),
+            _browser_names(config)[0],
+            record=not hasattr(config, "workerinput"),
+            longest_first=history_settings['longest_first'],
+            drift_percentile=history_settings['drift_percentile'],
+            min_samples=history_settings['min_samples']
+        ), "duration_history")
+    
+    collection_settings = framework_config.get_collection_cache_settings()
+    if collection_settings['enabled'] and not config.getoption("--no-collection-cache"):
+        config.pluginmanager.register(BddCollectionPlugin(
+            collection_settings['path'] if collection_settings['feature_cache'] else None,
+            step_index=collection_settings['step_index'],
+            save=not hasattr(config, "workerinput")
+        ), "bdd_collection")
+    
+    impact_settings = framework_config.get_impact_settings()
+    if impact_settings['enabled'] or config.getoption("--changed-since"):
+        config.pluginmanager.register(ImpactPlugin(
+            ImpactIndex(impact_settings['path']),
+            str(config.rootpath),
+            changed_since=config.getoption("--changed-since"),
+            full_run_patterns=impact_settings['full_run_patterns'],
+            ignore_patterns=impact_settings['ignore_patterns'],
+            record=impact_settings['enabled'] and not config.option.collectonly,
+            controller=not hasattr(config, "workerinput")
+        ), "impact")
+    
+    if config.getoption("--suites"):
+        suites = SuiteOrchestratorPlugin(
+            parse_suites(config.getoption("--suites")), controller=not hasattr(config, "workerinput")
+        )
+        suites.restrict(config)
+        config.pluginmanager.register(suites, "suites")
+    
+    # Run-time only plugins are not needed to list tests or markers
+    if not config.option.collectonly:
+        _configure_runtime_plugins(config, framework_config)
+    
     config.addinivalue_line("markers", "auth: Authentication module tests")
     config.addinivalue_line("markers", "inventory: Inventory module tests")
     config.addinivalue_line("markers", "cart: Shopping cart module tests")
@@ -203,6 +643,151 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "TC_AUTH_01: Test case for login with valid credentials")
     config.addinivalue_line("markers", "inventory_view: View product inventory")
     config.addinivalue_line("markers", "add_to_cart: Add products to cart")
+    config.addinivalue_line("markers", "cart_seeded: Cart scenarios that seed session and cart state directly")
+    config.addinivalue_line("markers", "visual: Visual checks that load every asset (disables resource blocking)")
+    config.addinivalue_line("markers", "xdist_group: Keep tests on the same pytest-xdist worker")
+    config.addinivalue_line("markers", "performance: Page performance budget checks")
+    config.addinivalue_line("markers", "data_driven: Scenarios parametrized from the test data workbook")
+    config.addinivalue_line("markers", "test_data(sheet): Parametrize a scenario with the rows of a workbook sheet")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Default pytest-xdist to group scheduling so Background-sharing scenarios stay on one worker"""
+    # Several browsers run concurrently, one xdist worker each, unless -n was given
+    browser_names = _browser_names(config)
+    if len(browser_names) > 1 and config.pluginmanager.hasplugin("xdist") \
+            and getattr(config.option, "numprocesses", None) is None and not config.option.collectonly:
+        config.option.numprocesses = len(browser_names)
+    if getattr(config.option, "numprocesses", None) and getattr(config.option, "dist", "no") == "no":
+        config.option.dist = "loadgroup"
+    # Workers re-parse the command line, so a defaulted loadgroup reaches them through workerinput
+    if getattr(config, "workerinput", {}).get("loadgroup"):
+        config.option.loadgroup = True
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Pass the controller's scheduling mode to an xdist worker"""
+    node.workerinput["loadgroup"] = node.config.option.dist == "loadgroup"
+
+
+def _test_data_workbook():
+    """Get the cached test data workbook from the test_data settings"""
+    settings = config.get_test_data_settings()
+    return workbook_data(settings['workbook'], settings['cache_dir'])
+
+
+@pytest.fixture
+def data_row(request):
+    """Workbook row of a data-driven scenario, read from the cache only when the test runs"""
+    sheet = request.node.get_closest_marker("test_data").args[0]
+    return _test_data_workbook().sheet(sheet).row(request.param)
+
+
+def pytest_bdd_apply_tag(tag, function):
+    """Turn @data:<sheet> feature tags into a test_data marker that parametrizes the scenario"""
+    if not tag.startswith(DATA_TAG_PREFIX):
+        return None
+    pytest.mark.test_data(tag[len(DATA_TAG_PREFIX):])(function)
+    pytest.mark.usefixtures("data_row")(function)
+    return True
+
+
+def pytest_generate_tests(metafunc):
+    """Run every test once per browser when --test-browser names several, and once per data row"""
+    browser_names = _browser_names(metafunc.config)
+    if len(browser_names) > 1 and "browser_name" in metafunc.fixturenames:
+        metafunc.parametrize("browser_name", browser_names, indirect=True, scope="session")
+    
+    # Only row positions are collected; rows themselves are read by the data_row fixture
+    marker = metafunc.definition.get_closest_marker("test_data")
+    if marker and "data_row" in metafunc.fixturenames:
+        sheet = marker.args[0]
+        rows = len(_test_data_workbook().sheet(sheet))
+        ids = [f"{sheet}-{index + 1}" for index in range(rows)]
+        metafunc.parametrize("data_row", range(rows), indirect=True, ids=ids)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep each browser's tests on one xdist worker, or else a Background-sharing feature's"""
+    # Runs before xdist's own hook, which reads the xdist_group markers into @group node ids
+    browser_names = _browser_names(config)
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        item_browser = callspec.params.get("browser_name", browser_names[0]) if callspec else browser_names[0]
+        # The browser dimension of every report, including junit properties and the HTML table
+        item.user_properties.append(("browser", item_browser))
+        if len(browser_names) > 1:
+            # One engine per worker: browsers run side by side and no worker switches engines
+            item.add_marker(pytest.mark.xdist_group(name=item_browser))
+            continue
+        scenario = getattr(getattr(item, "function", None), "__scenario__", None)
+        if scenario is not None and getattr(scenario.feature, "background", None) is not None:
+            item.add_marker(pytest.mark.xdist_group(name=os.path.basename(scenario.feature.filename)))
+
+
+def _user_properties(terminalreporter, name):
+    """Collect a user property from every test's final (teardown) report, keyed by node id"""
+    values = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "teardown":
+                continue
+            for key, value in report.user_properties:
+                if key == name:
+                    values[report.nodeid] = value
+    return values
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report requests blocked and bytes saved per scenario"""
+    resource_blocking_stats = _user_properties(terminalreporter, "resource_blocking")
+    if not resource_blocking_stats:
+        return
+    
+    terminalreporter.write_sep("=", "resource blocking")
+    total_requests = 0
+    total_bytes = 0
+    for nodeid, stats in resource_blocking_stats.items():
+        total_requests += stats['blocked_requests']
+        total_bytes += stats['bytes_saved']
+        terminalreporter.write_line(
+            f"{stats['blocked_requests']:>5} blocked  {stats['bytes_saved'] / 1024:>9.1f} KiB saved  {nodeid}"
+        )
+    terminalreporter.write_line(f"{total_requests:>5} blocked  {total_bytes / 1024:>9.1f} KiB saved  TOTAL")
+    
+    os.makedirs("reports", exist_ok=True)
+    with open("reports/resource_blocking.json", "w") as file:
+        json.dump(resource_blocking_stats, file, indent=2)
+
+
+def pytest_bdd_before_step(request, feature, scenario, step, step_func):
+    """Open a trace chunk per step when the artifact policy keeps only the last N steps"""
+    test_context = getattr(request.node, "test_context", None)
+    if test_context:
+        test_context['artifacts'].start_step()
+
+
+def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func_args):
+    """Close the step's trace chunk"""
+    test_context = getattr(request.node, "test_context", None)
+    if test_context:
+        test_context['artifacts'].end_step(step.name)
+
+
+def pytest_bdd_step_error(request, feature, scenario, step, step_func, step_func_args, exception):
+    """Close the failing step's trace chunk so it is part of the kept trace"""
+    test_context = getattr(request.node, "test_context", None)
+    if test_context:
+        test_context['artifacts'].end_step(step.name)
+
+
+def pytest_sessionfinish(session):
+    """Keep artifact disk usage under the configured cap, pruning the oldest files first"""
+    if not hasattr(session.config, "workerinput"):
+        prune_artifacts(config.get_artifact_settings()['max_disk_mb'])
 
 
 def pytest_html_report_title(report):
@@ -210,13 +795,25 @@ def pytest_html_report_title(report):
     report.title = "ECommerce Portal - Test Automation Report"
 
 
-def pytest_html_results_summary(prefix, summary, postfix):
+def pytest_html_results_table_header(cells):
+    """Add a browser column to the HTML results table"""
+    cells.insert(2, "<th>Browser</th>")
+
+
+def pytest_html_results_table_row(report, cells):
+    """Fill the browser column from the report's browser property"""
+    browser_name = dict(report.user_properties).get("browser", "")
+    cells.insert(2, f"<td>{browser_name}</td>")
+
+
+def pytest_html_results_summary(prefix, summary, postfix, session):
     """Customize HTML report summary"""
+    browsers = ", ".join(name.capitalize() for name in _browser_names(session.config))
     prefix.extend([
         "<h2>Test Environment Information</h2>",
         "<table>",
         "<tr><td>Application URL</td><td>https://www.saucedemo.com/</td></tr>",
-        "<tr><td>Browser</td><td>Chromium</td></tr>",
+        f"<tr><td>Browser</td><td>{browsers}</td></tr>",
         "<tr><td>Test Framework</td><td>Pytest + Playwright + BDD</td></tr>",
         "</table>"
     ])
@@ -228,21 +825,34 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
     
+    # Expose the phase result to fixtures, e.g. so failed contexts are not reused
+    setattr(item, f"rep_{rep.when}", rep)
+    
     if rep.when == "call" and rep.failed:
         # Get the browser context from the test
-        if hasattr(item, 'funcargs') and 'browser_context' in item.funcargs:
+        context = getattr(item, "test_context", None)
+        if context is None and 'browser_context' in getattr(item, 'funcargs', {}):
             context = item.funcargs['browser_context']
+        if context and context.get('screenshot', "on-failure") != "off":
             page = context.get('page')
             if page:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                screenshot_name = f"failed_{item.name}_{timestamp}.png"
-                screenshot_path = f"reports/screenshots/{screenshot_name}"
-                page.screenshot(path=screenshot_path)
+                # The browser encodes the image, the file is written off the test thread
+                artifact_settings = config.get_artifact_settings()
+                image_format = artifact_settings['screenshot_format']
+                screenshot_options = {"type": image_format}
+                if image_format == "jpeg":
+                    screenshot_options["quality"] = artifact_settings['screenshot_quality']
+                screenshot_name = f"failed_{safe_filename(item.name)}_{unique_timestamp()}.{image_format}"
+                screenshot_path = os.path.join(artifact_dir("screenshots"), screenshot_name)
+                writer = item.config.pluginmanager.get_plugin("artifact_writer")
+                screenshot_path = writer.submit(page.screenshot(**screenshot_options), screenshot_path)
                 
-                # Add screenshot to HTML report
-                if hasattr(rep, 'extra'):
-                    try:
-                        from pytest_html import extras
-                        rep.extra.append(extras.image(screenshot_path))
-                    except ImportError:
-                        pass
+                # Link the screenshot from the HTML report instead of embedding it
+                try:
+                    from pytest_html import extras
+                    html_path = item.config.getoption("htmlpath", None)
+                    link = os.path.relpath(screenshot_path, os.path.dirname(os.path.abspath(html_path))) \
+                        if html_path else screenshot_path
+                    rep.extras = getattr(rep, "extras", []) + [extras.url(link.replace(os.sep, "/"), name="Screenshot")]
+                except ImportError:
+                    pass
@@ -62,25 +62,17 @@ def main():
     
     python_exe = r".\.venv\Scripts\python.exe"
     
+    # The tag selections overlap (@smoke covers @auth and @inventory), so they run as one
+    # deduplicated parallel session with a report per tag
     demo_commands = [
         {
-            "command": f'& "{python_exe}" tests/run_tests.py auth',
-            "description": "Running Authentication Tests (@auth tag)"
-        },
-        {
-            "command": f'& "{python_exe}" tests/run_tests.py tag:inventory',
-            "description": "Running Inventory Tests (@inventory tag)"
-        },
-        {
-            "command": f'& "{python_exe}" tests/run_tests.py smoke',
-            "description": "Running Smoke Tests (@smoke tag)"
-        },
-        {
-            "command": f'& "{python_exe}" -m pytest step_definitions/ --html=reports/html/complete_report.html --self-contained-html -v',
-            "description": "Running Complete Test Suite with HTML Report"
+            "command": f'& "{python_exe}" tests/run_tests.py suites:auth,inventory,smoke,all',
+            "description": "Running @auth, @inventory, @smoke and the Complete Suite, each scenario once"
         }
     ]
     
+    # The suites share one long-lived browser server instead of each launching a browser
+    os.environ["BROWSER_SERVER"] = "1"
     results = []
     
     for test_config in demo_commands:
@@ -93,6 +85,8 @@ def main():
         # Small delay between tests
         time.sleep(2)
     
+    run_command(f'& "{python_exe}" -m utils.browser_server stop', "Stopping the shared browser server")
+    
     # Summary
     print(f"\n{'='*80}")
     print("📊 DEMO RESULTS SUMMARY")
@@ -108,10 +102,11 @@ def main():
     print(f"📊 Success Rate: {(passed_tests/total_tests)*100:.1f}%")
     
     print(f"\n📁 Generated Reports:")
-    print(f"   • Authentication: reports/html/auth_report.html")
-    print(f"   • Inventory: reports/html/inventory_report_*.html")
-    print(f"   • Smoke Tests: reports/html/smoke_report.html")
-    print(f"   • Complete Suite: reports/html/complete_report.html")
+    print(f"   • Authentication: reports/junit/suites/auth.xml")
+    print(f"   • Inventory: reports/junit/suites/inventory.xml")
+    print(f"   • Smoke Tests: reports/junit/suites/smoke.xml")
+    print(f"   • Complete Suite: reports/junit/suites/all.xml, reports/html/suites_report.html")
+    print(f"   • Wall vs. summed test time: reports/suites/summary.json")
     
     print(f"\n🎯 Framework Features Demonstrated:")
     print(f"   ✅ Page Object Model (POM) Design Pattern")
@@ -0,0 +1,25 @@
+@cart
+Feature: Shopping Cart
+  As a user
+  I want my cart to keep the products I chose
+  So that I can check out later
+
+  @cart_seeded
+  Scenario: Seeded cart shows its items on the products page
+    Given user is logged in as "standard_user" with cart containing "sauce-labs-backpack, sauce-labs-bike-light"
+    When user opens the products page
+    Then cart should show 2 items
+
+  @cart_seeded
+  Scenario: Removing a seeded product updates the cart badge
+    Given user is logged in as "standard_user" with cart containing "sauce-labs-backpack, sauce-labs-onesie"
+    When user opens the products page
+    And user removes "sauce-labs-backpack" from cart
+    Then cart should show 1 items
+
+  @cart_seeded
+  Scenario: Adding several products at once updates the cart badge
+    Given user is logged in as "standard_user" with cart containing "sauce-labs-onesie"
+    When user opens the products page
+    And user adds "sauce-labs-backpack, sauce-labs-bike-light" to cart
+    Then cart should show 3 items
@@ -0,0 +1,18 @@
+@data_driven
+Feature: Data-Driven Scenarios
+  As a tester
+  I want to run scenarios for every row of the test data workbook
+  So that new credentials and product combinations need no new steps
+
+  @data:Credentials
+  Scenario: Login with workbook credentials
+    Given user is on Login Page
+    When user enters the workbook credentials
+    And click Login Button
+    Then verify page has text "Products"
+
+  @data:CartProducts
+  Scenario: Seeded workbook cart shows its item count
+    Given user is logged in with the workbook cart
+    When user opens the products page
+    Then cart should show the workbook item count
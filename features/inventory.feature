@@ -21,3 +21,10 @@ Feature: Product Inventory Management
     Given user is on products page
     When user adds "sauce-labs-backpack" to cart
     Then cart should show 1 item
+
+  @performance
+  Scenario: Products page meets its performance budget
+    Given user is on products page
+    When user reloads the products page
+    Then page "ProductsPage" largest contentful paint should be under 4000 ms
+    And page "ProductsPage" should meet its performance budget
@@ -0,0 +1 @@
+"""Async page objects for the playwright.async_api backend"""
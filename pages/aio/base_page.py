@@ -0,0 +1,90 @@
+"""Async Base Page class for the playwright.async_api backend"""
+import os
+from playwright.async_api import Page, expect
+from pages.base_page import BasePage
+from utils.artifacts import artifact_dir
+
+
+class AsyncBasePage(BasePage):
+    """Async counterpart of BasePage, every action is a coroutine
+
+    Locators, readiness conditions and wait_mode are inherited from the sync page
+    objects, so async pages only redefine how actions are awaited.
+    """
+    
+    def __init__(self, page: Page):
+        super().__init__(page)
+    
+    async def capture_metrics(self, label: str = None, started: float = None):
+        """Page metrics collection is only wired into the sync backend"""
+        return None
+    
+    async def navigate_to(self, url: str, ready_conditions: list = None):
+        """Navigate to a specific URL and wait until the page is ready"""
+        with self._span("navigate_to", url):
+            if self.wait_mode == "networkidle":
+                await self.page.goto(url)
+                await self.page.wait_for_load_state("networkidle")
+                return
+            await self.page.goto(url, wait_until="commit")
+            await self.wait_until_ready(ready_conditions)
+    
+    async def wait_until_ready(self, ready_conditions: list = None):
+        """Wait for every readiness condition of the page"""
+        for condition in ready_conditions or self.get_ready_conditions():
+            await condition.wait_async(self.page, self.timeout)
+    
+    async def click_element(self, selector: str):
+        """Click an element with wait"""
+        with self._span("click_element", selector):
+            await self.page.wait_for_selector(selector, timeout=self.timeout)
+            await self.page.click(selector)
+    
+    async def fill_text(self, selector: str, text: str):
+        """Fill text in an input field"""
+        with self._span("fill_text", selector):
+            await self.page.wait_for_selector(selector, timeout=self.timeout)
+            await self.page.fill(selector, text)
+    
+    async def get_text(self, selector: str) -> str:
+        """Get text from an element"""
+        await self.page.wait_for_selector(selector, timeout=self.timeout)
+        return await self.page.text_content(selector)
+    
+    async def is_element_visible(self, selector: str, timeout: int = 5000) -> bool:
+        """Check if element becomes visible within the timeout"""
+        try:
+            await self.page.wait_for_selector(selector, timeout=timeout)
+            return await self.page.is_visible(selector)
+        except:
+            return False
+    
+    async def is_element_present(self, selector: str) -> bool:
+        """Check if element is attached right now, without waiting"""
+        return await self.page.locator(selector).count() > 0
+    
+    async def is_element_visible_now(self, selector: str) -> bool:
+        """Check if element is visible right now, without waiting"""
+        return await self.page.is_visible(selector)
+    
+    async def assert_element_absent(self, selector: str, timeout: int = 2000):
+        """Assert element is hidden or detached, polling for at most the timeout"""
+        await expect(self.page.locator(selector)).to_be_hidden(timeout=timeout)
+    
+    async def wait_for_element(self, selector: str, timeout: int = None):
+        """Wait for element to be visible"""
+        wait_timeout = timeout or self.timeout
+        with self._span("wait_for_element", selector):
+            await self.page.wait_for_selector(selector, timeout=wait_timeout)
+    
+    async def verify_text_present(self, text: str):
+        """Verify text is present on the page"""
+        await expect(self.page.locator(f"text={text}")).to_be_visible()
+    
+    async def verify_element_text(self, selector: str, expected_text: str):
+        """Verify element contains expected text"""
+        await expect(self.page.locator(selector)).to_contain_text(expected_text)
+    
+    async def take_screenshot(self, filename: str):
+        """Take a screenshot"""
+        await self.page.screenshot(path=os.path.join(artifact_dir("screenshots"), filename))
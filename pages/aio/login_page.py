@@ -0,0 +1,60 @@
+"""Async Login Page Object Model"""
+from pages.aio.base_page import AsyncBasePage
+from pages.login_page import LoginPage
+from pages.wait_strategies import ElementState
+
+
+class AsyncLoginPage(AsyncBasePage, LoginPage):
+    """Async counterpart of LoginPage with the same locators and method surface"""
+    
+    async def navigate_to_login_page(self, base_url: str):
+        """Navigate to login page"""
+        await self.navigate_to(base_url)
+    
+    async def resume_session(self, base_url: str) -> bool:
+        """Open the products page directly using an existing session, return False if rejected"""
+        await self.navigate_to(
+            base_url.rstrip("/") + "/" + self.inventory_path,
+            [ElementState(f"{self.products_header}, {self.username_input}", "attached")]
+        )
+        return await self.is_element_present(self.products_header) and \
+               not await self.is_element_present(self.username_input)
+    
+    async def enter_username(self, username: str):
+        """Enter username in the username field"""
+        await self.fill_text(self.username_input, username)
+    
+    async def enter_password(self, password: str):
+        """Enter password in the password field"""
+        await self.fill_text(self.password_input, password)
+    
+    async def click_login_button(self):
+        """Click the login button"""
+        await self.click_element(self.login_button)
+    
+    async def login(self, username: str, password: str):
+        """Complete login flow with username and password"""
+        await self.enter_username(username)
+        await self.enter_password(password)
+        await self.click_login_button()
+    
+    async def get_error_message(self) -> str:
+        """Get error message text if present, without waiting for it to appear"""
+        if await self.is_element_visible_now(self.error_message):
+            return await self.page.text_content(self.error_message)
+        return ""
+    
+    async def verify_login_successful(self):
+        """Verify login was successful by checking products page"""
+        await self.verify_text_present("Products")
+    
+    async def verify_products_text(self):
+        """Verify Products text is displayed"""
+        await self.verify_element_text(self.products_header, "Products")
+    
+    async def is_login_page_loaded(self) -> bool:
+        """Check if login page is loaded"""
+        if not await self.is_element_visible(self.username_input):
+            return False
+        return await self.is_element_visible_now(self.password_input) and \
+               await self.is_element_visible_now(self.login_button)
@@ -0,0 +1,73 @@
+"""Async Products Page Object Model"""
+from pages.aio.base_page import AsyncBasePage
+from pages.products_page import (
+    BADGE_COUNT_SCRIPT, CART_BATCH_SCRIPT, CATALOG_SCRIPT, ProductSnapshot, ProductsPage
+)
+
+
+class AsyncProductsPage(AsyncBasePage, ProductsPage):
+    """Async counterpart of ProductsPage with the same locators and method surface"""
+    
+    async def navigate_to_products_page(self, base_url: str):
+        """Open the products page directly, requires an authenticated session"""
+        await self.navigate_to(base_url.rstrip("/") + "/" + self.inventory_path)
+    
+    async def verify_products_page_loaded(self):
+        """Verify products page is loaded"""
+        await self.wait_for_element(self.products_header)
+        await self.verify_element_text(self.products_header, "Products")
+    
+    async def get_products_count(self) -> int:
+        """Get count of products displayed"""
+        return await self.page.locator(self.product_items).count()
+    
+    async def add_product_to_cart(self, product_name: str):
+        """Add a specific product to cart by name"""
+        await self.click_element(self.add_to_cart_selector(product_name))
+    
+    async def get_catalog(self) -> tuple:
+        """Snapshot every displayed product in one round-trip, as a tuple of ProductSnapshot"""
+        with self._span("get_catalog", self.product_items):
+            rows = await self.page.locator(self.product_items).evaluate_all(CATALOG_SCRIPT)
+        return tuple(ProductSnapshot(*row) for row in rows)
+    
+    async def _click_cart_buttons(self, selectors: list, step: int, action: str):
+        """Click a batch of cart buttons in one round-trip and verify the badge count once"""
+        with self._span(action, ", ".join(selectors)):
+            before, missing = await self.page.evaluate(CART_BATCH_SCRIPT, [selectors, self.shopping_cart_badge])
+            assert not missing, f"No cart button found for {', '.join(missing)}"
+            expected = before + step * len(selectors)
+            await self.page.wait_for_function(
+                BADGE_COUNT_SCRIPT, arg=[self.shopping_cart_badge, expected], timeout=self.timeout
+            )
+    
+    async def add_products_to_cart(self, product_names: list):
+        """Add several products to cart in one batch"""
+        selectors = [self.add_to_cart_selector(name) for name in product_names]
+        await self._click_cart_buttons(selectors, 1, "add_products_to_cart")
+    
+    async def remove_products_from_cart(self, product_names: list):
+        """Remove several products from cart in one batch"""
+        selectors = [self.remove_from_cart_selector(name) for name in product_names]
+        await self._click_cart_buttons(selectors, -1, "remove_products_from_cart")
+    
+    async def remove_product_from_cart(self, product_name: str):
+        """Remove a specific product from cart by name"""
+        await self.remove_products_from_cart([product_name])
+    
+    async def get_cart_items_count(self) -> int:
+        """Get number of items in cart, an empty cart has no badge at all"""
+        if not await self.is_element_present(self.shopping_cart_badge):
+            return 0
+        badge_text = await self.page.text_content(self.shopping_cart_badge) or ""
+        return int(badge_text) if badge_text.isdigit() else 0
+    
+    async def go_to_cart(self):
+        """Navigate to shopping cart"""
+        await self.click_element(self.shopping_cart_link)
+    
+    async def logout(self):
+        """Logout from the application"""
+        await self.click_element(self.menu_button)
+        await self.wait_for_element(self.logout_link)
+        await self.click_element(self.logout_link)
@@ -1,56 +1,121 @@
 """Base Page class for Page Object Model"""
-from playwright.sync_api import Page, expect
+import os
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING
 from abc import ABC, abstractmethod
+from pages.wait_strategies import LoadState
+from utils.artifacts import artifact_dir
+
+# Playwright is imported lazily so collection-only runs never load it
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 
 class BasePage(ABC):
     """Base page class that all page objects should inherit from"""
     
-    def __init__(self, page: Page):
+    # "ready" waits only on the page's readiness conditions, "networkidle" keeps the legacy wait
+    wait_mode = "ready"
+    
+    # Optional utils.step_timing.StepTracer that records nested spans for page actions
+    tracer = None
+    
+    # Optional utils.page_metrics.PageMetricsCollector fed by navigations and key actions
+    metrics = None
+    
+    def __init__(self, page: "Page"):
         self.page = page
         self.timeout = 30000  # 30 seconds default timeout
     
-    def navigate_to(self, url: str):
-        """Navigate to a specific URL"""
-        self.page.goto(url)
-        self.page.wait_for_load_state("networkidle")
+    def get_ready_conditions(self) -> list:
+        """Conditions that mark this page as ready after navigation, override per page"""
+        return [LoadState("domcontentloaded")]
+    
+    def _span(self, action: str, target: str):
+        """Time a page action as a nested span when a tracer is installed"""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(action, "page_action", {"target": target, "page": type(self).__name__})
+    
+    def capture_metrics(self, label: str = None, started: float = None):
+        """Record browser performance metrics when a collector is installed"""
+        if self.metrics is None:
+            return None
+        action_ms = (time.perf_counter() - started) * 1000 if started is not None else None
+        return self.metrics.capture(self.page, label or type(self).__name__, action_ms)
+    
+    def navigate_to(self, url: str, ready_conditions: list = None):
+        """Navigate to a specific URL and wait until the page is ready"""
+        started = time.perf_counter()
+        with self._span("navigate_to", url):
+            if self.wait_mode == "networkidle":
+                self.page.goto(url)
+                self.page.wait_for_load_state("networkidle")
+            else:
+                self.page.goto(url, wait_until="commit")
+                self.wait_until_ready(ready_conditions)
+        self.capture_metrics(started=started)
+    
+    def wait_until_ready(self, ready_conditions: list = None):
+        """Wait for every readiness condition of the page"""
+        for condition in ready_conditions or self.get_ready_conditions():
+            condition.wait(self.page, self.timeout)
     
     def click_element(self, selector: str):
         """Click an element with wait"""
-        self.page.wait_for_selector(selector, timeout=self.timeout)
-        self.page.click(selector)
+        with self._span("click_element", selector):
+            self.page.wait_for_selector(selector, timeout=self.timeout)
+            self.page.click(selector)
     
     def fill_text(self, selector: str, text: str):
         """Fill text in an input field"""
-        self.page.wait_for_selector(selector, timeout=self.timeout)
-        self.page.fill(selector, text)
+        with self._span("fill_text", selector):
+            self.page.wait_for_selector(selector, timeout=self.timeout)
+            self.page.fill(selector, text)
     
     def get_text(self, selector: str) -> str:
         """Get text from an element"""
         self.page.wait_for_selector(selector, timeout=self.timeout)
         return self.page.text_content(selector)
     
-    def is_element_visible(self, selector: str) -> bool:
-        """Check if element is visible"""
+    def is_element_visible(self, selector: str, timeout: int = 5000) -> bool:
+        """Check if element becomes visible within the timeout"""
         try:
-            self.page.wait_for_selector(selector, timeout=5000)
+            self.page.wait_for_selector(selector, timeout=timeout)
             return self.page.is_visible(selector)
         except:
             return False
     
+    def is_element_present(self, selector: str) -> bool:
+        """Check if element is attached right now, without waiting"""
+        return self.page.locator(selector).count() > 0
+    
+    def is_element_visible_now(self, selector: str) -> bool:
+        """Check if element is visible right now, without waiting"""
+        return self.page.is_visible(selector)
+    
+    def assert_element_absent(self, selector: str, timeout: int = 2000):
+        """Assert element is hidden or detached, polling for at most the timeout"""
+        from playwright.sync_api import expect
+        expect(self.page.locator(selector)).to_be_hidden(timeout=timeout)
+    
     def wait_for_element(self, selector: str, timeout: int = None):
         """Wait for element to be visible"""
         wait_timeout = timeout or self.timeout
-        self.page.wait_for_selector(selector, timeout=wait_timeout)
+        with self._span("wait_for_element", selector):
+            self.page.wait_for_selector(selector, timeout=wait_timeout)
     
     def verify_text_present(self, text: str):
         """Verify text is present on the page"""
+        from playwright.sync_api import expect
         expect(self.page.locator(f"text={text}")).to_be_visible()
     
     def verify_element_text(self, selector: str, expected_text: str):
         """Verify element contains expected text"""
+        from playwright.sync_api import expect
         expect(self.page.locator(selector)).to_contain_text(expected_text)
     
     def take_screenshot(self, filename: str):
         """Take a screenshot"""
-        self.page.screenshot(path=f"reports/screenshots/{filename}")
+        self.page.screenshot(path=os.path.join(artifact_dir("screenshots"), filename))
@@ -1,12 +1,17 @@
 """Login Page Object Model"""
-from playwright.sync_api import Page
+import time
+from typing import TYPE_CHECKING
 from pages.base_page import BasePage
+from pages.wait_strategies import ElementState
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 
 class LoginPage(BasePage):
     """Login page object following Page Object Model pattern"""
     
-    def __init__(self, page: Page):
+    def __init__(self, page: "Page"):
         super().__init__(page)
         
         # Locators
@@ -15,11 +20,26 @@ class LoginPage(BasePage):
         self.login_button = "[data-test='login-button']"
         self.error_message = "[data-test='error']"
         self.products_header = ".title"
+        self.inventory_path = "inventory.html"
+    
+    def get_ready_conditions(self) -> list:
+        """Login page is ready once the username input is attached"""
+        return [ElementState(self.username_input, "attached")]
     
     def navigate_to_login_page(self, base_url: str):
         """Navigate to login page"""
         self.navigate_to(base_url)
     
+    def resume_session(self, base_url: str) -> bool:
+        """Open the products page directly using an existing session, return False if rejected"""
+        # The site answers with either the products page or a redirect back to the login form
+        self.navigate_to(
+            base_url.rstrip("/") + "/" + self.inventory_path,
+            [ElementState(f"{self.products_header}, {self.username_input}", "attached")]
+        )
+        return self.is_element_present(self.products_header) and \
+               not self.is_element_present(self.username_input)
+    
     def enter_username(self, username: str):
         """Enter username in the username field"""
         self.fill_text(self.username_input, username)
@@ -30,7 +50,12 @@ class LoginPage(BasePage):
     
     def click_login_button(self):
         """Click the login button"""
+        started = time.perf_counter()
         self.click_element(self.login_button)
+        if self.metrics is not None:
+            # Measure the resulting page, either the products page or the error on the form
+            ElementState(f"{self.products_header}, {self.error_message}", "attached").wait(self.page, self.timeout)
+            self.capture_metrics("LoginPage.click_login_button", started)
     
     def login(self, username: str, password: str):
         """Complete login flow with username and password"""
@@ -39,9 +64,9 @@ class LoginPage(BasePage):
         self.click_login_button()
     
     def get_error_message(self) -> str:
-        """Get error message text if present"""
-        if self.is_element_visible(self.error_message):
-            return self.get_text(self.error_message)
+        """Get error message text if present, without waiting for it to appear"""
+        if self.is_element_visible_now(self.error_message):
+            return self.page.text_content(self.error_message)
         return ""
     
     def verify_login_successful(self):
@@ -54,6 +79,8 @@ class LoginPage(BasePage):
     
     def is_login_page_loaded(self) -> bool:
         """Check if login page is loaded"""
-        return self.is_element_visible(self.username_input) and \
-               self.is_element_visible(self.password_input) and \
-               self.is_element_visible(self.login_button)
+        # The form renders as a whole, so one wait followed by instant probes is enough
+        if not self.is_element_visible(self.username_input):
+            return False
+        return self.is_element_visible_now(self.password_input) and \
+               self.is_element_visible_now(self.login_button)
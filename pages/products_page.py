@@ -1,12 +1,57 @@
 """Products Page Object Model"""
-from playwright.sync_api import Page
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 from pages.base_page import BasePage
+from pages.wait_strategies import ElementState
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+
+@dataclass(frozen=True)
+class ProductSnapshot:
+    """One inventory item as read in a catalog snapshot"""
+    name: str
+    slug: str
+    price: float
+    description: str
+    in_cart: bool
+
+
+# Reads every inventory item in one evaluation: [name, slug, price, description, in cart]
+CATALOG_SCRIPT = """items => items.map(item => {
+    const text = selector => (item.querySelector(selector)?.textContent || '').trim();
+    const button = item.querySelector('button');
+    const test = button ? button.dataset.test || '' : '';
+    const slug = test.replace(/^(add-to-cart|remove)-/, '');
+    const price = parseFloat(text('.inventory_item_price').replace(/[^0-9.]/g, ''));
+    return [text('.inventory_item_name'), slug, isNaN(price) ? 0 : price, text('.inventory_item_desc'),
+            test.startsWith('remove-')];
+})"""
+
+# Clicks a batch of cart buttons in one evaluation, returning the badge count before and
+# the selectors that matched no button
+CART_BATCH_SCRIPT = """([selectors, badge]) => {
+    const before = parseInt(document.querySelector(badge)?.textContent || '0', 10) || 0;
+    const missing = [];
+    for (const selector of selectors) {
+        const button = document.querySelector(selector);
+        if (button) { button.click(); } else { missing.push(selector); }
+    }
+    return [before, missing];
+}"""
+
+# Resolves once the cart badge shows the expected count, an empty cart has no badge
+BADGE_COUNT_SCRIPT = """([badge, expected]) => {
+    const text = document.querySelector(badge)?.textContent || '0';
+    return (parseInt(text, 10) || 0) === expected;
+}"""
 
 
 class ProductsPage(BasePage):
     """Products page object following Page Object Model pattern"""
     
-    def __init__(self, page: Page):
+    def __init__(self, page: "Page"):
         super().__init__(page)
         
         # Locators
@@ -18,6 +63,15 @@ class ProductsPage(BasePage):
         self.shopping_cart_link = ".shopping_cart_link"
         self.menu_button = "#react-burger-menu-btn"
         self.logout_link = "#logout_sidebar_link"
+        self.inventory_path = "inventory.html"
+    
+    def get_ready_conditions(self) -> list:
+        """Products page is ready once inventory items are present"""
+        return [ElementState(self.product_items, "attached")]
+    
+    def navigate_to_products_page(self, base_url: str):
+        """Open the products page directly, requires an authenticated session"""
+        self.navigate_to(base_url.rstrip("/") + "/" + self.inventory_path)
     
     def verify_products_page_loaded(self):
         """Verify products page is loaded"""
@@ -26,19 +80,56 @@ class ProductsPage(BasePage):
     
     def get_products_count(self) -> int:
         """Get count of products displayed"""
-        return len(self.page.locator(self.product_items).all())
+        return self.page.locator(self.product_items).count()
+    
+    def get_catalog(self) -> tuple:
+        """Snapshot every displayed product in one round-trip, as a tuple of ProductSnapshot"""
+        with self._span("get_catalog", self.product_items):
+            rows = self.page.locator(self.product_items).evaluate_all(CATALOG_SCRIPT)
+        return tuple(ProductSnapshot(*row) for row in rows)
+    
+    def add_to_cart_selector(self, product_name: str) -> str:
+        """Get the add-to-cart button selector for a product name"""
+        return f"[data-test='add-to-cart-{product_name.lower().replace(' ', '-')}']"
     
     def add_product_to_cart(self, product_name: str):
         """Add a specific product to cart by name"""
-        product_selector = f"[data-test='add-to-cart-{product_name.lower().replace(' ', '-')}']"
-        self.click_element(product_selector)
+        self.click_element(self.add_to_cart_selector(product_name))
+    
+    def remove_from_cart_selector(self, product_name: str) -> str:
+        """Get the remove button selector for a product name"""
+        return f"[data-test='remove-{product_name.lower().replace(' ', '-')}']"
+    
+    def remove_product_from_cart(self, product_name: str):
+        """Remove a specific product from cart by name"""
+        self.click_element(self.remove_from_cart_selector(product_name))
+    
+    def _click_cart_buttons(self, selectors: list, step: int, action: str):
+        """Click a batch of cart buttons in one round-trip and verify the badge count once"""
+        with self._span(action, ", ".join(selectors)):
+            before, missing = self.page.evaluate(CART_BATCH_SCRIPT, [selectors, self.shopping_cart_badge])
+            assert not missing, f"No cart button found for {', '.join(missing)}"
+            expected = before + step * len(selectors)
+            self.page.wait_for_function(
+                BADGE_COUNT_SCRIPT, arg=[self.shopping_cart_badge, expected], timeout=self.timeout
+            )
+    
+    def add_products_to_cart(self, product_names: list):
+        """Add several products to cart in one batch"""
+        selectors = [self.add_to_cart_selector(name) for name in product_names]
+        self._click_cart_buttons(selectors, 1, "add_products_to_cart")
+    
+    def remove_products_from_cart(self, product_names: list):
+        """Remove several products from cart in one batch"""
+        selectors = [self.remove_from_cart_selector(name) for name in product_names]
+        self._click_cart_buttons(selectors, -1, "remove_products_from_cart")
     
     def get_cart_items_count(self) -> int:
-        """Get number of items in cart"""
-        if self.is_element_visible(self.shopping_cart_badge):
-            badge_text = self.get_text(self.shopping_cart_badge)
-            return int(badge_text) if badge_text.isdigit() else 0
-        return 0
+        """Get number of items in cart, an empty cart has no badge at all"""
+        if not self.is_element_present(self.shopping_cart_badge):
+            return 0
+        badge_text = self.page.text_content(self.shopping_cart_badge) or ""
+        return int(badge_text) if badge_text.isdigit() else 0
     
     def go_to_cart(self):
         """Navigate to shopping cart"""
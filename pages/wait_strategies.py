@@ -0,0 +1,69 @@
+"""Readiness conditions that page objects declare for navigation waits"""
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+
+class WaitStrategy(ABC):
+    """Base class for a condition that marks a page as ready"""
+
+    @abstractmethod
+    def wait(self, page: "Page", timeout: int):
+        """Block until the condition holds or the timeout expires"""
+        pass
+
+    @abstractmethod
+    async def wait_async(self, page, timeout: int):
+        """Same as wait() for a playwright.async_api page"""
+        pass
+
+
+class LoadState(WaitStrategy):
+    """Ready when the document reaches a load state (domcontentloaded, load, networkidle)"""
+
+    def __init__(self, state: str = "domcontentloaded"):
+        self.state = state
+
+    def wait(self, page: "Page", timeout: int):
+        page.wait_for_load_state(self.state, timeout=timeout)
+
+    async def wait_async(self, page, timeout: int):
+        await page.wait_for_load_state(self.state, timeout=timeout)
+
+    def __repr__(self):
+        return f"LoadState({self.state!r})"
+
+
+class ElementState(WaitStrategy):
+    """Ready when an element reaches a state (attached, visible, hidden, detached)"""
+
+    def __init__(self, selector: str, state: str = "attached"):
+        self.selector = selector
+        self.state = state
+
+    def wait(self, page: "Page", timeout: int):
+        page.wait_for_selector(self.selector, state=self.state, timeout=timeout)
+
+    async def wait_async(self, page, timeout: int):
+        await page.wait_for_selector(self.selector, state=self.state, timeout=timeout)
+
+    def __repr__(self):
+        return f"ElementState({self.selector!r}, {self.state!r})"
+
+
+class UrlMatches(WaitStrategy):
+    """Ready when the page URL matches a glob, regex or predicate"""
+
+    def __init__(self, url):
+        self.url = url
+
+    def wait(self, page: "Page", timeout: int):
+        page.wait_for_url(self.url, wait_until="commit", timeout=timeout)
+
+    async def wait_async(self, page, timeout: int):
+        await page.wait_for_url(self.url, wait_until="commit", timeout=timeout)
+
+    def __repr__(self):
+        return f"UrlMatches({self.url!r})"
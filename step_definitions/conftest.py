@@ -0,0 +1,79 @@
+"""Shared step definitions used by several feature files
+
+pytest-bdd registers steps as fixtures, so steps defined here are visible to every
+step_definitions module. Define a step once, here, when more than one feature uses it.
+"""
+from pytest_bdd import given, when, then
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from utils.config_manager import config
+
+
+# Authentication steps
+@given('user is on Login Page')
+def user_is_on_login_page(browser_context):
+    """Navigate to login page"""
+    page = browser_context['page']
+    login_page = LoginPage(page)
+    base_url = config.get_login_page_url()
+    browser_context['login_page'] = login_page
+    
+    # Skip the UI login when the context was created from a cached login state
+    if browser_context.get('auth_state'):
+        if login_page.resume_session(base_url):
+            browser_context['authenticated'] = True
+            return
+        # Cached state was rejected by the site, fall back to the real UI login
+        browser_context['auth_cache'].invalidate(*browser_context['auth_cache_key'])
+        browser_context['context'].clear_cookies()
+    
+    login_page.navigate_to_login_page(base_url)
+    assert login_page.is_login_page_loaded(), "Login page is not loaded properly"
+
+
+@when('user enters user name as "standard_user" and password as "secret_sauce"')
+def user_enters_credentials_standard_user(browser_context):
+    """Enter standard user credentials"""
+    browser_context['login_user'] = "standard_user"
+    if browser_context.get('authenticated'):
+        return
+    
+    login_page = browser_context['login_page']
+    login_page.enter_username("standard_user")
+    login_page.enter_password("secret_sauce")
+
+
+@when('click Login Button')
+def click_login_button(browser_context):
+    """Click the login button"""
+    if not browser_context.get('authenticated'):
+        login_page = browser_context['login_page']
+        login_page.click_login_button()
+    
+    # Initialize products page for next steps
+    page = browser_context['page']
+    products_page = ProductsPage(page)
+    browser_context['products_page'] = products_page
+
+
+@then('verify page has text "Products"')
+def verify_page_has_text_products(browser_context):
+    """Verify page contains Products text"""
+    products_page = browser_context['products_page']
+    products_page.verify_products_page_loaded()
+    
+    # Cache the login state so later scenarios can skip the UI login
+    auth_cache = browser_context.get('auth_cache')
+    auth_cache_key = browser_context.get('auth_cache_key')
+    if auth_cache and not browser_context.get('authenticated') \
+            and browser_context.get('login_user') == auth_cache_key[0]:
+        auth_cache.save(browser_context['context'], *auth_cache_key)
+
+
+@when('user opens the products page')
+def user_opens_products_page(browser_context):
+    """Open the products page directly with the seeded session"""
+    products_page = ProductsPage(browser_context['page'])
+    products_page.navigate_to_products_page(config.get_login_page_url())
+    products_page.verify_products_page_loaded()
+    browser_context['products_page'] = products_page
@@ -0,0 +1,39 @@
+"""Step definitions for cart features"""
+from pytest_bdd import given, when, then, scenarios, parsers
+from utils.config_manager import config
+from utils.state_seeder import StateSeeder
+
+# Load scenarios from feature files
+scenarios('../features/cart.feature')
+
+
+@given(parsers.parse('user is logged in as "{user}" with cart containing "{products}"'))
+def user_is_logged_in_with_cart(browser_context, user, products):
+    """Seed the session cookie and cart contents instead of logging in and clicking add to cart"""
+    cart = [product.strip() for product in products.split(",") if product.strip()]
+    seeder = StateSeeder(config.get_login_page_url())
+    seeder.seed(browser_context['context'], browser_context['page'], user=user, cart=cart)
+    browser_context['login_user'] = user
+    browser_context['seeded_cart'] = cart
+
+
+@when(parsers.parse('user adds "{products}" to cart'))
+def user_adds_products_to_cart(browser_context, products):
+    """Add a comma-separated list of products to cart in one batch"""
+    products_page = browser_context['products_page']
+    products_page.add_products_to_cart([product.strip() for product in products.split(",") if product.strip()])
+
+
+@when(parsers.parse('user removes "{product}" from cart'))
+def user_removes_product_from_cart(browser_context, product):
+    """Remove a product from the cart on the products page"""
+    products_page = browser_context['products_page']
+    products_page.remove_product_from_cart(product)
+
+
+@then(parsers.parse('cart should show {count:d} items'))
+def cart_should_show_count_items(browser_context, count):
+    """Verify cart shows expected number of items"""
+    products_page = browser_context['products_page']
+    cart_count = products_page.get_cart_items_count()
+    assert cart_count == count, f"Expected {count} items in cart, but found {cart_count}"
@@ -0,0 +1,34 @@
+"""Step definitions for scenarios parametrized from TestData/TestCaseDocument.xlsx"""
+from pytest_bdd import given, when, then, scenarios
+from utils.config_manager import config
+from utils.state_seeder import StateSeeder
+
+# Load scenarios from feature files; @data:<sheet> runs a scenario once per sheet row
+scenarios('../features/data_driven.feature')
+
+
+@when('user enters the workbook credentials')
+def user_enters_workbook_credentials(browser_context, data_row):
+    """Enter the username and password of the current Credentials row"""
+    browser_context['login_user'] = data_row['Username']
+    login_page = browser_context['login_page']
+    login_page.enter_username(data_row['Username'])
+    login_page.enter_password(data_row['Password'])
+
+
+@given('user is logged in with the workbook cart')
+def user_is_logged_in_with_workbook_cart(browser_context, data_row):
+    """Seed the session and the products of the current CartProducts row"""
+    cart = [product.strip() for product in data_row['Products'].split(",") if product.strip()]
+    seeder = StateSeeder(config.get_login_page_url())
+    seeder.seed(browser_context['context'], browser_context['page'], user="standard_user", cart=cart)
+    browser_context['login_user'] = "standard_user"
+    browser_context['seeded_cart'] = cart
+
+
+@then('cart should show the workbook item count')
+def cart_should_show_workbook_count(browser_context, data_row):
+    """Verify the cart badge matches the Count column of the current row"""
+    products_page = browser_context['products_page']
+    cart_count = products_page.get_cart_items_count()
+    assert cart_count == int(data_row['Count']), f"Expected {data_row['Count']} items in cart, but found {cart_count}"
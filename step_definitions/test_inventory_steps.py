@@ -1,53 +1,14 @@
 """Step definitions for inventory features"""
 import pytest
-from pytest_bdd import given, when, then, scenarios
-from pages.login_page import LoginPage
+from pytest_bdd import given, when, then, scenarios, parsers
 from pages.products_page import ProductsPage
 from utils.config_manager import config
+from utils.page_metrics import budget_value
 
-# Load scenarios from feature files
+# Load scenarios from feature files, the login steps live in step_definitions/conftest.py
 scenarios('../features/inventory.feature')
 
 
-# Shared authentication steps
-@given('user is on Login Page')
-def user_is_on_login_page(browser_context):
-    """Navigate to login page"""
-    page = browser_context['page']
-    login_page = LoginPage(page)
-    base_url = config.get_login_page_url()
-    login_page.navigate_to_login_page(base_url)
-    assert login_page.is_login_page_loaded(), "Login page is not loaded properly"
-    browser_context['login_page'] = login_page
-
-
-@when('user enters user name as "standard_user" and password as "secret_sauce"')
-def user_enters_credentials_standard_user(browser_context):
-    """Enter standard user credentials"""
-    login_page = browser_context['login_page']
-    login_page.enter_username("standard_user")
-    login_page.enter_password("secret_sauce")
-
-
-@when('click Login Button')
-def click_login_button(browser_context):
-    """Click the login button"""
-    login_page = browser_context['login_page']
-    login_page.click_login_button()
-    
-    # Initialize products page for next steps
-    page = browser_context['page']
-    products_page = ProductsPage(page)
-    browser_context['products_page'] = products_page
-
-
-@then('verify page has text "Products"')
-def verify_page_has_text_products(browser_context):
-    """Verify page contains Products text"""
-    products_page = browser_context['products_page']
-    products_page.verify_products_page_loaded()
-
-
 # Inventory specific steps
 @given('user is on products page')
 def user_is_on_products_page(browser_context):
@@ -65,8 +26,9 @@ def user_is_on_products_page(browser_context):
 def user_views_product_list(browser_context):
     """User views the product list"""
     products_page = browser_context['products_page']
-    products_count = products_page.get_products_count()
-    browser_context['products_count'] = products_count
+    catalog = products_page.get_catalog()
+    browser_context['catalog'] = catalog
+    browser_context['products_count'] = len(catalog)
 
 
 @then('user should see multiple products available')
@@ -74,6 +36,8 @@ def user_should_see_multiple_products(browser_context):
     """Verify multiple products are available"""
     products_count = browser_context.get('products_count', 0)
     assert products_count > 1, f"Expected multiple products, but found {products_count}"
+    incomplete = [product.slug for product in browser_context['catalog'] if not product.name or product.price <= 0]
+    assert not incomplete, f"Products without a name or price: {', '.join(incomplete)}"
 
 
 @when('user adds "sauce-labs-backpack" to cart')
@@ -89,3 +53,22 @@ def cart_should_show_items(browser_context):
     products_page = browser_context['products_page']
     cart_count = products_page.get_cart_items_count()
     assert cart_count == 1, f"Expected 1 item in cart, but found {cart_count}"
+
+
+@when('user reloads the products page')
+def user_reloads_products_page(browser_context):
+    """Open the products page with a full navigation so page metrics are captured"""
+    products_page = browser_context['products_page']
+    products_page.navigate_to_products_page(config.get_login_page_url())
+
+
+@then(parsers.parse('page "{label}" {metric} should be under {budget:g} {unit}'))
+def page_metric_should_be_under_budget(browser_context, page_metrics, request, label, metric, budget, unit):
+    """Verify a captured page metric stays within its budget, given in ms, s, bytes, kb or mb"""
+    page_metrics.check_budget(label, metric, budget_value(metric, budget, unit), request.node.nodeid)
+
+
+@then(parsers.parse('page "{label}" should meet its performance budget'))
+def page_should_meet_configured_budget(browser_context, page_metrics, request, label):
+    """Verify every budget configured for the page in config.yaml"""
+    page_metrics.check_configured_budgets(label, request.node.nodeid)
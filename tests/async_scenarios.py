@@ -0,0 +1,64 @@
+"""Feature scenarios expressed as coroutines for the async Playwright backend"""
+from pages.aio.login_page import AsyncLoginPage
+from pages.aio.products_page import AsyncProductsPage
+from utils.config_manager import config
+
+
+async def _login_as_standard_user(page):
+    """Background: log in with the standard user and land on the products page"""
+    login_page = AsyncLoginPage(page)
+    await login_page.navigate_to_login_page(config.get_login_page_url())
+    assert await login_page.is_login_page_loaded(), "Login page is not loaded properly"
+    await login_page.login("standard_user", "secret_sauce")
+    products_page = AsyncProductsPage(page)
+    await products_page.verify_products_page_loaded()
+    return products_page
+
+
+async def login_with_valid_credentials(page):
+    """TC_AUTH_01 - Login with Valid credentials"""
+    await _login_as_standard_user(page)
+
+
+async def view_product_inventory(page):
+    """View product inventory"""
+    products_page = await _login_as_standard_user(page)
+    products_count = await products_page.get_products_count()
+    assert products_count > 1, f"Expected multiple products, but found {products_count}"
+
+
+async def add_product_to_cart(page):
+    """Add product to cart"""
+    products_page = await _login_as_standard_user(page)
+    await products_page.add_product_to_cart("sauce-labs-backpack")
+    cart_count = await products_page.get_cart_items_count()
+    assert cart_count == 1, f"Expected 1 item in cart, but found {cart_count}"
+
+
+async def remove_product_from_cart(page):
+    """Removing a product updates the cart badge"""
+    products_page = await _login_as_standard_user(page)
+    await products_page.add_products_to_cart(["sauce-labs-backpack", "sauce-labs-onesie"])
+    await products_page.remove_product_from_cart("sauce-labs-backpack")
+    cart_count = await products_page.get_cart_items_count()
+    assert cart_count == 1, f"Expected 1 item in cart, but found {cart_count}"
+
+
+async def shopping_journey(page, base_url, timer):
+    """Load journey: log in, add a product to the cart and open the cart, timing each action"""
+    login_page = AsyncLoginPage(page)
+    products_page = AsyncProductsPage(page)
+    await timer("navigate_to_login_page", login_page.navigate_to_login_page(base_url))
+    await timer("login", login_page.login("standard_user", "secret_sauce"))
+    await timer("verify_products_page_loaded", products_page.verify_products_page_loaded())
+    await timer("add_product_to_cart", products_page.add_product_to_cart("sauce-labs-backpack"))
+    await timer("go_to_cart", products_page.go_to_cart())
+    await timer("cart_loaded", page.wait_for_url("**/cart.html"))
+
+
+SCENARIOS = [
+    ("Login with Valid credentials", login_with_valid_credentials),
+    ("View product inventory", view_product_inventory),
+    ("Add product to cart", add_product_to_cart),
+    ("Removing a product updates the cart badge", remove_product_from_cart),
+]
@@ -0,0 +1,228 @@
+"""Benchmarks for the framework's own overhead against the local stand-in application
+
+Measures browser launch, context creation, the pooled context lease, the LoginPage flow,
+per-action BasePage latency and the conftest report hook for several configurations,
+without touching the network. Results are appended to a JSON history and the run fails when a metric
+regresses beyond the configured threshold against recent history.
+
+    python -m tests.benchmark [--browser chromium] [--repeats 5] [--no-fail]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from playwright.sync_api import sync_playwright
+
+import conftest
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from tests.standin_app import StandInServer
+from utils.config_manager import config
+from utils.context_pool import ContextPool
+from utils.duration_history import percentile
+from utils.page_metrics import PageMetricsCollector
+
+CONFIGURATIONS = [
+    {"name": "default", "slow_mo": 0, "wait_mode": "ready", "video": False},
+    {"name": "networkidle", "slow_mo": 0, "wait_mode": "networkidle", "video": False},
+    {"name": "video", "slow_mo": 0, "wait_mode": "ready", "video": True},
+    {"name": "slow_mo", "slow_mo": 100, "wait_mode": "ready", "video": False},
+]
+
+
+def _timed_ms(action) -> float:
+    """Run an action once and return its duration in milliseconds"""
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000
+
+
+def _median_ms(action, repeats: int) -> float:
+    """Median duration of an action over several runs"""
+    return percentile([_timed_ms(action) for _ in range(repeats)], 50)
+
+
+class _DiscardingWriter:
+    """Artifact writer stand-in that drops screenshots, so the benchmark leaves no files"""
+
+    def submit(self, data: bytes, path: str) -> str:
+        return path
+
+
+def _makereport(page, failed: bool):
+    """Drive conftest's pytest_runtest_makereport hook wrapper once for a call phase"""
+    writer = _DiscardingWriter()
+    item = SimpleNamespace(
+        name="benchmark", funcargs={"browser_context": {"page": page}},
+        config=SimpleNamespace(pluginmanager=SimpleNamespace(get_plugin=lambda name: writer),
+                               getoption=lambda name, default=None: default)
+    )
+    report = SimpleNamespace(when="call", failed=failed, passed=not failed)
+    hook = conftest.pytest_runtest_makereport(item, SimpleNamespace(when="call"))
+    next(hook)
+    try:
+        hook.send(SimpleNamespace(get_result=lambda: report))
+    except StopIteration:
+        pass
+
+
+def _benchmark_browser(browser, browser_name: str, configuration: dict, base_url: str, repeats: int,
+                       video_dir: str) -> dict:
+    """Measure the operations that run on a launched browser, in milliseconds"""
+    results = {}
+    context_options = {"viewport": {'width': 1920, 'height': 1080}}
+    if configuration["video"]:
+        context_options.update({"record_video_dir": video_dir, "record_video_size": {'width': 1280, 'height': 720}})
+    previous_wait_mode = BasePage.wait_mode
+    BasePage.wait_mode = configuration["wait_mode"]
+    try:
+        def create_context():
+            context = browser.new_context(**context_options)
+            context.new_page()
+            context.close()
+        results["context_creation"] = _median_ms(create_context, repeats)
+
+        pool = ContextPool(browser, context_options, size=1, max_uses=repeats + 1)
+        pool.prewarm()
+
+        def lease_and_release():
+            context, _ = pool.lease()
+            pool.release(context)
+        results["context_pool_lease"] = _median_ms(lease_and_release, repeats)
+        pool.close()
+
+        context = browser.new_context(**context_options)
+        page = context.new_page()
+        login_page = LoginPage(page)
+        products_page = ProductsPage(page)
+
+        def login_flow():
+            context.clear_cookies()
+            login_page.navigate_to_login_page(base_url)
+            login_page.login("standard_user", "secret_sauce")
+            products_page.verify_products_page_loaded()
+        results["login_flow"] = _median_ms(login_flow, repeats)
+
+        backpack = products_page.add_to_cart_selector("sauce-labs-backpack")
+        results["navigate_to"] = _median_ms(lambda: products_page.navigate_to_products_page(base_url), repeats)
+        results["click_element"] = _median_ms(
+            lambda: products_page.click_element(f"{backpack}, [data-test='remove-sauce-labs-backpack']"), repeats
+        )
+        results["get_text"] = _median_ms(lambda: products_page.get_text(products_page.products_header), repeats)
+        results["wait_for_element"] = _median_ms(
+            lambda: products_page.wait_for_element(products_page.product_items), repeats
+        )
+        results["is_element_present"] = _median_ms(
+            lambda: products_page.is_element_present(products_page.shopping_cart_badge), repeats
+        )
+        results["capture_metrics"] = _median_ms(
+            lambda: PageMetricsCollector(use_cdp=browser_name == "chromium").capture(page, "bench"), repeats
+        )
+
+        results["makereport_pass"] = _median_ms(lambda: _makereport(page, failed=False), repeats)
+        results["makereport_failure"] = _median_ms(lambda: _makereport(page, failed=True), repeats)
+
+        login_page.navigate_to_login_page(base_url)
+        results["fill_text"] = _median_ms(lambda: login_page.enter_username("standard_user"), repeats)
+        context.close()
+    finally:
+        BasePage.wait_mode = previous_wait_mode
+    return results
+
+
+def benchmark_configuration(playwright, browser_name: str, configuration: dict, base_url: str, repeats: int) -> dict:
+    """Measure every framework operation under one configuration, in milliseconds"""
+    results = {}
+    browser_type = getattr(playwright, browser_name)
+    launch_options = {"headless": True, "slow_mo": configuration["slow_mo"]}
+
+    results["browser_launch"] = _median_ms(lambda: browser_type.launch(**launch_options).close(), repeats)
+
+    # Videos are only written when their context closes, so the directory outlives the browser
+    with tempfile.TemporaryDirectory(prefix="bench-videos-") as video_dir:
+        browser = browser_type.launch(**launch_options)
+        try:
+            results.update(_benchmark_browser(browser, browser_name, configuration, base_url, repeats, video_dir))
+        finally:
+            browser.close()
+    return results
+
+
+def load_history(path: str) -> list:
+    """Load previous benchmark runs"""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def find_regressions(results: dict, history: list, browser_name: str, settings: dict) -> list:
+    """Compare results with the median of recent runs, returning (config, metric, now, baseline) rows"""
+    recent = [run for run in history if run["browser"] == browser_name][-settings['baseline_runs']:]
+    regressions = []
+    for configuration, metrics in results.items():
+        for metric, value in metrics.items():
+            past = [run["results"][configuration][metric] for run in recent
+                    if metric in run["results"].get(configuration, {})]
+            if not past:
+                continue
+            baseline = percentile(past, 50)
+            if value > baseline * (1 + settings['threshold_pct'] / 100.0) and value - baseline > settings['min_delta_ms']:
+                regressions.append((configuration, metric, value, baseline))
+    return regressions
+
+
+def main(argv=None) -> int:
+    """Run the benchmark matrix, append it to history and report regressions"""
+    settings = config.get_benchmark_settings()
+    parser = argparse.ArgumentParser(description="Benchmark the framework's own overhead")
+    parser.add_argument("--browser", default=os.getenv("BROWSER", "chromium"))
+    parser.add_argument("--repeats", type=int, default=settings['repeats'])
+    parser.add_argument("--configurations", default=",".join(c["name"] for c in CONFIGURATIONS),
+                        help="Comma-separated configuration names to run")
+    parser.add_argument("--no-fail", action="store_true", help="Report regressions without failing")
+    args = parser.parse_args(argv)
+
+    selected = [c for c in CONFIGURATIONS if c["name"] in args.configurations.split(",")]
+    results = {}
+    with StandInServer() as server, sync_playwright() as playwright:
+        for configuration in selected:
+            print(f"Benchmarking '{configuration['name']}' on {args.browser}...")
+            results[configuration["name"]] = benchmark_configuration(
+                playwright, args.browser, configuration, server.url, args.repeats
+            )
+
+    for configuration, metrics in results.items():
+        print(f"\n{configuration}")
+        for metric, value in metrics.items():
+            print(f"  {metric:<20} {value:>9.1f} ms")
+
+    history = load_history(settings['history'])
+    regressions = find_regressions(results, history, args.browser, settings)
+    history.append({
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "browser": args.browser,
+        "repeats": args.repeats,
+        "results": results
+    })
+    os.makedirs(os.path.dirname(settings['history']) or ".", exist_ok=True)
+    with open(settings['history'], "w") as file:
+        json.dump(history, file, indent=2)
+
+    if regressions:
+        print(f"\nRegressions beyond {settings['threshold_pct']}%:")
+        for configuration, metric, value, baseline in regressions:
+            print(f"  {configuration}/{metric}: {value:.1f} ms (baseline {baseline:.1f} ms)")
+        return 0 if args.no_fail else 1
+    print("\nNo regressions against recent history")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,11 @@ import sys
 import os
 from datetime import datetime
 
+# Make the project packages importable when run as `python tests/run_tests.py`
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
 
 def run_auth_tests():
     """Run authentication tests"""
@@ -55,6 +60,96 @@ def run_tests_by_tag(tag):
     return pytest.main(args)
 
 
+def run_suites(tags, workers=4):
+    """Run the union of several tag selections once, in parallel, with a report per tag"""
+    import importlib.util
+    
+    args = [
+        "step_definitions/",
+        f"--suites={','.join(tags)}",
+        "--html=reports/html/suites_report.html",
+        "--self-contained-html",
+        "-v"
+    ]
+    if workers > 1 and importlib.util.find_spec("xdist"):
+        args += ["-n", str(workers)]
+    return pytest.main(args)
+
+
+def run_async_scenarios(concurrency=4, repeat=1):
+    """Run the scenarios concurrently on one browser with the async Playwright backend"""
+    from tests.async_scenarios import SCENARIOS
+    from utils import async_runner
+    
+    scenarios = [(f"{name} #{run + 1}", scenario) for run in range(repeat) for name, scenario in SCENARIOS]
+    start = datetime.now()
+    results = async_runner.run(scenarios, concurrency=concurrency)
+    wall_time = (datetime.now() - start).total_seconds()
+    
+    for result in results:
+        status = "PASSED" if result.passed else "FAILED"
+        print(f"{status:<7} {result.duration:>7.2f}s  {result.name}")
+        if result.error:
+            print(result.error)
+    summed = sum(result.duration for result in results)
+    print(f"\n{len(results)} scenarios, concurrency {concurrency}: wall {wall_time:.2f}s, summed {summed:.2f}s")
+    return 0 if all(result.passed for result in results) else 1
+
+
+def run_load_test(argv):
+    """Drive virtual users through the shopping journey and stream throughput and latency"""
+    import argparse
+    import asyncio
+    from tests.async_scenarios import shopping_journey
+    from tests.standin_app import StandInServer
+    from utils.config_manager import config
+    from utils.load_generator import error_rate, parse_duration, run_load
+    
+    parser = argparse.ArgumentParser(prog="run_tests.py load", description="Virtual-user load mode")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--ramp", default="10s", help="Ramp-up period, e.g. 60s")
+    parser.add_argument("--duration", default="1m", help="Steady-state duration after ramp-up, e.g. 5m")
+    parser.add_argument("--browsers", type=int, default=1, help="Browser processes shared by all users")
+    parser.add_argument("--window", default="10s", help="Reporting window")
+    parser.add_argument("--target", default="standin",
+                        help="'standin' (local stand-in app), 'config' (login_page_base_url) or a base URL")
+    parser.add_argument("--max-error-rate", type=float, default=1.0,
+                        help="Fail when more than this percentage of iterations failed")
+    args = parser.parse_args(argv)
+    
+    def print_window(summary):
+        for action, stats in summary["actions"].items():
+            print(f"[{summary['window_start_s']:>6.0f}s] {action:<28} {stats['throughput_per_s']:>6.2f}/s "
+                  f"p50 {stats['p50_ms']:>7.0f}ms  p95 {stats['p95_ms']:>7.0f}ms")
+        for action, count in summary["errors"].items():
+            print(f"[{summary['window_start_s']:>6.0f}s] {action:<28} {count} errors")
+    
+    output_path = f"reports/load/load_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    server = StandInServer().start() if args.target == "standin" else None
+    base_url = server.url if server else (config.get_login_page_url() if args.target == "config" else args.target)
+    try:
+        totals = asyncio.run(run_load(
+            shopping_journey, base_url, args.users, parse_duration(args.ramp), parse_duration(args.duration),
+            browsers=args.browsers, browser_name=os.getenv("BROWSER", "chromium").lower(),
+            window_seconds=parse_duration(args.window), output_path=output_path, on_window=print_window
+        ))
+    finally:
+        if server:
+            server.stop()
+    
+    print("\nWhole run:")
+    for action, stats in totals.items():
+        print(f"  {action:<28} {stats['count']:>7}  p50 {stats['p50_ms']:>7.0f}ms  p95 {stats['p95_ms']:>7.0f}ms  "
+              f"max {stats['max_ms']:>7.0f}ms  {stats['errors']:>5} errors")
+    print(f"Window statistics streamed to {output_path}")
+    rate = error_rate(totals)
+    if rate > args.max_error_rate:
+        print(f"❌ {rate:.2f}% of iterations failed, above the {args.max_error_rate:g}% threshold")
+        return 1
+    print(f"Error rate {rate:.2f}% (threshold {args.max_error_rate:g}%)")
+    return 0
+
+
 if __name__ == "__main__":
     print("🚀 ECommerce Portal Test Runner")
     print("=" * 50)
@@ -71,13 +166,33 @@ if __name__ == "__main__":
         elif test_type == "all":
             print("Running All Tests...")
             exit_code = run_all_tests()
+        elif test_type == "async" or test_type.startswith("async:"):
+            concurrency = int(test_type.split(":")[1]) if ":" in test_type else 4
+            repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+            print(f"Running scenarios on the async backend (concurrency {concurrency})...")
+            exit_code = run_async_scenarios(concurrency, repeat)
+        elif test_type == "load":
+            print("Running virtual-user load mode...")
+            exit_code = run_load_test(sys.argv[2:])
+        elif test_type == "bench":
+            print("Running framework overhead benchmarks against the local stand-in app...")
+            from tests.benchmark import main as run_benchmarks
+            exit_code = run_benchmarks(sys.argv[2:])
+        elif test_type == "server":
+            from utils import browser_server
+            exit_code = browser_server.main(sys.argv[2:] or ["status"])
+        elif test_type.startswith("suites:"):
+            tags = sys.argv[1].split(":", 1)[1].split(",")  # marker names are case-sensitive
+            workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+            print(f"Running suites {', '.join(tags)} once, deduplicated, on {workers} workers...")
+            exit_code = run_suites(tags, workers)
         elif test_type.startswith("tag:"):
             tag = test_type.split(":")[1]
             print(f"Running tests with tag: {tag}")
             exit_code = run_tests_by_tag(tag)
         else:
             print(f"Unknown test type: {test_type}")
-            print("Available options: auth, smoke, all, tag:<tag_name>")
+            print("Available options: auth, smoke, all, tag:<tag_name>, suites:<tag>,<tag>,... [workers], async[:<concurrency>] [repeat], bench, load [--users N --ramp 60s --duration 5m], server start|stop|status [--browser B --idle S]")
             exit_code = 1
     else:
         print("Running Authentication Tests (default)...")
@@ -0,0 +1,216 @@
+"""Local SauceDemo-compatible stand-in application for offline benchmarks and load runs
+
+Serves the subset of www.saucedemo.com the page objects use: the login form, the
+inventory list with add-to-cart buttons, the cart badge and the cart page. Sessions use
+the same `session-username` cookie and the cart lives in the `cart-contents` local
+storage key, like the real site.
+
+    python -m tests.standin_app --port 8000
+"""
+import argparse
+import threading
+from http import cookies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from utils.state_seeder import SAUCEDEMO_PRODUCT_IDS
+
+USERS = {"standard_user", "problem_user", "performance_glitch_user", "error_user", "visual_user"}
+PASSWORD = "secret_sauce"
+
+PRODUCTS = [
+    ("Sauce Labs Backpack", "29.99", "carry.allTheThings() with the sleek, streamlined Sly Pack."),
+    ("Sauce Labs Bike Light", "9.99", "A red light isn't the desired state in testing but it sure helps when riding your bike at night."),
+    ("Sauce Labs Bolt T-Shirt", "15.99", "Get your testing superhero on with the Sauce Labs bolt T-shirt."),
+    ("Sauce Labs Fleece Jacket", "49.99", "It's not every day that you come across a midweight quarter-zip fleece jacket."),
+    ("Sauce Labs Onesie", "7.99", "Rib snap infant onesie for the junior automation engineer in development."),
+    ("Test.allTheThings() T-Shirt (Red)", "15.99", "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard."),
+]
+
+_CART_SCRIPT = """
+<script>
+function cart() { return JSON.parse(localStorage.getItem('cart-contents') || '[]'); }
+function renderBadge() {
+  const link = document.querySelector('.shopping_cart_link');
+  const old = document.querySelector('.shopping_cart_badge');
+  if (old) old.remove();
+  const count = cart().length;
+  if (count > 0) {
+    const badge = document.createElement('span');
+    badge.className = 'shopping_cart_badge';
+    badge.textContent = String(count);
+    link.appendChild(badge);
+  }
+}
+function renderButtons() {
+  const items = cart();
+  document.querySelectorAll('.inventory_item').forEach(item => {
+    const id = item.dataset.id;
+    const button = item.querySelector('button');
+    const inCart = items.includes(Number(id));
+    button.textContent = inCart ? 'Remove' : 'Add to cart';
+    button.dataset.test = (inCart ? 'remove-' : 'add-to-cart-') + item.dataset.slug;
+  });
+}
+function toggle(id) {
+  let items = cart();
+  items = items.includes(id) ? items.filter(i => i !== id) : items.concat([id]);
+  localStorage.setItem('cart-contents', JSON.stringify(items));
+  renderButtons();
+  renderBadge();
+}
+document.addEventListener('DOMContentLoaded', () => { renderButtons(); renderBadge(); });
+</script>
+"""
+
+_HEADER = """
+<div class="primary_header">
+  <button id="react-burger-menu-btn" onclick="document.querySelector('.bm-menu-wrap').hidden = false">Open Menu</button>
+  <nav class="bm-menu-wrap" hidden><a id="logout_sidebar_link" href="/logout">Logout</a></nav>
+  <a class="shopping_cart_link" href="/cart.html"></a>
+</div>
+"""
+
+
+def slug(name: str) -> str:
+    """Product name as used in data-test attributes, e.g. sauce-labs-backpack"""
+    return name.lower().replace(" ", "-")
+
+
+def _login_page(error: str = "") -> str:
+    """Render the login form, optionally with an error message"""
+    error_html = f'<h3 data-test="error">Epic sadface: {error}</h3>' if error else ""
+    return f"""<!DOCTYPE html><html><head><title>Swag Labs</title></head><body>
+<div class="login_logo">Swag Labs</div>
+<form method="post" action="/login">
+  <input data-test="username" id="user-name" name="user-name" placeholder="Username">
+  <input data-test="password" id="password" name="password" type="password" placeholder="Password">
+  {error_html}
+  <input data-test="login-button" id="login-button" type="submit" value="Login">
+</form></body></html>"""
+
+
+def _inventory_page() -> str:
+    """Render the inventory list"""
+    items = "".join(
+        f"""<div class="inventory_item" data-id="{SAUCEDEMO_PRODUCT_IDS[slug(name)]}" data-slug="{slug(name)}">
+  <div class="inventory_item_name">{name}</div>
+  <div class="inventory_item_desc">{description}</div>
+  <div class="inventory_item_price">${price}</div>
+  <button onclick="toggle({SAUCEDEMO_PRODUCT_IDS[slug(name)]})" data-test="add-to-cart-{slug(name)}">Add to cart</button>
+</div>"""
+        for name, price, description in PRODUCTS
+    )
+    return f"""<!DOCTYPE html><html><head><title>Swag Labs</title>{_CART_SCRIPT}</head><body>
+{_HEADER}
+<span class="title">Products</span>
+<div class="inventory_container"><div class="inventory_list">{items}</div></div>
+</body></html>"""
+
+
+def _cart_page() -> str:
+    """Render the cart page"""
+    return f"""<!DOCTYPE html><html><head><title>Swag Labs</title>{_CART_SCRIPT}</head><body>
+{_HEADER}
+<span class="title">Your Cart</span>
+<div class="cart_list"></div>
+</body></html>"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Request handler emulating the SauceDemo pages the framework touches"""
+
+    def log_message(self, format, *args):
+        """Keep benchmark and load output quiet"""
+
+    def _user(self):
+        """Get the logged-in user from the session cookie"""
+        jar = cookies.SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = jar.get("session-username")
+        return morsel.value if morsel and morsel.value in USERS else None
+
+    def _send(self, status: int, body: str = "", headers: dict = None):
+        """Send an HTML response"""
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path in ("/", "/index.html"):
+            self._send(200, _login_page())
+        elif path in ("/inventory.html", "/cart.html"):
+            if not self._user():
+                self._send(200, _login_page(f"You can only access '{path}' when you are logged in."))
+            else:
+                self._send(200, _inventory_page() if path == "/inventory.html" else _cart_page())
+        elif path == "/logout":
+            self._send(302, headers={"Location": "/", "Set-Cookie": "session-username=; Path=/; Max-Age=0"})
+        else:
+            self._send(404, "Not found")
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/login":
+            self._send(404, "Not found")
+            return
+        length = int(self.headers.get("Content-Length", "0"))
+        fields = dict(
+            pair.split("=", 1) for pair in self.rfile.read(length).decode("utf-8").split("&") if "=" in pair
+        )
+        username, password = fields.get("user-name", ""), fields.get("password", "")
+        if username in USERS and password == PASSWORD:
+            self._send(303, headers={
+                "Location": "/inventory.html",
+                "Set-Cookie": f"session-username={username}; Path=/"
+            })
+        else:
+            self._send(200, _login_page("Username and password do not match any user in this service"))
+
+
+class StandInServer:
+    """Runs the stand-in application on a background thread"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), StandInHandler)
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server, with a trailing slash like login_page_base_url"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        """Start serving in the background"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the SauceDemo stand-in application")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    server = StandInServer(args.host, args.port)
+    print(f"Stand-in application running at {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,142 @@
+"""Unit tests for the parsed-feature cache and the indexed step lookup"""
+import os
+from types import SimpleNamespace
+
+import pytest
+from pytest_bdd import feature as bdd_feature
+from pytest_bdd import parsers
+
+from utils import bdd_collection
+from utils.bdd_collection import FeatureCache, StepIndex
+
+FEATURE = """Feature: Cached
+  Scenario: Parsed once
+    Given a cached feature
+"""
+
+
+@pytest.fixture
+def features(monkeypatch):
+    """A private pytest-bdd feature dictionary, so tests do not see the session's features"""
+    parsed = {}
+    monkeypatch.setattr(bdd_feature, "features", parsed)
+    return parsed
+
+
+@pytest.fixture
+def feature_file(tmp_path):
+    """A feature file on disk"""
+    path = tmp_path / "cached.feature"
+    path.write_text(FEATURE)
+    return path
+
+
+def _parse(path):
+    """Parse a feature through pytest-bdd, which stores it in its feature dictionary"""
+    return bdd_feature.get_feature(str(path.parent), path.name)
+
+
+def test_unchanged_features_are_loaded_from_the_cache(tmp_path, features, feature_file):
+    cache = FeatureCache(str(tmp_path / "cache" / "features.pickle"))
+    _parse(feature_file)
+    assert cache.update() == 1
+    cache.save()
+
+    features.clear()
+    reloaded = FeatureCache(cache.path)
+    assert reloaded.load() == 1
+    assert [feature.name for feature in features.values()] == ["Cached"]
+    assert reloaded.update() == 0
+
+
+def test_edited_features_are_parsed_again(tmp_path, features, feature_file):
+    cache = FeatureCache(str(tmp_path / "features.pickle"))
+    _parse(feature_file)
+    cache.update()
+    cache.save()
+
+    feature_file.write_text(FEATURE.replace("Cached", "Edited"))
+    features.clear()
+    reloaded = FeatureCache(cache.path)
+    assert reloaded.load() == 0
+    assert features == {}
+
+
+def test_touched_but_identical_features_are_reused(tmp_path, features, feature_file):
+    cache = FeatureCache(str(tmp_path / "features.pickle"))
+    _parse(feature_file)
+    cache.update()
+    cache.save()
+
+    stat = os.stat(feature_file)
+    os.utime(feature_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    features.clear()
+    reloaded = FeatureCache(cache.path)
+    assert reloaded.load() == 1
+    # The new mtime is written back so the next run skips the hash
+    assert reloaded.dirty
+
+
+def test_cache_from_another_version_is_ignored(tmp_path, features, feature_file, monkeypatch):
+    cache = FeatureCache(str(tmp_path / "features.pickle"))
+    _parse(feature_file)
+    cache.update()
+    cache.save()
+
+    monkeypatch.setattr(bdd_collection, "_CACHE_VERSION", "pytest-bdd-0.0-py0.0")
+    features.clear()
+    assert FeatureCache(cache.path).load() == 0
+
+
+def test_missing_or_corrupt_cache_loads_nothing(tmp_path, features):
+    assert FeatureCache(str(tmp_path / "missing.pickle")).load() == 0
+    corrupt = tmp_path / "corrupt.pickle"
+    corrupt.write_bytes(b"not a pickle")
+    assert FeatureCache(str(corrupt)).load() == 0
+
+
+def _step_fixturedef(step_type, parser):
+    """A fixture definition carrying pytest-bdd's step context"""
+    func = lambda: None
+    func._pytest_bdd_step_context = SimpleNamespace(type=step_type, parser=parser)
+    return SimpleNamespace(func=func)
+
+
+@pytest.fixture
+def step_index():
+    """An index over literal, parsed and untyped step definitions"""
+    fixturedefs = {
+        "logged_in": [_step_fixturedef("given", parsers.string("user is logged in"))],
+        "adds": [_step_fixturedef("when", parsers.parse('user adds "{product}" to cart'))],
+        "any_step": [_step_fixturedef(None, parsers.string("user is logged in"))],
+        "not_a_step": [SimpleNamespace(func=lambda: None)],
+        "regex": [_step_fixturedef("when", parsers.re(r"user adds \"(?P<product>.+)\" to .*"))],
+    }
+    index = StepIndex()
+    index.build(SimpleNamespace(_arg2fixturedefs=fixturedefs))
+    return index
+
+
+def test_literal_steps_are_found_by_type_and_text(step_index):
+    found = step_index.candidates(SimpleNamespace(type="given", name="user is logged in"))
+    assert [fixturename for _, fixturename, _ in found] == ["logged_in", "any_step"]
+
+
+def test_parsed_steps_match_only_their_step_type(step_index):
+    step = SimpleNamespace(type="when", name='user adds "backpack" to cart')
+    assert [fixturename for _, fixturename, _ in step_index.candidates(step)] == ["adds", "regex"]
+    step = SimpleNamespace(type="then", name='user adds "backpack" to cart')
+    assert step_index.candidates(step) == []
+
+
+def test_candidates_are_memoised_per_step(step_index):
+    step = SimpleNamespace(type="given", name="user is logged in")
+    assert step_index.candidates(step) is step_index.candidates(step)
+
+
+def test_lookup_honours_fixture_visibility(step_index, monkeypatch):
+    step = SimpleNamespace(type="given", name="user is logged in")
+    visible = step_index.candidates(step)[1][2]
+    monkeypatch.setattr(bdd_collection, "getfixturedefs",
+                        lambda manager, name, node: [visible] if name == "any_step" else None)
+    assert list(step_index.find_fixturedefs_for_step(step, None, None)) == [visible]
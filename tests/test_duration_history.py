@@ -0,0 +1,90 @@
+"""Unit tests for the duration history percentiles, drift detection and browser keying"""
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from utils.duration_history import DurationHistory, DurationHistoryPlugin, percentile
+
+
+@pytest.fixture
+def history(tmp_path):
+    """Empty history in a temporary directory"""
+    return DurationHistory(str(tmp_path / "history" / "durations.sqlite"), keep_runs=10)
+
+
+def _record_runs(history, seconds: list, nodeid: str = "features/a.feature::test_a", browser: str = "chromium"):
+    """Store one run per duration"""
+    for index, value in enumerate(seconds):
+        history.record([(nodeid, browser, "call", value)], run_id=f"run{index:03d}")
+
+
+def test_percentile_interpolates_between_samples():
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([4, 1, 3, 2], 0) == 1
+    assert percentile([4, 1, 3, 2], 100) == 4
+    assert percentile([10], 95) == 10
+
+
+def test_percentile_of_no_samples_is_zero():
+    assert percentile([], 95) == 0.0
+
+
+def test_database_is_created_on_first_write(history):
+    assert history.totals("chromium") == {}
+    assert not os.path.exists(history.path)
+    _record_runs(history, [1.0])
+    assert os.path.exists(history.path)
+
+
+def test_totals_sum_phases_per_run(history):
+    history.record([("test_a", "chromium", "setup", 0.5), ("test_a", "chromium", "call", 1.0)], run_id="run001")
+    history.record([("test_a", "chromium", "call", 2.0)], run_id="run002")
+    assert history.totals("chromium") == {"test_a": [1.5, 2.0]}
+
+
+def test_old_runs_are_pruned(tmp_path):
+    history = DurationHistory(str(tmp_path / "durations.sqlite"), keep_runs=3)
+    _record_runs(history, [1.0, 2.0, 3.0, 4.0, 5.0], nodeid="test_a")
+    assert history.totals("chromium") == {"test_a": [3.0, 4.0, 5.0]}
+
+
+def test_drift_is_flagged_above_the_percentile(history):
+    _record_runs(history, [1.0, 1.1, 0.9, 1.0, 1.2], nodeid="test_a")
+    _record_runs(history, [2.0, 2.0, 2.0, 2.0, 2.0], nodeid="test_b")
+    drifted = history.drifted({"test_a": 3.0, "test_b": 2.0}, "chromium", pct=95, min_samples=5)
+    assert [(nodeid, seconds) for nodeid, seconds, _ in drifted] == [("test_a", 3.0)]
+    assert drifted[0][2] == pytest.approx(percentile([1.0, 1.1, 0.9, 1.0, 1.2], 95))
+
+
+def test_drift_needs_enough_samples(history):
+    _record_runs(history, [1.0, 1.0, 1.0], nodeid="test_a")
+    assert history.drifted({"test_a": 10.0}, "chromium", pct=95, min_samples=5) == []
+
+
+def test_history_is_kept_per_browser(history):
+    _record_runs(history, [1.0, 1.0], nodeid="test_a", browser="chromium")
+    assert history.expected_durations("firefox") == {}
+    assert history.expected_durations("chromium") == {"test_a": 1.0}
+
+
+def test_plugin_keys_rows_on_the_browser_property_and_skips_retries(history):
+    plugin = DurationHistoryPlugin(history, "chromium")
+
+    def report(nodeid, browser, attempt=1):
+        return SimpleNamespace(nodeid=nodeid, when="call", duration=1.0, skipped=False,
+                               user_properties=[("browser", browser), ("attempt", attempt)])
+
+    plugin.pytest_runtest_logreport(report("test_a@login.feature", "firefox"))
+    plugin.pytest_runtest_logreport(report("test_a", "chromium"))
+    plugin.pytest_runtest_logreport(report("test_a", "chromium", attempt=2))
+    assert plugin.rows == [("test_a", "firefox", "call", 1.0), ("test_a", "chromium", "call", 1.0)]
+
+
+def test_plugin_orders_the_slowest_tests_first(history):
+    _record_runs(history, [1.0], nodeid="test_fast")
+    _record_runs(history, [5.0], nodeid="test_slow")
+    plugin = DurationHistoryPlugin(history, "chromium")
+    items = [SimpleNamespace(nodeid=nodeid, user_properties=[]) for nodeid in ("test_fast", "test_new", "test_slow")]
+    plugin.pytest_collection_modifyitems(items)
+    assert [item.nodeid for item in items] == ["test_new", "test_slow", "test_fast"]
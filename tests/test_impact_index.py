@@ -0,0 +1,166 @@
+"""Unit tests for diff-hunk parsing, AST symbol mapping and impact-based selection"""
+import subprocess
+import textwrap
+
+import pytest
+
+from utils.impact_index import ImpactIndex, changed_lines, parse_diff, python_symbols
+
+DIFF = """diff --git a/pages/login_page.py b/pages/login_page.py
+index 1111111..2222222 100644
+--- a/pages/login_page.py
++++ b/pages/login_page.py
+@@ -10,0 +11,2 @@ class LoginPage(BasePage):
++        self.extra = 1
++        self.other = 2
+@@ -30 +32 @@ class LoginPage(BasePage):
+-        old
++        new
+@@ -40,3 +42,0 @@ class LoginPage(BasePage):
+-        removed
+-        removed
+-        removed
+diff --git a/features/new.feature b/features/new.feature
+new file mode 100644
+index 0000000..3333333
+--- /dev/null
++++ b/features/new.feature
+@@ -0,0 +1,2 @@
++Feature: New
++  Scenario: New
+diff --git a/pages/gone.py b/pages/gone.py
+deleted file mode 100644
+index 4444444..0000000
+--- a/pages/gone.py
++++ /dev/null
+@@ -1 +0,0 @@
+-pass
+"""
+
+MODULE = textwrap.dedent('''\
+    import os
+
+
+    def helper():
+        return 1
+
+
+    class Page:
+        locator = "#id"
+
+        @property
+        def title(self):
+            def nested():
+                return 2
+            return nested()
+
+        async def load(self):
+            pass
+    ''')
+
+
+def test_hunks_map_to_new_file_lines():
+    changes = parse_diff(DIFF)
+    # Added lines, a one-line change and a pure deletion next to line 42
+    assert changes["pages/login_page.py"] == {11, 12, 32, 42}
+
+
+def test_added_and_deleted_files_are_whole_file_changes():
+    changes = parse_diff(DIFF)
+    assert changes["features/new.feature"] is None
+    assert changes["pages/gone.py"] is None
+
+
+def test_symbols_cover_decorators_and_nested_functions():
+    assert python_symbols(MODULE) == [
+        ("helper", 4, 5),
+        ("Page.title", 11, 15),
+        ("Page.load", 17, 18),
+    ]
+
+
+@pytest.fixture
+def index(tmp_path):
+    """An index of three scenarios touching a page module and their feature files"""
+    index = ImpactIndex(str(tmp_path / "impact.json"))
+    index.update("step_definitions/test_a.py::test_helper", ["features/a.feature"], ["pages/page.py::helper"])
+    index.update("step_definitions/test_a.py::test_title", ["features/a.feature"], ["pages/page.py::Page.title"])
+    index.update("step_definitions/test_b.py::test_other", ["features/b.feature"], [])
+    return index
+
+
+@pytest.fixture
+def root(tmp_path):
+    """A project root holding the indexed page module"""
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "page.py").write_text(MODULE)
+    return str(tmp_path)
+
+
+def test_changed_function_selects_only_its_scenarios(index, root):
+    selected, reason = index.affected({"pages/page.py": {14}}, root, [], [])
+    assert reason is None
+    assert selected == {"step_definitions/test_a.py::test_title"}
+
+
+def test_module_level_change_selects_every_scenario_touching_the_file(index, root):
+    selected, _ = index.affected({"pages/page.py": {9}}, root, [], [])
+    assert selected == {"step_definitions/test_a.py::test_helper", "step_definitions/test_a.py::test_title"}
+
+
+def test_changed_feature_file_selects_its_scenarios(index, root):
+    selected, _ = index.affected({"features/b.feature": None}, root, [], [])
+    assert selected == {"step_definitions/test_b.py::test_other"}
+
+
+def test_full_run_patterns_and_uncovered_files_run_everything(index, root):
+    assert index.affected({"conftest.py": {1}}, root, ["conftest.py"], [])[0] is None
+    assert index.affected({"config.yaml": None}, root, [], [])[0] is None
+    assert index.affected({"README.md": None}, root, [], ["*.md"]) == (set(), None)
+
+
+def test_empty_index_runs_everything(tmp_path, root):
+    selected, reason = ImpactIndex(str(tmp_path / "none.json")).affected({"pages/page.py": {1}}, root, [], [])
+    assert selected is None and reason
+
+
+def _git(cwd, *args):
+    """Run git in a scratch repository"""
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def test_changes_since_the_merge_base_include_work_tree_and_renames(tmp_path):
+    repo = str(tmp_path)
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "tests@example.com")
+    _git(repo, "config", "user.name", "tests")
+    (tmp_path / "page.py").write_text("a = 1\nb = 2\nc = 3\n")
+    (tmp_path / "old.py").write_text("x = 1\n")
+    (tmp_path / "main_only.py").write_text("m = 1\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "base")
+    _git(repo, "branch", "base")
+
+    _git(repo, "checkout", "-q", "-b", "feature")
+    _git(repo, "mv", "old.py", "new.py")
+    (tmp_path / "page.py").write_text("a = 1\nb = 20\nc = 3\n")
+    _git(repo, "commit", "-q", "-am", "feature")
+    _git(repo, "checkout", "-q", "base")
+    (tmp_path / "main_only.py").write_text("m = 2\n")
+    _git(repo, "commit", "-q", "-am", "moved on")
+    _git(repo, "checkout", "-q", "feature")
+    (tmp_path / "page.py").write_text("a = 1\nb = 20\nc = 3\nd = 4\n")
+    (tmp_path / "untracked.py").write_text("u = 1\n")
+
+    assert changed_lines("base", repo) == {
+        "page.py": {2, 4},
+        "old.py": None,
+        "new.py": None,
+        "untracked.py": None,
+    }
+
+
+def test_unknown_ref_is_reported(tmp_path):
+    _git(str(tmp_path), "init", "-q")
+    with pytest.raises(ValueError):
+        changed_lines("no-such-ref", str(tmp_path))
@@ -0,0 +1,95 @@
+"""Unit tests for suite parsing, the union expression and the per-suite JUnit fan-out"""
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+
+import pytest
+
+from utils.suite_orchestrator import SuiteOrchestratorPlugin, parse_suites, union_expression
+
+
+def test_suites_are_split_trimmed_and_deduplicated():
+    assert parse_suites(" smoke, auth and not slow ,smoke,, ") == ["smoke", "auth and not slow"]
+
+
+def test_union_wraps_every_expression():
+    assert union_expression(["smoke", "auth and not slow"]) == "(smoke) or (auth and not slow)"
+
+
+def test_union_with_all_selects_everything():
+    assert union_expression(["smoke", "all"]) is None
+
+
+def test_invalid_expression_is_a_usage_error():
+    with pytest.raises(pytest.UsageError):
+        SuiteOrchestratorPlugin(["smoke and"])
+
+
+def test_restrict_combines_with_an_existing_marker_expression():
+    config = SimpleNamespace(option=SimpleNamespace(markexpr="not slow"))
+    SuiteOrchestratorPlugin(["smoke", "auth"]).restrict(config)
+    assert config.option.markexpr == "(not slow) and ((smoke) or (auth))"
+
+
+def _item(*markers):
+    """A collected test carrying the given markers"""
+    return SimpleNamespace(iter_markers=lambda: [SimpleNamespace(name=name) for name in markers],
+                           user_properties=[])
+
+
+def test_tests_are_tagged_with_every_matching_suite():
+    plugin = SuiteOrchestratorPlugin(["smoke", "auth and not slow", "all"])
+    items = [_item("smoke", "auth"), _item("auth", "slow"), _item("cart")]
+    plugin.pytest_collection_modifyitems(None, None, items)
+    assert [dict(item.user_properties)["suites"] for item in items] == [
+        ["smoke", "auth and not slow", "all"],
+        ["all"],
+        ["all"],
+    ]
+
+
+def _report(nodeid, when, outcome, suites, duration=1.0):
+    """A phase report as it reaches the controller"""
+    return SimpleNamespace(nodeid=nodeid, when=when, outcome=outcome, duration=duration,
+                           skipped=outcome == "skipped", longreprtext=f"{nodeid} {outcome}",
+                           user_properties=[("suites", suites)])
+
+
+def test_results_keep_the_final_attempt_under_the_base_node_id():
+    plugin = SuiteOrchestratorPlugin(["smoke"])
+    nodeid = "step_definitions/test_a.py::test_flaky@login.feature"
+    for report in (_report(nodeid, "setup", "passed", ["smoke"]), _report(nodeid, "call", "rerun", ["smoke"]),
+                   _report(nodeid, "teardown", "passed", ["smoke"]),
+                   _report(nodeid, "setup", "passed", ["smoke"]), _report(nodeid, "call", "passed", ["smoke"]),
+                   _report(nodeid, "teardown", "passed", ["smoke"])):
+        plugin.pytest_runtest_logreport(report)
+    result = plugin.results["step_definitions/test_a.py::test_flaky"]
+    assert result["outcome"] == "passed"
+    assert result["duration"] == 6.0
+    assert result["attempt_time"] == 3.0
+
+
+def test_each_suite_gets_its_own_junit_file(tmp_path):
+    plugin = SuiteOrchestratorPlugin(["smoke", "auth"])
+    for nodeid, outcome, suites in (("step_definitions/test_a.py::test_login", "passed", ["smoke", "auth"]),
+                                    ("step_definitions/test_a.py::test_logout", "failed", ["auth"]),
+                                    ("step_definitions/test_b.py::test_cart", "skipped", ["smoke"])):
+        for when in ("setup", "call", "teardown"):
+            plugin.pytest_runtest_logreport(_report(nodeid, when, outcome if when == "call" else "passed", suites))
+
+    auth = ET.parse(plugin._write_junit("auth", plugin._suite_results("auth"), str(tmp_path))).getroot()
+    assert (auth.get("name"), auth.get("tests"), auth.get("failures"), auth.get("skipped")) == ("auth", "2", "1", "0")
+    assert [(case.get("classname"), case.get("name")) for case in auth] == [
+        ("step_definitions.test_a", "test_login"),
+        ("step_definitions.test_a", "test_logout"),
+    ]
+    assert auth[1].find("failure").text == "step_definitions/test_a.py::test_logout failed"
+
+    smoke = ET.parse(plugin._write_junit("smoke", plugin._suite_results("smoke"), str(tmp_path))).getroot()
+    assert (smoke.get("tests"), smoke.get("failures"), smoke.get("skipped")) == ("2", "0", "1")
+    assert smoke[1].find("skipped") is not None
+
+
+def test_workers_leave_the_aggregation_to_the_controller():
+    plugin = SuiteOrchestratorPlugin(["smoke"], controller=False)
+    plugin.pytest_runtest_logreport(_report("test_a", "call", "failed", ["smoke"]))
+    assert plugin.results == {}
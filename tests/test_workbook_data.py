@@ -0,0 +1,78 @@
+"""Unit tests for the workbook row cache behind @data:<sheet> scenarios"""
+import os
+
+import openpyxl
+import pytest
+
+from utils import test_data
+from utils.test_data import WorkbookData
+
+
+def _write_workbook(path, users):
+    """A workbook with a Credentials sheet of (username, password) rows and a blank row"""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Credentials"
+    sheet.append(["username", "password", None])
+    for row in users:
+        sheet.append(row)
+    sheet.append([None, None])
+    workbook.create_sheet("Empty")
+    workbook.save(path)
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """Path of a small workbook"""
+    path = str(tmp_path / "TestData.xlsx")
+    _write_workbook(path, [["standard_user", "secret_sauce"], ["locked_out_user", "secret_sauce"]])
+    return path
+
+
+def test_rows_are_read_by_header(workbook, tmp_path):
+    sheet = WorkbookData(workbook, str(tmp_path / "cache")).sheet("Credentials")
+    assert len(sheet) == 2
+    assert sheet.header == ["username", "password", "column_3"]
+    assert sheet.row(1) == {"username": "locked_out_user", "password": "secret_sauce", "column_3": None}
+    assert [row["username"] for row in sheet] == ["standard_user", "locked_out_user"]
+
+
+def test_empty_sheet_has_no_rows(workbook, tmp_path):
+    assert len(WorkbookData(workbook, str(tmp_path / "cache")).sheet("Empty")) == 0
+
+
+def test_unknown_sheet_names_the_available_ones(workbook, tmp_path):
+    with pytest.raises(KeyError, match="Credentials, Empty"):
+        WorkbookData(workbook, str(tmp_path / "cache")).sheet("Missing")
+
+
+def test_unchanged_workbook_is_not_converted_again(workbook, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    WorkbookData(workbook, cache_dir).sheet("Credentials")
+
+    def fail(*args):
+        raise AssertionError("the cached conversion should have been reused")
+    monkeypatch.setattr(WorkbookData, "_convert", fail)
+    monkeypatch.setattr(test_data, "_file_sha256", fail)
+    assert len(WorkbookData(workbook, cache_dir).sheet("Credentials")) == 2
+
+
+def test_edited_workbook_replaces_the_stale_conversion(workbook, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    data = WorkbookData(workbook, cache_dir)
+    data.sheet("Credentials")
+    stale = set(os.listdir(data.cache_dir))
+
+    _write_workbook(workbook, [["problem_user", "secret_sauce"]])
+    edited = WorkbookData(workbook, cache_dir)
+    sheet = edited.sheet("Credentials")
+    assert [row["username"] for row in sheet] == ["problem_user"]
+    conversions = {entry for entry in os.listdir(edited.cache_dir) if os.path.isdir(os.path.join(edited.cache_dir, entry))}
+    assert len(conversions) == 1 and not conversions <= stale
+
+
+def test_one_index_per_workbook_is_shared(workbook, tmp_path):
+    test_data.workbook_data.cache_clear()
+    cache_dir = str(tmp_path / "cache")
+    assert test_data.workbook_data(workbook, cache_dir) is test_data.workbook_data(workbook, cache_dir)
+    test_data.workbook_data.cache_clear()
@@ -0,0 +1,147 @@
+"""Artifact policy: record traces and video, keep them only when they are worth keeping"""
+import os
+import shutil
+from collections import deque
+
+from utils.artifacts import REPORTS_DIR, artifact_dir, safe_filename, unique_timestamp
+
+ARTIFACT_MODES = ("off", "retain-on-failure", "always")
+ARTIFACT_KINDS = ("traces", "videos", "screenshots")
+
+
+def _keep(mode: str, failed: bool) -> bool:
+    """Decide whether an artifact recorded under a mode is kept"""
+    return mode == "always" or (mode == "retain-on-failure" and failed)
+
+
+class ArtifactRecorder:
+    """Records a Playwright trace and video for one test and keeps them according to the policy
+
+    With trace_last_steps > 0 every step is recorded as its own trace chunk and only
+    the last N chunks are held on disk, like a ring buffer.
+    """
+
+    def __init__(self, context, page, settings: dict, test_name: str):
+        self.context = context
+        self.page = page
+        self.trace_mode = settings['trace']
+        self.video_mode = settings['video']
+        self.last_steps = settings['trace_last_steps']
+        self.name = f"{safe_filename(test_name)}_{unique_timestamp()}"
+        self.chunks = deque()
+        self.step_index = 0
+        self.tracing = False
+        for mode in (self.trace_mode, self.video_mode):
+            if mode not in ARTIFACT_MODES:
+                raise ValueError(f"Unknown artifact mode '{mode}', expected one of {ARTIFACT_MODES}")
+
+    @property
+    def chunked(self) -> bool:
+        """Whether the trace is kept as a ring buffer of per-step chunks"""
+        return self.tracing and self.last_steps > 0
+
+    def start(self):
+        """Start tracing if the policy asks for it"""
+        if self.trace_mode != "off":
+            self.context.tracing.start(screenshots=True, snapshots=True, sources=False)
+            self.tracing = True
+
+    def start_step(self):
+        """Open a trace chunk for the next step"""
+        if self.chunked:
+            self.context.tracing.start_chunk()
+
+    def end_step(self, step_name: str):
+        """Close the step's trace chunk and drop the oldest one beyond the last N"""
+        if not self.chunked:
+            return
+        self.step_index += 1
+        ring_dir = os.path.join(artifact_dir("traces"), ".ring", self.name)
+        os.makedirs(ring_dir, exist_ok=True)
+        path = os.path.join(ring_dir, f"{self.step_index:03d}_{safe_filename(step_name)}.zip")
+        self.context.tracing.stop_chunk(path=path)
+        self.chunks.append(path)
+        while len(self.chunks) > self.last_steps:
+            os.remove(self.chunks.popleft())
+
+    def stop_tracing(self, failed: bool) -> str:
+        """Stop tracing and keep the trace if the policy says so, returning its path"""
+        if not self.tracing:
+            return None
+        self.tracing = False
+        keep = _keep(self.trace_mode, failed)
+
+        if self.last_steps > 0:
+            self.context.tracing.stop()
+            ring_dir = os.path.join(artifact_dir("traces"), ".ring", self.name)
+            if not keep:
+                shutil.rmtree(ring_dir, ignore_errors=True)
+                return None
+            kept_dir = os.path.join(artifact_dir("traces"), self.name)
+            os.replace(ring_dir, kept_dir)
+            return kept_dir
+
+        if not keep:
+            self.context.tracing.stop()
+            return None
+        path = os.path.join(artifact_dir("traces"), f"{self.name}.zip")
+        self.context.tracing.stop(path=path)
+        return path
+
+    def finalize_video(self, failed: bool) -> str:
+        """Delete the video of a passing test; call once the page has been closed"""
+        video = self.page.video
+        if video is None:
+            return None
+        try:
+            path = video.path()
+        except Exception:
+            # Connected to a browser server: the video lives remotely and is copied over
+            return self._fetch_remote_video(video, failed)
+        if _keep(self.video_mode, failed):
+            return path
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    def _fetch_remote_video(self, video, failed: bool) -> str:
+        """Save a browser server's video locally if it is kept, and delete the remote copy"""
+        path = None
+        try:
+            if _keep(self.video_mode, failed):
+                path = os.path.join(artifact_dir("videos"), f"{self.name}.webm")
+                video.save_as(path)
+            video.delete()
+        except Exception:
+            return None
+        return path
+
+
+def prune_artifacts(max_disk_mb: float, kinds: tuple = ARTIFACT_KINDS):
+    """Delete the least recently written artifacts until their total size fits the cap"""
+    files = []
+    for kind in kinds:
+        for root, _, names in os.walk(os.path.join(REPORTS_DIR, kind)):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+    budget = max_disk_mb * 1024 * 1024
+    total = sum(size for _, size, _ in files)
+    removed = 0
+    for _, size, path in sorted(files):
+        if total <= budget:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
@@ -0,0 +1,65 @@
+"""Background writer for failure screenshots and other report attachments"""
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+class ArtifactWriter:
+    """Writes artifact bytes on a thread pool, deduplicating identical content by hash
+
+    Registered as a pytest plugin so pending writes are flushed when the session ends.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifact-writer")
+        self.lock = threading.Lock()
+        self.paths_by_digest = {}
+        self.futures = []
+        self.written = 0
+        self.deduplicated = 0
+
+    def submit(self, data: bytes, path: str) -> str:
+        """Queue bytes for writing and return the path they will be found at
+
+        Content already written during this session is not written again; the path of
+        the first identical file is returned instead.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        with self.lock:
+            existing = self.paths_by_digest.get(digest)
+            if existing:
+                self.deduplicated += 1
+                return existing
+            self.paths_by_digest[digest] = path
+            self.futures.append(self.executor.submit(self._write, data, path))
+        return path
+
+    def _write(self, data: bytes, path: str):
+        """Write a file atomically so readers never see a partial image"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+        with self.lock:
+            self.written += 1
+
+    def flush(self):
+        """Wait for every queued write, surfacing the first write error"""
+        with self.lock:
+            futures, self.futures = self.futures, []
+        for future in futures:
+            future.result()
+
+    def close(self):
+        """Flush pending writes and stop the thread pool"""
+        self.flush()
+        self.executor.shutdown(wait=True)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session):
+        """Finish writing before artifacts are pruned or reported"""
+        self.close()
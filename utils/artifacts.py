@@ -0,0 +1,33 @@
+"""Worker-aware artifact paths so parallel runs never write to the same files"""
+import os
+import re
+from datetime import datetime
+
+REPORTS_DIR = "reports"
+
+
+def worker_id() -> str:
+    """Get the pytest-xdist worker id, 'main' when running without -n"""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def artifact_dir(kind: str) -> str:
+    """Get the per-worker directory for an artifact kind, creating it if needed"""
+    path = os.path.join(REPORTS_DIR, kind, worker_id())
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def unique_timestamp() -> str:
+    """Timestamp with microseconds so artifacts from the same second never collide"""
+    return datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
+
+def safe_filename(name: str) -> str:
+    """Make a test name safe to use in a file name"""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "unnamed"
+
+
+def base_nodeid(nodeid: str) -> str:
+    """Node id without the @<group> suffix pytest-xdist adds under --dist loadgroup"""
+    return re.sub(r"@[^@\[\]:/]+$", "", nodeid)
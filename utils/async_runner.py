@@ -0,0 +1,67 @@
+"""Run scenarios concurrently as asyncio tasks on a single playwright.async_api browser"""
+import asyncio
+import os
+import time
+import traceback
+from dataclasses import dataclass
+
+from playwright.async_api import async_playwright
+
+DEFAULT_CONTEXT_OPTIONS = {
+    "viewport": {'width': 1920, 'height': 1080},
+    "ignore_https_errors": True,
+    "locale": "en-US",
+    "timezone_id": "America/New_York"
+}
+
+
+@dataclass
+class ScenarioResult:
+    """Outcome of one scenario run by the async backend"""
+    name: str
+    passed: bool
+    duration: float
+    error: str = ""
+
+
+async def _run_one(browser, name: str, scenario, semaphore: asyncio.Semaphore, context_options: dict):
+    """Run one scenario coroutine in its own browser context"""
+    async with semaphore:
+        start = time.perf_counter()
+        context = await browser.new_context(**context_options)
+        context.set_default_timeout(30000)
+        context.set_default_navigation_timeout(45000)
+        try:
+            page = await context.new_page()
+            await scenario(page)
+            return ScenarioResult(name, True, time.perf_counter() - start)
+        except Exception:
+            return ScenarioResult(name, False, time.perf_counter() - start, traceback.format_exc())
+        finally:
+            await context.close()
+
+
+async def run_scenarios(scenarios: list, concurrency: int = 4, browser_name: str = "chromium",
+                        headless: bool = True, context_options: dict = None) -> list:
+    """Run (name, coroutine function) scenarios, at most `concurrency` at a time, on one browser
+
+    Each coroutine function receives a fresh async Page in its own context.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    options = dict(DEFAULT_CONTEXT_OPTIONS, **(context_options or {}))
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, browser_name).launch(headless=headless)
+        try:
+            return await asyncio.gather(*(
+                _run_one(browser, name, scenario, semaphore, options) for name, scenario in scenarios
+            ))
+        finally:
+            await browser.close()
+
+
+def run(scenarios: list, concurrency: int = 4, browser_name: str = None, headless: bool = None) -> list:
+    """Synchronous entry point for run_scenarios, honouring the BROWSER and HEADLESS environment"""
+    browser_name = (browser_name or os.getenv("BROWSER", "chromium")).lower()
+    if headless is None:
+        headless = os.getenv("HEADLESS", "true").lower() == "true"
+    return asyncio.run(run_scenarios(scenarios, concurrency, browser_name, headless))
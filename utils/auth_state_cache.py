@@ -0,0 +1,57 @@
+"""Authenticated storage-state cache for skipping repeated UI logins"""
+import hashlib
+import json
+import os
+import shutil
+import time
+
+
+class AuthStateCache:
+    """Caches Playwright storage state per (user, base URL, browser) on disk"""
+
+    def __init__(self, directory: str = ".auth_cache", ttl_seconds: int = 1800):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _key(self, user: str, base_url: str, browser_name: str) -> str:
+        """Build a stable file-safe cache key"""
+        raw = f"{user}|{base_url}|{browser_name}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def state_path(self, user: str, base_url: str, browser_name: str) -> str:
+        """Get the storage state file path for a cache entry"""
+        return os.path.join(self.directory, f"{self._key(user, base_url, browser_name)}.json")
+
+    def get(self, user: str, base_url: str, browser_name: str):
+        """Return the cached storage state path if present and not expired"""
+        path = self.state_path(user, base_url, browser_name)
+        if not os.path.exists(path):
+            return None
+        if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+            self.invalidate(user, base_url, browser_name)
+            return None
+        return path
+
+    def save(self, context, user: str, base_url: str, browser_name: str) -> str:
+        """Persist the storage state of an authenticated browser context"""
+        path = self.state_path(user, base_url, browser_name)
+        state = context.storage_state()
+        # Write to a temp file first so parallel workers never read a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(state, file)
+        os.replace(tmp_path, path)
+        return path
+
+    def invalidate(self, user: str, base_url: str, browser_name: str):
+        """Drop a single cache entry, e.g. after the server rejected it"""
+        try:
+            os.remove(self.state_path(user, base_url, browser_name))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """Drop every cache entry"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory, exist_ok=True)
@@ -0,0 +1,183 @@
+"""Persistent parsed-feature cache and an indexed step lookup for pytest-bdd collection"""
+import hashlib
+import importlib
+import os
+import pickle
+import sys
+from importlib.metadata import version
+
+from pytest_bdd import feature as bdd_feature
+from pytest_bdd import parsers
+from pytest_bdd.compat import getfixturedefs
+
+# `from pytest_bdd import scenario` yields the scenario() function the package re-exports
+bdd_scenario = importlib.import_module("pytest_bdd.scenario")
+
+# Pickled features hold pytest-bdd model objects: any pytest-bdd or Python upgrade invalidates them
+_CACHE_VERSION = f"pytest-bdd-{version('pytest-bdd')}-py{sys.version_info[0]}.{sys.version_info[1]}"
+
+
+def _file_sha256(path: str) -> str:
+    """Content hash of a feature file"""
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+class FeatureCache:
+    """Parsed pytest-bdd features pickled across runs, keyed by path, mtime and content hash
+
+    Valid entries are loaded into pytest-bdd's own in-process feature dictionary before
+    the step_definitions modules call scenarios(), so unchanged files are never re-parsed.
+    The cache is a local pickle and is only ever read back by this project.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = {}
+        self.loaded = set()
+        self.dirty = False
+
+    def load(self) -> int:
+        """Load every still-valid cached feature into pytest-bdd, returning how many were reused"""
+        try:
+            with open(self.path, "rb") as file:
+                cached = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return 0
+        if cached.get("version") != _CACHE_VERSION:
+            return 0
+
+        for full_name, entry in cached["features"].items():
+            try:
+                stat = os.stat(full_name)
+            except OSError:
+                self.dirty = True
+                continue
+            if (stat.st_mtime_ns, stat.st_size) != (entry["mtime_ns"], entry["size"]):
+                # Touched but possibly unchanged, e.g. after a checkout: fall back to the hash
+                if _file_sha256(full_name) != entry["sha256"]:
+                    self.dirty = True
+                    continue
+                entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                self.dirty = True
+            self.entries[full_name] = entry
+            self.loaded.add(full_name)
+            bdd_feature.features.setdefault(full_name, entry["feature"])
+        return len(self.loaded)
+
+    def update(self) -> int:
+        """Add the features pytest-bdd parsed during this collection, returning how many were new"""
+        added = 0
+        for full_name, parsed in list(bdd_feature.features.items()):
+            if full_name in self.loaded:
+                continue
+            stat = os.stat(full_name)
+            self.entries[full_name] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": _file_sha256(full_name),
+                "feature": parsed
+            }
+            self.loaded.add(full_name)
+            self.dirty = True
+            added += 1
+        return added
+
+    def save(self):
+        """Atomically write the cache when anything changed"""
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            pickle.dump({"version": _CACHE_VERSION, "features": self.entries}, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, self.path)
+        self.dirty = False
+
+
+class StepIndex:
+    """Step definitions indexed once after collection instead of scanned for every step
+
+    Literal steps (plain string parsers) are found with a dictionary lookup. Parsed and
+    regex steps are matched against the pre-compiled parsers of their step type only, and
+    the result per step text is memoised. Fixture visibility is still checked per node so
+    step overrides in conftest.py and test modules behave exactly as before.
+    """
+
+    def __init__(self):
+        self.literal = {}
+        self.patterns = {}
+        self.matches = {}
+        self.built = False
+
+    def build(self, fixturemanager):
+        """Index every step fixture known to the fixture manager"""
+        self.literal.clear()
+        self.patterns.clear()
+        self.matches.clear()
+        order = 0
+        for fixturename, fixturedefs in list(fixturemanager._arg2fixturedefs.items()):
+            for fixturedef in fixturedefs:
+                context = getattr(fixturedef.func, "_pytest_bdd_step_context", None)
+                if context is None:
+                    continue
+                entry = (order, fixturename, fixturedef)
+                order += 1
+                if type(context.parser) is parsers.string:
+                    self.literal.setdefault((context.type, context.parser.name), []).append(entry)
+                else:
+                    self.patterns.setdefault(context.type, []).append((context.parser, entry))
+        self.built = True
+
+    def candidates(self, step) -> list:
+        """Step fixtures whose type and parser accept the step, in fixture-manager order"""
+        key = (step.type, step.name)
+        if key not in self.matches:
+            found = self.literal.get(key, []) + self.literal.get((None, step.name), [])
+            for step_type in (step.type, None):
+                found.extend(entry for parser, entry in self.patterns.get(step_type, []) if parser.is_matching(step.name))
+            self.matches[key] = sorted(found, key=lambda entry: entry[0])
+        return self.matches[key]
+
+    def find_fixturedefs_for_step(self, step, fixturemanager, node):
+        """Drop-in replacement for pytest_bdd.scenario.find_fixturedefs_for_step"""
+        for _, fixturename, fixturedef in self.candidates(step):
+            if fixturedef in (getfixturedefs(fixturemanager, fixturename, node) or []):
+                yield fixturedef
+
+
+class BddCollectionPlugin:
+    """Pytest plugin wiring the feature cache and the step index into a session"""
+
+    def __init__(self, cache_path: str = None, step_index: bool = True, save: bool = True):
+        self.cache = FeatureCache(cache_path) if cache_path else None
+        self.index = StepIndex() if step_index else None
+        self.save = save
+        self._original_finder = None
+
+    def pytest_collection(self, session):
+        """Pre-load cached features before the step_definitions modules are imported"""
+        if self.cache:
+            self.cache.load()
+
+    def pytest_collection_finish(self, session):
+        """Store newly parsed features and build the step index from the collected fixtures"""
+        if self.cache:
+            self.cache.update()
+            if self.save:
+                self.cache.save()
+        if self.index:
+            if not hasattr(bdd_scenario, "find_fixturedefs_for_step"):
+                raise RuntimeError(
+                    "pytest_bdd.scenario.find_fixturedefs_for_step no longer exists in this pytest-bdd version; "
+                    "update utils/bdd_collection.py or disable collection_cache.step_index"
+                )
+            self.index.build(session._fixturemanager)
+            self._original_finder = bdd_scenario.find_fixturedefs_for_step
+            bdd_scenario.find_fixturedefs_for_step = self.index.find_fixturedefs_for_step
+
+    def pytest_unconfigure(self, config):
+        """Restore pytest-bdd's own step lookup"""
+        if self._original_finder is not None:
+            bdd_scenario.find_fixturedefs_for_step = self._original_finder
+            self._original_finder = None
@@ -0,0 +1,263 @@
+"""Long-lived Playwright browser server shared by pytest invocations
+
+A small daemon runs `playwright launch-server` for one engine, restarts it when it crashes
+or stops answering, and shuts down after a period without tests. The `browser` fixture
+connects to its websocket endpoint instead of launching a browser.
+
+    python -m utils.browser_server start [--browser chromium] [--idle 900]
+    python -m utils.browser_server status
+    python -m utils.browser_server stop [--browser chromium]
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlparse
+
+STATE_DIR = ".browser_server"
+
+# launch-server takes BrowserType.launchServer options, i.e. their JavaScript names
+_JS_OPTION_NAMES = {
+    "headless": "headless",
+    "args": "args",
+    "timeout": "timeout",
+    "handle_sigterm": "handleSIGTERM",
+    "handle_sigint": "handleSIGINT",
+    "handle_sighup": "handleSIGHUP",
+    "channel": "channel",
+    "executable_path": "executablePath"
+}
+
+
+def _state_path(state_dir: str, browser_name: str, suffix: str = "json") -> str:
+    """Path of a per-browser state, heartbeat or lock file"""
+    return os.path.join(state_dir, f"{browser_name}.{suffix}")
+
+
+def _reachable(endpoint: str, timeout: float = 1.0) -> bool:
+    """Whether the server accepts TCP connections on its websocket port"""
+    parsed = urlparse(endpoint)
+    try:
+        with socket.create_connection((parsed.hostname, parsed.port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this pid is running"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_state(browser_name: str, state_dir: str = STATE_DIR) -> dict:
+    """State written by the daemon: its pid, the server pid and the websocket endpoint"""
+    try:
+        with open(_state_path(state_dir, browser_name), "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def touch(browser_name: str, state_dir: str = STATE_DIR):
+    """Record that a test used the server, postponing the idle shutdown"""
+    heartbeat = _state_path(state_dir, browser_name, "heartbeat")
+    try:
+        os.utime(heartbeat)
+    except FileNotFoundError:
+        open(heartbeat, "a").close()
+
+
+def endpoint(browser_name: str, state_dir: str = STATE_DIR) -> str:
+    """Websocket endpoint of a healthy running server, or None"""
+    state = read_state(browser_name, state_dir)
+    if not state or not _pid_alive(state["pid"]) or not _reachable(state["endpoint"]):
+        return None
+    touch(browser_name, state_dir)
+    return state["endpoint"]
+
+
+def launch_server_config(launch_options: dict) -> dict:
+    """Translate Python launch options into a launch-server config file"""
+    return {_JS_OPTION_NAMES[key]: value for key, value in launch_options.items() if key in _JS_OPTION_NAMES}
+
+
+def ensure_running(browser_name: str, launch_options: dict = None, idle_seconds: int = 900,
+                   state_dir: str = STATE_DIR, timeout: float = 60) -> str:
+    """Endpoint of the server for an engine, starting the daemon first when none is running
+
+    A lock file makes concurrent callers such as xdist workers start a single daemon.
+    Returns None when the server did not come up within the timeout.
+    """
+    current = endpoint(browser_name, state_dir)
+    if current:
+        return current
+
+    os.makedirs(state_dir, exist_ok=True)
+    lock = _state_path(state_dir, browser_name, "lock")
+    try:
+        # A lock older than the start-up timeout belongs to a daemon that died starting
+        if time.time() - os.path.getmtime(lock) > timeout:
+            os.remove(lock)
+    except OSError:
+        pass
+    try:
+        os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        owner = True
+    except FileExistsError:
+        owner = False
+
+    if owner:
+        config_path = _state_path(state_dir, browser_name, "config.json")
+        with open(config_path, "w") as file:
+            json.dump(launch_server_config(launch_options or {}), file)
+        log = open(_state_path(state_dir, browser_name, "log"), "a")
+        subprocess.Popen(
+            [sys.executable, "-m", "utils.browser_server", "serve", "--browser", browser_name,
+             "--config", config_path, "--idle", str(idle_seconds), "--state-dir", state_dir],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, start_new_session=True
+        )
+        log.close()
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        current = endpoint(browser_name, state_dir)
+        if current:
+            return current
+        time.sleep(0.25)
+    return None
+
+
+def stop(browser_name: str, state_dir: str = STATE_DIR) -> bool:
+    """Ask a running daemon to shut its server down"""
+    state = read_state(browser_name, state_dir)
+    if not state or not _pid_alive(state["pid"]):
+        return False
+    os.kill(state["pid"], signal.SIGTERM)
+    return True
+
+
+class BrowserServerDaemon:
+    """Keeps one `playwright launch-server` process healthy until it has been idle long enough"""
+
+    def __init__(self, browser_name: str, config_path: str, idle_seconds: int, state_dir: str = STATE_DIR,
+                 check_interval: float = 5.0):
+        self.browser_name = browser_name
+        self.config_path = config_path
+        self.idle_seconds = idle_seconds
+        self.state_dir = state_dir
+        self.check_interval = check_interval
+        self.process = None
+        self.endpoint = None
+        self.restarts = 0
+        self.stopping = False
+
+    def _start_server(self):
+        """Start the browser server and read the websocket endpoint it prints"""
+        command = [sys.executable, "-m", "playwright", "launch-server", "--browser", self.browser_name]
+        if self.config_path:
+            command += ["--config", self.config_path]
+        self.process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+        line = self.process.stdout.readline().strip()
+        if not line.startswith("ws"):
+            self.process.kill()
+            raise RuntimeError(f"playwright launch-server did not print an endpoint: {line!r}")
+        self.endpoint = line
+        with open(_state_path(self.state_dir, self.browser_name), "w") as file:
+            json.dump({
+                "pid": os.getpid(),
+                "server_pid": self.process.pid,
+                "endpoint": self.endpoint,
+                "started": time.time(),
+                "restarts": self.restarts
+            }, file)
+        touch(self.browser_name, self.state_dir)
+        print(f"{self.browser_name} server listening on {self.endpoint}", flush=True)
+
+    def _stop_server(self):
+        """Terminate the browser server process"""
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+    def _idle_for(self) -> float:
+        """Seconds since a test last used the server"""
+        try:
+            return time.time() - os.path.getmtime(_state_path(self.state_dir, self.browser_name, "heartbeat"))
+        except OSError:
+            return 0.0
+
+    def serve(self):
+        """Run until stopped or idle, restarting the server whenever its health check fails"""
+        signal.signal(signal.SIGTERM, lambda *_: setattr(self, "stopping", True))
+        signal.signal(signal.SIGINT, lambda *_: setattr(self, "stopping", True))
+        try:
+            self._start_server()
+        finally:
+            try:
+                os.remove(_state_path(self.state_dir, self.browser_name, "lock"))
+            except OSError:
+                pass
+        try:
+            while not self.stopping:
+                time.sleep(self.check_interval)
+                if self.process.poll() is not None or not _reachable(self.endpoint):
+                    self.restarts += 1
+                    print(f"{self.browser_name} server failed its health check, restart #{self.restarts}", flush=True)
+                    self._stop_server()
+                    self._start_server()
+                elif self.idle_seconds and self._idle_for() > self.idle_seconds:
+                    print(f"{self.browser_name} server idle for {self.idle_seconds}s, shutting down", flush=True)
+                    break
+        finally:
+            self._stop_server()
+            try:
+                os.remove(_state_path(self.state_dir, self.browser_name))
+            except OSError:
+                pass
+
+
+def main(argv=None) -> int:
+    """Command line entry point: start, stop, status or serve (the daemon itself)"""
+    parser = argparse.ArgumentParser(description="Shared Playwright browser server daemon")
+    parser.add_argument("command", choices=["start", "stop", "status", "serve"])
+    parser.add_argument("--browser", default=os.getenv("BROWSER", "chromium"))
+    parser.add_argument("--idle", type=int, default=900, help="Shut down after this many seconds without tests")
+    parser.add_argument("--config", default=None, help="launch-server config file (serve only)")
+    parser.add_argument("--state-dir", default=STATE_DIR)
+    args = parser.parse_args(argv)
+    browser_names = [name.strip() for name in args.browser.split(",") if name.strip()]
+
+    if args.command == "serve":
+        BrowserServerDaemon(browser_names[0], args.config, args.idle, args.state_dir).serve()
+        return 0
+    exit_code = 0
+    for browser_name in browser_names:
+        if args.command == "start":
+            current = ensure_running(browser_name, {"headless": True}, args.idle, args.state_dir)
+            print(f"{browser_name}: {current or 'failed to start, see ' + _state_path(args.state_dir, browser_name, 'log')}")
+            exit_code = exit_code or (0 if current else 1)
+        elif args.command == "stop":
+            print(f"{browser_name}: {'stopping' if stop(browser_name, args.state_dir) else 'not running'}")
+        else:
+            state = read_state(browser_name, args.state_dir)
+            current = endpoint(browser_name, args.state_dir) if state else None
+            print(f"{browser_name}: " + (f"running at {current}, {state['restarts']} restarts" if current else "not running"))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
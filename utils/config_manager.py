@@ -1,5 +1,4 @@
 """Configuration Manager for reading config.yaml"""
-import yaml
 import os
 
 
@@ -8,10 +7,18 @@ class ConfigManager:
     
     def __init__(self):
         self.config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yaml')
-        self.config = self._load_config()
+        self._config = None
+    
+    @property
+    def config(self):
+        """Configuration dict, read from config.yaml on first use only"""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
     
     def _load_config(self):
         """Load configuration from yaml file"""
+        import yaml
         try:
             with open(self.config_path, 'r') as file:
                 return yaml.safe_load(file)
@@ -24,10 +31,179 @@ class ConfigManager:
         """Get login page base URL"""
         return self.config.get('login_page_base_url', 'https://www.saucedemo.com/')
     
+    def get_auth_cache_settings(self):
+        """Get authenticated storage-state cache settings"""
+        settings = {
+            'enabled': True,
+            'user': 'standard_user',
+            'ttl_seconds': 1800,
+            'directory': '.auth_cache',
+            'skip_tags': ['auth', 'data_driven']
+        }
+        settings.update(self.config.get('auth_cache') or {})
+        return settings
+    
+    def get_network_settings(self):
+        """Get HAR record/replay network settings"""
+        settings = {
+            'mode': 'live',
+            'har_directory': 'recordings/har',
+            'unmatched': 'abort'
+        }
+        settings.update(self.config.get('network') or {})
+        return settings
+    
+    def get_resource_blocking_settings(self):
+        """Get request blocking policy settings"""
+        settings = {
+            'enabled': False,
+            'resource_types': [],
+            'url_patterns': [],
+            'allowed_domains': [],
+            'tag_overrides': {},
+            'size_table': 'reports/resource_sizes.json'
+        }
+        settings.update(self.config.get('resource_blocking') or {})
+        return settings
+    
+    def get_context_pool_settings(self):
+        """Get browser context pool settings"""
+        settings = {
+            'enabled': True,
+            'size': 2,
+            'max_uses': 20
+        }
+        settings.update(self.config.get('context_pool') or {})
+        return settings
+    
+    def get_duration_history_settings(self):
+        """Get test duration history and scheduling settings"""
+        settings = {
+            'enabled': True,
+            'path': 'reports/history/durations.sqlite',
+            'keep_runs': 20,
+            'longest_first': True,
+            'drift_percentile': 95,
+            'min_samples': 5
+        }
+        settings.update(self.config.get('duration_history') or {})
+        return settings
+    
+    def get_step_timing_settings(self):
+        """Get pytest-bdd step timing settings"""
+        settings = {
+            'enabled': True,
+            'page_actions': False,
+            'top': 15
+        }
+        settings.update(self.config.get('step_timing') or {})
+        return settings
+    
+    def get_collection_cache_settings(self):
+        """Get parsed-feature cache and step index settings"""
+        settings = {
+            'enabled': True,
+            'feature_cache': True,
+            'path': '.pytest_cache/bdd/features.pickle',
+            'step_index': True
+        }
+        settings.update(self.config.get('collection_cache') or {})
+        return settings
+    
+    def get_impact_settings(self):
+        """Get scenario impact index and change-based selection settings"""
+        settings = {
+            'enabled': True,
+            'path': 'reports/history/impact.json',
+            'full_run_patterns': ['conftest.py', 'pages/base_page.py', 'pages/wait_strategies.py', 'utils/*',
+                                  'config.yaml', 'requirements.txt', 'pyproject.toml'],
+            'ignore_patterns': ['*.md', 'docs/*', '.github/*', '.gitignore', 'reports/*']
+        }
+        settings.update(self.config.get('impact') or {})
+        return settings
+    
+    def get_rerun_settings(self):
+        """Get end-of-session retry and failure budget settings"""
+        settings = {
+            'retries': 0,
+            'failure_budget': 0
+        }
+        settings.update(self.config.get('reruns') or {})
+        return settings
+    
+    def get_browser_server_settings(self):
+        """Get settings for connecting to a shared long-lived browser server"""
+        settings = {
+            'enabled': False,
+            'auto_start': True,
+            'directory': '.browser_server',
+            'idle_seconds': 900,
+            'start_timeout_seconds': 60
+        }
+        settings.update(self.config.get('browser_server') or {})
+        return settings
+    
+    def get_test_data_settings(self):
+        """Get the test data workbook and its row cache location"""
+        settings = {
+            'workbook': 'TestData/TestCaseDocument.xlsx',
+            'cache_dir': '.pytest_cache/test_data'
+        }
+        settings.update(self.config.get('test_data') or {})
+        return settings
+    
+    def get_artifact_settings(self):
+        """Get trace, video and screenshot retention settings"""
+        settings = {
+            'trace': 'retain-on-failure',
+            'trace_last_steps': 0,
+            'video': 'retain-on-failure',
+            'video_size': {'width': 1280, 'height': 720},
+            'screenshot': 'on-failure',
+            'screenshot_format': 'jpeg',
+            'screenshot_quality': 70,
+            'writer_threads': 2,
+            'max_disk_mb': 500,
+            'tag_overrides': {}
+        }
+        settings.update(self.config.get('artifacts') or {})
+        return settings
+    
+    def get_page_metrics_settings(self):
+        """Get browser performance metrics settings and budgets"""
+        settings = {
+            'enabled': False,
+            'cdp': True,
+            'budgets': {}
+        }
+        settings.update(self.config.get('page_metrics') or {})
+        return settings
+    
+    def get_benchmark_settings(self):
+        """Get framework overhead benchmark settings"""
+        settings = {
+            'repeats': 5,
+            'history': 'reports/benchmarks/history.json',
+            'baseline_runs': 5,
+            'threshold_pct': 25,
+            'min_delta_ms': 5
+        }
+        settings.update(self.config.get('benchmarks') or {})
+        return settings
+    
     def get_config_value(self, key, default=None):
         """Get any configuration value by key"""
         return self.config.get(key, default)
 
 
+def resolve_tag_overrides(settings: dict, tags) -> dict:
+    """Apply the tag_overrides of every matching scenario tag on top of the base settings"""
+    resolved = {key: value for key, value in settings.items() if key != 'tag_overrides'}
+    overrides = settings.get('tag_overrides') or {}
+    for tag in tags:
+        resolved.update(overrides.get(tag) or {})
+    return resolved
+
+
 # Global config instance
 config = ConfigManager()
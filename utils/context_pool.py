@@ -0,0 +1,83 @@
+"""Pool of pre-created browser contexts that are reset between tests"""
+import json
+
+from utils.state_seeder import apply_storage_state
+
+_CLEAR_STORAGE_SCRIPT = "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+
+
+class ContextPool:
+    """Leases browser contexts from a pre-warmed pool instead of creating one per test
+
+    Playwright's sync API is bound to the thread that started it, so contexts are
+    created eagerly at pool start-up and replenished on release rather than on a
+    background thread.
+    """
+
+    def __init__(self, browser, context_options: dict, size: int = 2, max_uses: int = 20, setup=None):
+        self.browser = browser
+        self.context_options = context_options
+        self.size = size
+        self.max_uses = max_uses
+        self.setup = setup
+        self.idle = []
+        self.uses = {}
+
+    def _create(self):
+        """Create a fresh context with the pool's options"""
+        context = self.browser.new_context(**self.context_options)
+        if self.setup:
+            self.setup(context)
+        self.uses[context] = 0
+        return context
+
+    def prewarm(self):
+        """Fill the pool up to its configured size"""
+        while len(self.idle) < self.size:
+            self.idle.append(self._create())
+
+    def lease(self, storage_state: str = None):
+        """Take a context and a new page from the pool, optionally applying a storage state file"""
+        context = self.idle.pop() if self.idle else self._create()
+        self.uses[context] += 1
+
+        page = context.new_page()
+        if storage_state:
+            with open(storage_state, 'r') as file:
+                apply_storage_state(context, page, json.load(file))
+        return context, page
+
+    def _reset(self, context):
+        """Clear cookies, storage, permissions and routes so the context can be reused"""
+        for page in context.pages:
+            page.evaluate(_CLEAR_STORAGE_SCRIPT)
+            page.close()
+        context.clear_cookies()
+        context.clear_permissions()
+        context.unroute("**/*")
+
+    def _discard(self, context):
+        """Close a context and forget it"""
+        self.uses.pop(context, None)
+        try:
+            context.close()
+        except Exception:
+            pass
+
+    def release(self, context, discard: bool = False):
+        """Return a context to the pool, or throw it away when its test failed or it is worn out"""
+        if discard or self.uses.get(context, 0) >= self.max_uses:
+            self._discard(context)
+        else:
+            try:
+                self._reset(context)
+                self.idle.append(context)
+            except Exception:
+                self._discard(context)
+        self.prewarm()
+
+    def close(self):
+        """Close every context owned by the pool"""
+        for context in list(self.uses):
+            self._discard(context)
+        self.idle = []
@@ -0,0 +1,160 @@
+"""Persistent per-phase test duration history for scheduling and drift detection"""
+import os
+import sqlite3
+from datetime import datetime
+
+from utils.artifacts import base_nodeid
+
+
+def percentile(values: list, pct: float) -> float:
+    """Linear-interpolated percentile of a list of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * pct / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class DurationHistory:
+    """Stores setup/call/teardown durations per scenario node id and browser in SQLite"""
+
+    def __init__(self, path: str = "reports/history/durations.sqlite", keep_runs: int = 20):
+        self.path = path
+        self.keep_runs = keep_runs
+        self._created = False
+
+    def _connect(self):
+        """Open a connection, waiting politely if another process is writing"""
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _create(self):
+        """Create the database on the first write, so runs that record nothing leave no file"""
+        if self._created:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS durations ("
+                "run_id TEXT, nodeid TEXT, browser TEXT, phase TEXT, seconds REAL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS durations_key ON durations (nodeid, browser, run_id)"
+            )
+        self._created = True
+
+    def record(self, rows: list, run_id: str = None):
+        """Store (nodeid, browser, phase, seconds) rows for one run and prune old runs"""
+        run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self._create()
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT INTO durations (run_id, nodeid, browser, phase, seconds) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, nodeid, browser, phase, seconds) for nodeid, browser, phase, seconds in rows]
+            )
+            connection.execute(
+                "DELETE FROM durations WHERE run_id NOT IN "
+                "(SELECT DISTINCT run_id FROM durations ORDER BY run_id DESC LIMIT ?)",
+                (self.keep_runs,)
+            )
+
+    def totals(self, browser: str) -> dict:
+        """Get the total (all phases) duration of every past run, per node id"""
+        totals = {}
+        if not self._created and not os.path.exists(self.path):
+            return totals
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT nodeid, SUM(seconds) FROM durations WHERE browser = ? "
+                "GROUP BY run_id, nodeid ORDER BY run_id",
+                (browser,)
+            ).fetchall()
+        for nodeid, seconds in rows:
+            totals.setdefault(nodeid, []).append(seconds)
+        return totals
+
+    def expected_durations(self, browser: str) -> dict:
+        """Get the median historical duration per node id"""
+        return {nodeid: percentile(values, 50) for nodeid, values in self.totals(browser).items()}
+
+    def drifted(self, current: dict, browser: str, pct: float = 95, min_samples: int = 5) -> list:
+        """Find node ids whose current duration exceeds the given percentile of their history
+
+        Returns (nodeid, current seconds, threshold seconds) tuples, slowest drift first.
+        """
+        drifted = []
+        for nodeid, values in self.totals(browser).items():
+            if nodeid not in current or len(values) < min_samples:
+                continue
+            threshold = percentile(values, pct)
+            if current[nodeid] > threshold:
+                drifted.append((nodeid, current[nodeid], threshold))
+        return sorted(drifted, key=lambda entry: entry[1] - entry[2], reverse=True)
+
+
+class DurationHistoryPlugin:
+    """Pytest plugin that orders tests longest-first and records their phase durations
+
+    Durations are kept per browser, taken from each test's "browser" user property so a
+    multi-browser run records every engine under its own name.
+    """
+
+    def __init__(self, history: DurationHistory, browser: str, record: bool = True,
+                 longest_first: bool = True, drift_percentile: float = 95, min_samples: int = 5):
+        self.history = history
+        self.browser = browser
+        self.record = record
+        self.longest_first = longest_first
+        self.drift_percentile = drift_percentile
+        self.min_samples = min_samples
+        self.rows = []
+        self.drift = []
+
+    def _browser_of(self, user_properties: list) -> str:
+        """Browser a test ran on, the default browser when it has no browser property"""
+        return dict(user_properties).get("browser", self.browser)
+
+    def pytest_collection_modifyitems(self, items):
+        """Run the historically slowest scenarios first, unknown ones before all of them"""
+        if not self.longest_first:
+            return
+        expected = {}
+        for item in items:
+            browser = self._browser_of(item.user_properties)
+            if browser not in expected:
+                expected[browser] = self.history.expected_durations(browser)
+        items.sort(key=lambda item: -expected[self._browser_of(item.user_properties)].get(
+            base_nodeid(item.nodeid), float("inf")))
+
+    def pytest_runtest_logreport(self, report):
+        """Remember the duration of every setup, call and teardown phase of first attempts"""
+        # Retries (utils/rerun_engine.py) would count a scenario twice in one run
+        if dict(report.user_properties).get("attempt", 1) > 1:
+            return
+        if self.record and not report.skipped:
+            self.rows.append((base_nodeid(report.nodeid), self._browser_of(report.user_properties),
+                              report.when, report.duration))
+
+    def pytest_sessionfinish(self, session):
+        """Flag drifting scenarios, then persist this run"""
+        if not self.record or not self.rows:
+            return
+        current = {}
+        for nodeid, browser, _, seconds in self.rows:
+            current.setdefault(browser, {})
+            current[browser][nodeid] = current[browser].get(nodeid, 0.0) + seconds
+        for browser, durations in sorted(current.items()):
+            drifted = self.history.drifted(durations, browser, self.drift_percentile, self.min_samples)
+            self.drift.extend((nodeid, browser, seconds, threshold) for nodeid, seconds, threshold in drifted)
+        self.history.record(self.rows)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Warn about scenarios slower than their usual duration"""
+        if not self.drift:
+            return
+        terminalreporter.write_sep("=", f"duration drift (> p{self.drift_percentile:g} of history)", yellow=True)
+        for nodeid, browser, seconds, threshold in self.drift:
+            terminalreporter.write_line(
+                f"{seconds:>8.2f}s  (p{self.drift_percentile:g} {threshold:.2f}s)  {nodeid}  [{browser}]"
+            )
@@ -0,0 +1,286 @@
+"""Scenario impact index recorded during runs, and change-based test selection"""
+import ast
+import fnmatch
+import functools
+import inspect
+import json
+import os
+import re
+import subprocess
+
+import pytest
+
+from pages.base_page import BasePage
+from utils.artifacts import base_nodeid
+
+_HUNK_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def _relative(path: str, root: str) -> str:
+    """Path relative to the project root with forward slashes, as git prints them"""
+    return os.path.relpath(os.path.abspath(path), root).replace(os.sep, "/")
+
+
+def python_symbols(source: str) -> list:
+    """Top-level functions and class methods of a module as (qualname, first line, last line)
+
+    Nested functions are attributed to their enclosing function, the granularity recorded
+    by the index.
+    """
+    symbols = []
+
+    def visit(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                first = min([child.lineno] + [decorator.lineno for decorator in child.decorator_list])
+                symbols.append((prefix + child.name, first, child.end_lineno))
+            elif isinstance(child, ast.ClassDef):
+                visit(child, prefix + child.name + ".")
+
+    visit(ast.parse(source), "")
+    return symbols
+
+
+def changed_lines(ref: str, root: str) -> dict:
+    """Files changed since a git ref, committed or not, mapped to changed new-file line numbers
+
+    The diff starts at the merge base of the ref and HEAD, so changes that landed on the ref
+    after the branch point are not attributed to this branch. A value of None means the
+    whole file is affected: it was added, deleted, renamed, is binary or untracked.
+    """
+    def git(*args):
+        result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+        return result.stdout
+
+    top = git("rev-parse", "--show-toplevel").strip()
+    base = git("merge-base", ref, "HEAD").strip()
+    return _relative_changes(
+        parse_diff(git("diff", "-U0", "--no-color", "--no-ext-diff", "--no-renames", base, "--")),
+        git("diff", "--name-only", "--no-renames", base, "--").splitlines(),
+        git("ls-files", "--others", "--exclude-standard").splitlines(),
+        top, root
+    )
+
+
+def parse_diff(diff: str) -> dict:
+    """Changed new-file line numbers per path of a zero-context `git diff`, None for whole files"""
+    changes = {}
+    old_path = path = None
+    for line in diff.splitlines():
+        if line.startswith("--- "):
+            old_path = None if line == "--- /dev/null" else line[6:]
+        elif line.startswith("+++ "):
+            path = None if line == "+++ /dev/null" else line[6:]
+            if path is None or old_path is None or old_path != path:
+                for whole in (old_path, path):
+                    if whole:
+                        changes[whole] = None
+            elif path not in changes:
+                changes[path] = set()
+        elif line.startswith("@@") and path and changes.get(path) is not None:
+            match = _HUNK_RE.match(line)
+            start, count = int(match.group(1)), int(match.group(2) or 1)
+            # Pure deletions (count 0) touch the line the removed block sat next to
+            changes[path].update(range(start, start + max(count, 1)))
+    return changes
+
+
+def _relative_changes(changes: dict, changed_paths: list, untracked: list, top: str, root: str) -> dict:
+    """Add whole-file changes the line diff has no hunks for and make every path rootdir-relative"""
+    # Binary files and mode-only changes have no ---/+++ lines
+    for changed in changed_paths:
+        changes.setdefault(changed, None)
+    for changed in untracked:
+        changes[changed] = None
+    # git prints paths relative to the repository, the index uses the pytest rootdir
+    return {_relative(os.path.join(top, changed), root): lines for changed, lines in changes.items()}
+
+
+def _recorded(function, symbol: str, touch):
+    """Wrap a function so every call reports its symbol first"""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        touch(symbol)
+        return function(*args, **kwargs)
+    return wrapper
+
+
+class ImpactIndex:
+    """Files and symbols (step functions, page object methods) each test touched in its last run"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tests = {}
+        if os.path.exists(path):
+            with open(path, "r") as file:
+                self.tests = json.load(file)
+
+    def update(self, nodeid: str, files: list, symbols: list):
+        """Replace the record of one test"""
+        self.tests[nodeid] = {"files": sorted(set(files)), "symbols": sorted(set(symbols))}
+
+    def save(self):
+        """Write the index"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w") as file:
+            json.dump(self.tests, file, indent=1, sort_keys=True)
+
+    def affected(self, changes: dict, root: str, full_run_patterns: list, ignore_patterns: list) -> tuple:
+        """Node ids affected by the changes, or (None, reason) when everything must run"""
+        if not self.tests:
+            return None, "no impact index has been recorded yet"
+
+        touched_files, touched_symbols = set(), set()
+        for path, lines in changes.items():
+            if any(fnmatch.fnmatch(path, pattern) for pattern in ignore_patterns):
+                continue
+            if any(fnmatch.fnmatch(path, pattern) for pattern in full_run_patterns):
+                return None, f"{path} affects every scenario"
+            if not path.endswith((".py", ".feature")):
+                return None, f"{path} is not covered by the impact index"
+            if lines is None or not path.endswith(".py"):
+                touched_files.add(path)
+                continue
+            try:
+                with open(os.path.join(root, path), "r", encoding="utf-8") as file:
+                    symbols = python_symbols(file.read())
+            except (OSError, SyntaxError):
+                touched_files.add(path)
+                continue
+            hit = {name for name, first, last in symbols if any(first <= line <= last for line in lines)}
+            inside = {line for line in lines for _, first, last in symbols if first <= line <= last}
+            if lines - inside:
+                # Module or class level change: imports, locators, scenarios() calls
+                touched_files.add(path)
+            touched_symbols.update(f"{path}::{name}" for name in hit)
+
+        selected = set()
+        for nodeid, record in self.tests.items():
+            files = set(record["files"]) | {symbol.split("::", 1)[0] for symbol in record["symbols"]}
+            if files & touched_files or touched_symbols.intersection(record["symbols"]):
+                selected.add(nodeid)
+        return selected, None
+
+
+class ImpactPlugin:
+    """Records what every test touches and, with --changed-since, deselects unaffected tests"""
+
+    def __init__(self, index: ImpactIndex, root: str, changed_since: str = None, full_run_patterns: list = (),
+                 ignore_patterns: list = (), record: bool = True, controller: bool = True):
+        self.index = index
+        self.root = root
+        self.changed_since = changed_since
+        self.full_run_patterns = list(full_run_patterns)
+        self.ignore_patterns = list(ignore_patterns)
+        self.record = record
+        self.controller = controller
+        self.summary = None
+        self.nothing_affected = False
+        self._current = None
+        self._instrumented = []
+        self._classes = set()
+        self._updated = False
+
+    def _touch(self, symbol: str):
+        """Note a symbol as used by the running test"""
+        if self._current is not None:
+            self._current.add(symbol)
+
+    def _symbol(self, function, qualname: str = None) -> str:
+        """Index key of a function: relative source file and qualified name"""
+        return f"{_relative(inspect.getsourcefile(function), self.root)}::{qualname or function.__qualname__}"
+
+    def _instrument(self, cls):
+        """Wrap the methods a page object class defines so calls are recorded"""
+        if cls in self._classes:
+            return
+        self._classes.add(cls)
+        for name, member in list(vars(cls).items()):
+            if not inspect.isfunction(member):
+                continue
+            symbol = self._symbol(member, f"{cls.__qualname__}.{name}")
+            setattr(cls, name, _recorded(member, symbol, self._touch))
+            self._instrumented.append((cls, name, member))
+        for subclass in cls.__subclasses__():
+            self._instrument(subclass)
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        """Keep only the tests affected by the changes since --changed-since"""
+        if not self.changed_since:
+            return
+        try:
+            changes = changed_lines(self.changed_since, self.root)
+        except ValueError as e:
+            raise pytest.UsageError(f"--changed-since: {e}")
+        selected, reason = self.index.affected(changes, self.root, self.full_run_patterns, self.ignore_patterns)
+        if selected is None:
+            self.summary = f"running all {len(items)} tests: {reason}"
+            return
+        # Tests missing from the index are new or renamed and always run
+        keep, dropped = [], []
+        for item in items:
+            nodeid = base_nodeid(item.nodeid)
+            affected = nodeid in selected or nodeid not in self.index.tests
+            (keep if affected else dropped).append(item)
+        if dropped:
+            config.hook.pytest_deselected(items=dropped)
+            items[:] = keep
+        self.nothing_affected = not keep
+        self.summary = (f"{len(keep)} of {len(keep) + len(dropped)} tests affected by "
+                        f"{len(changes)} changed files since {self.changed_since}")
+
+    def pytest_collection_finish(self, session):
+        """Instrument the page objects once every step module has imported them"""
+        if self.record:
+            self._instrument(BasePage)
+
+    def pytest_runtest_setup(self, item):
+        """Start recording a test with its own module"""
+        if self.record:
+            self._current = {f"file:{_relative(str(item.path), self.root)}"}
+
+    def pytest_bdd_before_scenario(self, request, feature, scenario):
+        """Record the feature file a scenario comes from"""
+        self._touch(f"file:{_relative(feature.filename, self.root)}")
+
+    def pytest_bdd_before_step(self, request, feature, scenario, step, step_func):
+        """Record the step definition function"""
+        self._touch(self._symbol(step_func))
+
+    def pytest_runtest_teardown(self, item):
+        """Attach what the test touched to its teardown report, which also reaches the xdist controller"""
+        if self._current is not None:
+            item.user_properties.append(("impact", sorted(self._current)))
+            self._current = None
+
+    def pytest_runtest_logreport(self, report):
+        """Fold the recorded touches into the index"""
+        if not self.controller or report.when != "teardown":
+            return
+        for key, touched in report.user_properties:
+            if key == "impact":
+                files = [entry[5:] for entry in touched if entry.startswith("file:")]
+                symbols = [entry for entry in touched if not entry.startswith("file:")]
+                self.index.update(base_nodeid(report.nodeid), files, symbols)
+                self._updated = True
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        """Persist the index; a change that affects no scenario is a success, not an empty run"""
+        if self.nothing_affected and exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+            session.exitstatus = pytest.ExitCode.OK
+        if self.controller and self._updated:
+            self.index.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Say how many tests the change-based selection kept"""
+        if self.summary and self.controller:
+            terminalreporter.write_sep("=", f"impact: {self.summary}")
+
+    def pytest_unconfigure(self, config):
+        """Restore the original page object methods"""
+        for cls, name, original in reversed(self._instrumented):
+            setattr(cls, name, original)
+        self._instrumented.clear()
+        self._classes.clear()
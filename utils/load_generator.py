@@ -0,0 +1,217 @@
+"""Virtual-user load generation on the async Playwright backend with streaming statistics"""
+import asyncio
+import json
+import math
+import os
+import re
+import time
+
+from playwright.async_api import async_playwright
+
+from utils.async_runner import DEFAULT_CONTEXT_OPTIONS
+
+# A virtual user whose iteration failed waits before retrying, doubling up to the cap
+FAILURE_BACKOFF_SECONDS = 0.5
+MAX_FAILURE_BACKOFF_SECONDS = 10.0
+
+# Action recording whole journeys; failures outside a timed action are counted against it
+ITERATION = "iteration"
+
+
+def parse_duration(value: str) -> float:
+    """Parse durations such as '90', '60s', '5m' or '1h' into seconds"""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*", str(value))
+    if not match:
+        raise ValueError(f"Invalid duration '{value}', expected e.g. 60s, 5m or 1h")
+    number, unit = float(match.group(1)), match.group(2) or "s"
+    return number * {"s": 1, "m": 60, "h": 3600}[unit]
+
+
+class LatencyHistogram:
+    """Fixed-size log-bucket histogram, so percentiles never need the raw samples"""
+
+    GROWTH = 1.05
+    MAX_BUCKET = 400  # 1.05 ** 400 ms is far beyond any sensible timeout
+
+    def __init__(self):
+        self.counts = [0] * (self.MAX_BUCKET + 1)
+        self.total = 0
+        self.max = 0.0
+
+    def add(self, milliseconds: float):
+        """Record one sample"""
+        index = 0 if milliseconds <= 1 else min(int(math.log(milliseconds, self.GROWTH)) + 1, self.MAX_BUCKET)
+        self.counts[index] += 1
+        self.total += 1
+        self.max = max(self.max, milliseconds)
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the given percentile, within 5%"""
+        if not self.total:
+            return 0.0
+        rank = math.ceil(self.total * pct / 100.0)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.GROWTH ** index, self.max)
+        return self.max
+
+
+class LoadStats:
+    """Aggregates samples per action in time windows and streams each window out as it closes"""
+
+    def __init__(self, window_seconds: float, output_path: str, on_window=None):
+        self.window_seconds = window_seconds
+        self.output_path = output_path
+        self.on_window = on_window
+        self.started = time.monotonic()
+        self.window_index = 0
+        self.window = {}
+        self.errors = {}
+        self.totals = {}
+        self.error_totals = {}
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        self.output = open(output_path, "w")
+
+    def _roll(self):
+        """Close every window that has ended"""
+        current = int((time.monotonic() - self.started) // self.window_seconds)
+        while self.window_index < current:
+            self._emit()
+            self.window_index += 1
+
+    def _emit(self):
+        """Write one window summary as a JSON line and reset it"""
+        summary = {
+            "window_start_s": self.window_index * self.window_seconds,
+            "actions": {
+                action: {
+                    "count": histogram.total,
+                    "throughput_per_s": histogram.total / self.window_seconds,
+                    "p50_ms": histogram.percentile(50),
+                    "p95_ms": histogram.percentile(95),
+                    "p99_ms": histogram.percentile(99),
+                    "max_ms": histogram.max
+                } for action, histogram in self.window.items()
+            },
+            "errors": self.errors
+        }
+        self.output.write(json.dumps(summary) + "\n")
+        self.output.flush()
+        if self.on_window:
+            self.on_window(summary)
+        self.window = {}
+        self.errors = {}
+
+    def record(self, action: str, milliseconds: float):
+        """Record a successful action"""
+        self._roll()
+        self.window.setdefault(action, LatencyHistogram()).add(milliseconds)
+        self.totals.setdefault(action, LatencyHistogram()).add(milliseconds)
+
+    def record_error(self, action: str):
+        """Record a failed action"""
+        self._roll()
+        self.errors[action] = self.errors.get(action, 0) + 1
+        self.error_totals[action] = self.error_totals.get(action, 0) + 1
+
+    def close(self) -> dict:
+        """Flush the last window and return whole-run percentiles and error counts per action"""
+        self._emit()
+        self.output.close()
+        summary = {}
+        # Actions that only ever failed have no latency histogram
+        for action in list(self.totals) + [action for action in self.error_totals if action not in self.totals]:
+            h = self.totals.get(action) or LatencyHistogram()
+            summary[action] = {"count": h.total, "errors": self.error_totals.get(action, 0),
+                               "p50_ms": h.percentile(50), "p95_ms": h.percentile(95), "max_ms": h.max}
+        return summary
+
+
+def error_rate(totals: dict) -> float:
+    """Share of iterations that failed, in percent, from the totals run_load returns
+
+    Every failure is counted once, against the action it happened in, and ends its iteration.
+    """
+    errors = sum(stats["errors"] for stats in totals.values())
+    attempts = totals.get(ITERATION, {}).get("count", 0) + errors
+    return 100.0 * errors / attempts if attempts else 0.0
+
+
+class ActionTimer:
+    """Times the actions of one virtual-user iteration into the shared statistics"""
+
+    def __init__(self, stats: LoadStats):
+        self.stats = stats
+        self.failures = 0
+
+    async def __call__(self, action: str, awaitable):
+        """Await an action, recording its latency or its failure"""
+        start = time.perf_counter()
+        try:
+            result = await awaitable
+        except Exception:
+            self.stats.record_error(action)
+            self.failures += 1
+            raise
+        self.stats.record(action, (time.perf_counter() - start) * 1000)
+        return result
+
+
+async def _virtual_user(browser, journey, base_url: str, stats: LoadStats, start_delay: float, deadline: float):
+    """Wait for the ramp-up slot, then repeat the journey in a fresh context until the deadline
+
+    Each failure is counted once: against the timed action that raised it, otherwise against
+    the iteration. After a failed iteration the user backs off, so a struggling target is
+    not hammered by immediate retries.
+    """
+    await asyncio.sleep(start_delay)
+    timer = ActionTimer(stats)
+    backoff = 0.0
+    while time.monotonic() < deadline:
+        failures = timer.failures
+        start = time.perf_counter()
+        context = None
+        try:
+            context = await browser.new_context(**DEFAULT_CONTEXT_OPTIONS)
+            page = await context.new_page()
+            await journey(page, base_url, timer)
+            stats.record(ITERATION, (time.perf_counter() - start) * 1000)
+            backoff = 0.0
+        except Exception:
+            if timer.failures == failures:
+                stats.record_error(ITERATION)
+            backoff = min(backoff * 2 or FAILURE_BACKOFF_SECONDS, MAX_FAILURE_BACKOFF_SECONDS)
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+        if backoff:
+            await asyncio.sleep(min(backoff, max(0.0, deadline - time.monotonic())))
+
+
+async def run_load(journey, base_url: str, users: int, ramp_seconds: float, duration_seconds: float,
+                   browsers: int = 1, browser_name: str = "chromium", window_seconds: float = 10,
+                   output_path: str = "reports/load/load.jsonl", on_window=None) -> dict:
+    """Drive `users` virtual users spread over `browsers` browser processes for a fixed duration
+
+    Users start evenly over the ramp-up period. Returns whole-run percentiles per action.
+    """
+    stats = LoadStats(window_seconds, output_path, on_window)
+    async with async_playwright() as playwright:
+        browser_type = getattr(playwright, browser_name)
+        launched = [await browser_type.launch(headless=True) for _ in range(max(1, browsers))]
+        deadline = time.monotonic() + ramp_seconds + duration_seconds
+        try:
+            await asyncio.gather(*(
+                _virtual_user(launched[user % len(launched)], journey, base_url, stats,
+                              ramp_seconds * user / max(1, users), deadline)
+                for user in range(users)
+            ))
+        finally:
+            for browser in launched:
+                await browser.close()
+    return stats.close()
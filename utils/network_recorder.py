@@ -0,0 +1,39 @@
+"""HAR record/replay support for running scenarios offline"""
+import os
+import re
+
+NETWORK_MODES = ("live", "record", "replay")
+UNMATCHED_POLICIES = ("abort", "fallback")
+
+
+def _slug(name: str) -> str:
+    """Make a name safe to use as a file or directory name"""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "unnamed"
+
+
+def har_path(har_directory: str, feature_name: str, scenario_name: str, browser_name: str,
+             variant: str = None) -> str:
+    """Get the HAR file path for a scenario, per feature and browser, and per parametrization variant"""
+    name = _slug(scenario_name) if not variant else f"{_slug(scenario_name)}[{_slug(variant)}]"
+    return os.path.join(har_directory, _slug(feature_name), _slug(browser_name), f"{name}.har")
+
+
+def apply_network_mode(context, mode: str, path: str, unmatched: str = "abort"):
+    """Attach HAR recording or replay routing to a browser context
+
+    Returns False when replay was requested but no recording exists for the scenario.
+    """
+    if mode not in NETWORK_MODES:
+        raise ValueError(f"Unknown network mode '{mode}', expected one of {NETWORK_MODES}")
+    if unmatched not in UNMATCHED_POLICIES:
+        raise ValueError(f"Unknown unmatched-request policy '{unmatched}', expected one of {UNMATCHED_POLICIES}")
+
+    if mode == "record":
+        # The HAR is written when the context is closed
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        context.route_from_har(path, update=True, update_content="embed", update_mode="full")
+    elif mode == "replay":
+        if not os.path.exists(path):
+            return False
+        context.route_from_har(path, not_found=unmatched)
+    return True
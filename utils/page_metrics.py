@@ -0,0 +1,151 @@
+"""Browser-side page performance metrics and performance budgets"""
+import json
+import os
+import time
+
+import pytest
+
+from utils.artifacts import artifact_dir
+
+# Navigation Timing, paint, LCP and transfer sizes, all in milliseconds / bytes
+_COLLECT_METRICS_SCRIPT = """
+async () => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paints = {};
+    for (const entry of performance.getEntriesByType('paint')) paints[entry.name] = entry.startTime;
+    const lcp = await new Promise(resolve => {
+        let value = null;
+        try {
+            const observer = new PerformanceObserver(list => {
+                const entries = list.getEntries();
+                value = entries[entries.length - 1].startTime;
+            });
+            observer.observe({type: 'largest-contentful-paint', buffered: true});
+            setTimeout(() => { observer.disconnect(); resolve(value); }, 50);
+        } catch (e) {
+            resolve(null);  // LCP is not supported by every engine
+        }
+    });
+    const resources = performance.getEntriesByType('resource');
+    return {
+        url: location.href,
+        ttfb: nav ? nav.responseStart - nav.requestStart : null,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+        load: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+        fp: paints['first-paint'] ?? null,
+        fcp: paints['first-contentful-paint'] ?? null,
+        lcp: lcp,
+        transfer_size: (nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+        resource_count: resources.length
+    };
+}
+"""
+
+# Friendly names usable in feature files
+METRIC_ALIASES = {
+    "largest contentful paint": "lcp",
+    "first contentful paint": "fcp",
+    "first paint": "fp",
+    "time to first byte": "ttfb",
+    "dom content loaded": "dom_content_loaded",
+    "load time": "load",
+    "action time": "action_ms",
+    "transfer size": "transfer_size"
+}
+
+# Metrics an engine may not report at all, e.g. LCP outside Chromium
+ENGINE_OPTIONAL_METRICS = ("lcp", "fcp", "fp")
+
+# Budget units of the feature steps, as factors to milliseconds or bytes
+TIME_UNITS = {"ms": 1, "milliseconds": 1, "s": 1000, "seconds": 1000}
+SIZE_UNITS = {"b": 1, "bytes": 1, "kb": 1024, "mb": 1024 * 1024}
+SIZE_METRICS = ("transfer_size",)
+
+
+def budget_value(metric: str, budget: float, unit: str) -> float:
+    """Convert a budget written with a unit to the metric's milliseconds or bytes"""
+    metric = METRIC_ALIASES.get(metric, metric)
+    units = SIZE_UNITS if metric in SIZE_METRICS else TIME_UNITS
+    factor = units.get(unit.lower())
+    if factor is None:
+        raise ValueError(f"Unsupported unit '{unit}' for {metric}, expected one of {', '.join(units)}")
+    return budget * factor
+
+
+class PageMetricsCollector:
+    """Captures browser performance metrics per navigation or action and writes them per run"""
+
+    def __init__(self, budgets: dict = None, use_cdp: bool = True):
+        self.budgets = budgets or {}
+        self.use_cdp = use_cdp
+        self.samples = []
+        self.current_test = None
+        self._cdp_sessions = {}
+
+    def _cdp_metrics(self, page) -> dict:
+        """Chromium-only Performance.getMetrics counters, through one CDP session per page"""
+        browser = page.context.browser
+        if not self.use_cdp or browser is None or browser.browser_type.name != "chromium":
+            return {}
+        session = self._cdp_sessions.get(page)
+        if session is None:
+            session = page.context.new_cdp_session(page)
+            session.send("Performance.enable")
+            self._cdp_sessions[page] = session
+            page.once("close", lambda: self._cdp_sessions.pop(page, None))
+        metrics = session.send("Performance.getMetrics")["metrics"]
+        return {metric["name"]: metric["value"] for metric in metrics}
+
+    def capture(self, page, label: str, action_ms: float = None) -> dict:
+        """Record the current page's metrics under a label such as a page object name"""
+        try:
+            sample = page.evaluate(_COLLECT_METRICS_SCRIPT)
+            sample["cdp"] = self._cdp_metrics(page)
+        except Exception as e:
+            # Metrics must never fail a test, e.g. when the page navigated mid-evaluation
+            sample = {"error": str(e)}
+        sample.update({
+            "label": label,
+            "test": self.current_test,
+            "timestamp": time.time(),
+            "action_ms": action_ms
+        })
+        self.samples.append(sample)
+        return sample
+
+    def latest(self, label: str, test: str = None) -> dict:
+        """Get the most recent sample for a label, optionally within one test"""
+        for sample in reversed(self.samples):
+            if sample["label"] == label and (test is None or sample["test"] == test):
+                return sample
+        return None
+
+    def check_budget(self, label: str, metric: str, budget: float, test: str = None):
+        """Assert that the latest sample of a label keeps a metric under budget, in ms or bytes"""
+        metric = METRIC_ALIASES.get(metric, metric)
+        sample = self.latest(label, test)
+        assert sample is not None, f"No performance metrics were captured for {label}"
+        value = sample.get(metric)
+        if value is None and metric in ENGINE_OPTIONAL_METRICS and "error" not in sample:
+            pytest.skip(f"Metric '{metric}' is not reported by this browser engine ({sample.get('url')})")
+        assert value is not None, f"Metric '{metric}' is not available for {label} ({sample.get('url')})"
+        assert value < budget, f"{label} {metric} is {value:.0f}, over the budget of {budget:g}"
+
+    def check_configured_budgets(self, label: str, test: str = None):
+        """Assert every budget configured for a label"""
+        budgets = self.budgets.get(label)
+        assert budgets, f"No performance budget is configured for {label}"
+        for metric, budget in budgets.items():
+            self.check_budget(label, metric, budget, test)
+
+    def write(self, path: str = None) -> str:
+        """Write every sample of this run as JSON"""
+        path = path or os.path.join(artifact_dir("performance"), "page_metrics.json")
+        with open(path, "w") as file:
+            json.dump(self.samples, file, indent=2)
+        return path
+
+    def pytest_sessionfinish(self, session):
+        """Write the run's samples when the session ends"""
+        if self.samples:
+            self.write()
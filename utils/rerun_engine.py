@@ -0,0 +1,167 @@
+"""End-of-session retries of failed tests on the still-running browser, with a failure budget"""
+import copy
+import json
+import os
+
+import pytest
+from _pytest.runner import runtestprotocol
+
+
+class RerunPlugin:
+    """Retries failed tests after all others ran, before the session fixtures are torn down
+
+    While retries are pending, the last test of the session keeps the session-scoped fixtures
+    (Playwright, the browser, the context pool) alive, so retries never pay for a browser
+    launch, and cached login state is picked up by browser_context as usual. Only when the
+    session's last test is the first to fail is the browser launched again for its retry.
+    A first attempt that will be retried is reported with the "rerun" outcome, so it neither
+    fails the run nor disappears from the report.
+
+    The failure budget counts first-attempt failures on the controller, across all xdist
+    workers, and stops the whole run through xdist's scheduler when it is exhausted.
+    """
+
+    def __init__(self, retries: int = 1, failure_budget: int = 0, controller: bool = True):
+        self.retries = retries
+        self.failure_budget = failure_budget
+        self.controller = controller
+        self.session = None
+        self.failed_first = set()
+        self.pending = []
+        self.attempt = {}
+        self.outcomes = {}
+        self._attempt_failed = {}
+        self._user_properties = {}
+
+    def pytest_sessionstart(self, session):
+        """Remember the session, which the failure budget stops"""
+        self.session = session
+
+    def _attribute_reports_to(self, item):
+        """Point an xdist worker at a retried test, since it checks every report against its current test"""
+        if not hasattr(item.config, "workerinput"):
+            return
+        # execnet runs xdist.remote as a script on the worker, so the class cannot be imported
+        for plugin in item.config.pluginmanager.get_plugins():
+            if type(plugin).__name__ == "WorkerInteractor":
+                plugin.item_index = item.session.items.index(item)
+
+    def _keep_warm(self, item, nextitem):
+        """Teardown target: keep session fixtures up after the last test while retries are pending"""
+        if nextitem is None and self.pending:
+            return item.session
+        return nextitem
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Run one attempt through pytest's runtestprotocol, holding back failures that will be retried"""
+        attempt = self.attempt.get(item.nodeid, 0)
+        if attempt == 0:
+            self._user_properties[item.nodeid] = list(item.user_properties)
+        ihook = item.ihook
+        ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        reports = runtestprotocol(item, log=False, nextitem=self._keep_warm(item, nextitem))
+        retry = (any(report.failed for report in reports) and attempt < self.retries
+                 and not item.session.shouldstop)
+
+        for report in reports:
+            report.user_properties.append(("attempt", attempt + 1))
+            if retry and report.failed:
+                report.outcome = "rerun"
+            ihook.pytest_runtest_logreport(report=report)
+        ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+
+        if retry:
+            self.attempt[item.nodeid] = attempt + 1
+            self.pending.append((item, reports))
+        return True
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtestloop(self, session):
+        """Retry the failed tests once every other test has run"""
+        try:
+            result = yield
+        except (session.Interrupted, session.Failed):
+            self._fail_pending()
+            raise
+
+        while self.pending and not session.shouldstop:
+            batch, self.pending = self.pending, []
+            for index, (item, _) in enumerate(batch):
+                # Collection-time user properties only, so teardown data is not reported twice
+                item.user_properties = list(self._user_properties.get(item.nodeid, []))
+                nextitem = batch[index + 1][0] if index + 1 < len(batch) else None
+                self._attribute_reports_to(item)
+                item.config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+                if session.shouldfail or session.shouldstop:
+                    self.pending.extend(batch[index + 1:])
+                    break
+        self._fail_pending()
+        if session.shouldfail:
+            raise session.Failed(session.shouldfail)
+        if session.shouldstop:
+            raise session.Interrupted(session.shouldstop)
+        return result
+
+    def _fail_pending(self):
+        """Report retries that never ran, e.g. after the failure budget stopped the session, as failed"""
+        for item, reports in self.pending:
+            self._attribute_reports_to(item)
+            item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+            for report in reports:
+                if report.outcome == "rerun":
+                    report = copy.copy(report)
+                    report.outcome = "failed"
+                    item.ihook.pytest_runtest_logreport(report=report)
+            item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        self.pending = []
+
+    def pytest_report_teststatus(self, report, config):
+        """Show held-back first attempts as R / RERUN"""
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+        return None
+
+    def _spend_failure_budget(self, nodeid: str):
+        """Count a first-attempt failure and stop the run once the budget is exhausted"""
+        self.failed_first.add(nodeid)
+        if not self.failure_budget or len(self.failed_first) < self.failure_budget:
+            return
+        reason = f"failure budget of {self.failure_budget} failed tests exhausted"
+        # Under xdist the controller's scheduler shuts the workers down
+        dsession = self.session.config.pluginmanager.getplugin("dsession")
+        if dsession is not None:
+            dsession.shouldstop = dsession.shouldstop or reason
+        elif not self.session.shouldstop:
+            self.session.shouldstop = reason
+
+    def pytest_runtest_logreport(self, report):
+        """Keep every attempt's outcome per test, first attempts and retries separately"""
+        if not self.controller:
+            return
+        if report.outcome in ("failed", "rerun"):
+            self._attempt_failed[report.nodeid] = True
+            if dict(report.user_properties).get("attempt", 1) == 1:
+                self._spend_failure_budget(report.nodeid)
+        if report.when == "teardown":
+            outcome = "failed" if self._attempt_failed.pop(report.nodeid, False) else report.outcome
+            self.outcomes.setdefault(report.nodeid, []).append(outcome)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """List flaky tests and tests that failed every attempt, and write reports/reruns.json"""
+        if not self.controller:
+            return
+        retried = {nodeid: attempts for nodeid, attempts in self.outcomes.items() if len(attempts) > 1}
+        if not retried:
+            return
+        terminalreporter.write_sep("=", "retries", yellow=True)
+        for nodeid, attempts in retried.items():
+            label = "FLAKY" if attempts[-1] == "passed" else "FAILED"
+            terminalreporter.write_line(f"{label:<7} {' -> '.join(attempts)}  {nodeid}")
+        os.makedirs("reports", exist_ok=True)
+        with open(os.path.join("reports", "reruns.json"), "w") as file:
+            json.dump({
+                "first_attempt": {nodeid: attempts[0] for nodeid, attempts in self.outcomes.items()},
+                "retries": {nodeid: attempts[1:] for nodeid, attempts in retried.items()},
+                "flaky": sorted(nodeid for nodeid, attempts in retried.items() if attempts[-1] == "passed")
+            }, file, indent=2)
@@ -0,0 +1,102 @@
+"""Request blocking policy for images, fonts, media and third-party requests"""
+import fnmatch
+import json
+import os
+from urllib.parse import urlparse
+
+
+class ResourceSizeTable:
+    """Remembers response sizes per URL across runs to estimate bytes saved by blocking"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.sizes = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as file:
+                    self.sizes = json.load(file)
+            except (OSError, ValueError):
+                self.sizes = {}
+
+    def get(self, url: str) -> int:
+        """Get the last known size of a URL, 0 if never seen"""
+        return self.sizes.get(url, 0)
+
+    def record(self, url: str, size: int):
+        """Remember the size of a response"""
+        self.sizes[url] = size
+
+    def save(self):
+        """Persist the size table"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, 'w') as file:
+            json.dump(self.sizes, file)
+
+
+class ResourceBlocker:
+    """Aborts unneeded requests in a browser context and counts what was saved"""
+
+    def __init__(self, settings: dict, size_table: ResourceSizeTable = None, base_url: str = None):
+        self.resource_types = set(settings.get('resource_types') or [])
+        self.url_patterns = list(settings.get('url_patterns') or [])
+        self.allowed_domains = [domain.lower().lstrip('.') for domain in settings.get('allowed_domains') or []]
+        if self.allowed_domains and base_url:
+            # The application under test is always allowed
+            self.allowed_domains.append(urlparse(base_url).hostname.lower())
+        self.size_table = size_table
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+        self.blocked_by_type = {}
+
+    def _is_allowed_domain(self, url: str) -> bool:
+        """Check a URL against the domain allow-list"""
+        if not self.allowed_domains:
+            return True
+        host = (urlparse(url).hostname or "").lower()
+        if not host:
+            return True  # data:, blob: and similar URLs never leave the browser
+        return any(host == domain or host.endswith("." + domain) for domain in self.allowed_domains)
+
+    def should_block(self, request) -> bool:
+        """Decide whether a request is blocked by the policy"""
+        if request.resource_type in self.resource_types:
+            return True
+        if any(fnmatch.fnmatch(request.url, pattern) for pattern in self.url_patterns):
+            return True
+        return not self._is_allowed_domain(request.url)
+
+    def _handle_route(self, route):
+        """Abort blocked requests and hand everything else to the next route handler"""
+        request = route.request
+        if self.should_block(request):
+            self.blocked_requests += 1
+            self.blocked_by_type[request.resource_type] = self.blocked_by_type.get(request.resource_type, 0) + 1
+            if self.size_table:
+                self.bytes_saved += self.size_table.get(request.url)
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    def _record_response(self, response):
+        """Learn response sizes so blocked requests can be costed in later runs"""
+        content_length = response.headers.get("content-length")
+        if self.size_table and content_length and content_length.isdigit():
+            self.size_table.record(response.url, int(content_length))
+
+    def attach(self, context):
+        """Install the policy on a browser context"""
+        context.route("**/*", self._handle_route)
+        context.on("response", self._record_response)
+
+    def detach(self, context):
+        """Remove the policy from a browser context that is about to be reused"""
+        context.unroute("**/*", self._handle_route)
+        context.remove_listener("response", self._record_response)
+
+    def stats(self) -> dict:
+        """Get the blocking statistics for this context"""
+        return {
+            'blocked_requests': self.blocked_requests,
+            'bytes_saved': self.bytes_saved,
+            'blocked_by_type': dict(self.blocked_by_type)
+        }
@@ -0,0 +1,103 @@
+"""Import-time and startup-phase profiling for pytest runs (--startup-profile)"""
+import builtins
+import os
+import sys
+import time
+
+OPTION = "--startup-profile"
+
+
+def requested(argv: list = None) -> bool:
+    """Whether the profile was asked for on the command line or through STARTUP_PROFILE=1"""
+    argv = sys.argv if argv is None else argv
+    return OPTION in argv or OPTION in os.getenv("PYTEST_ADDOPTS", "") or os.getenv("STARTUP_PROFILE") == "1"
+
+
+class StartupProfiler:
+    """Times every import that loads new modules, plus the pytest startup phases
+
+    Imports are timed by wrapping builtins.__import__ from the moment start() is called,
+    so conftest.py starts it before its own imports. Plugins pytest loaded earlier are
+    listed by count only; `python -X importtime -m pytest --collect-only` breaks those down.
+    """
+
+    def __init__(self, top: int = 15):
+        self.top = top
+        self.started = time.perf_counter()
+        self.preloaded = len(sys.modules)
+        self.marks = [("profile start", self.started)]
+        self.imports = {}
+        self._stack = []
+        self._original_import = None
+        self._tests_finished = 0
+
+    def start(self):
+        """Begin timing imports"""
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+        return self
+
+    def stop(self):
+        """Stop timing imports"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """__import__ replacement recording cumulative and self time of imports that load modules"""
+        loaded = len(sys.modules)
+        start = time.perf_counter()
+        self._stack.append(0.0)
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            if len(sys.modules) > loaded:
+                key = ("." * level) + name
+                cumulative, own = self.imports.get(key, (0.0, 0.0))
+                self.imports[key] = (cumulative + elapsed, own + elapsed - children)
+
+    def mark(self, phase: str):
+        """Record the end of a startup phase"""
+        self.marks.append((phase, time.perf_counter()))
+
+    def pytest_collection(self, session):
+        """Everything before collection: conftest imports and pytest_configure"""
+        self.mark("conftest imports and configure")
+
+    def pytest_collection_finish(self, session):
+        """Collection, including feature parsing and step module imports"""
+        self.mark("collection")
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        """Time between collection and the first test"""
+        if not self._tests_finished and len(self.marks) == 3:
+            self.mark("session start-up")
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        """The first test pays for the Playwright import and the browser launch"""
+        if not self._tests_finished:
+            self.mark("first test, including Playwright import and browser launch")
+        self._tests_finished += 1
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print the phase and import breakdown"""
+        self.stop()
+        write = terminalreporter.write_line
+        terminalreporter.write_sep("=", "startup profile")
+        write(f"{self.preloaded} modules were already imported by pytest and its plugins before conftest.py")
+        previous = self.started
+        for phase, moment in self.marks[1:]:
+            write(f"{(moment - previous) * 1000:>9.1f} ms  {phase}")
+            previous = moment
+        if not self.imports:
+            return
+        write("")
+        write(f"{'cumulative':>12} {'self':>10}  import")
+        ranked = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (cumulative, own) in ranked[:self.top]:
+            write(f"{cumulative * 1000:>9.1f} ms {own * 1000:>7.1f} ms  {name}")
@@ -0,0 +1,73 @@
+"""Seed session and cart state into a browser context instead of clicking through the UI"""
+import json
+import uuid
+from urllib.parse import urlparse
+
+# Product ids the site stores in the `cart-contents` local storage key
+SAUCEDEMO_PRODUCT_IDS = {
+    "sauce-labs-bike-light": 0,
+    "sauce-labs-bolt-t-shirt": 1,
+    "sauce-labs-onesie": 2,
+    "test.allthethings()-t-shirt-(red)": 3,
+    "sauce-labs-backpack": 4,
+    "sauce-labs-fleece-jacket": 5,
+}
+
+SESSION_COOKIE = "session-username"
+CART_STORAGE_KEY = "cart-contents"
+
+# Seeds localStorage once per page from a storage state, a per-script sessionStorage
+# flag stops later navigations from overwriting what the application changed since
+_SEED_STORAGE_SCRIPT = """
+((origins, flag) => {
+    if (sessionStorage.getItem(flag)) return;
+    sessionStorage.setItem(flag, '1');
+    const entry = origins.find(o => o.origin === location.origin);
+    if (!entry) return;
+    for (const item of entry.localStorage) localStorage.setItem(item.name, item.value);
+})(%s, %s);
+"""
+
+
+def apply_storage_state(context, page, state: dict):
+    """Apply a Playwright storage state dict to an existing context and a not yet navigated page"""
+    if state.get('cookies'):
+        context.add_cookies(state['cookies'])
+    if state.get('origins'):
+        flag = json.dumps(f"__state_seeded_{uuid.uuid4().hex}__")
+        page.add_init_script(_SEED_STORAGE_SCRIPT % (json.dumps(state['origins']), flag))
+
+
+def product_id(product: str) -> int:
+    """Resolve a product slug or display name to the id used in the cart"""
+    key = product.strip().lower().replace(" ", "-")
+    if key not in SAUCEDEMO_PRODUCT_IDS:
+        raise ValueError(f"Unknown product '{product}', expected one of {sorted(SAUCEDEMO_PRODUCT_IDS)}")
+    return SAUCEDEMO_PRODUCT_IDS[key]
+
+
+class StateSeeder:
+    """Builds storage states with a logged-in session and cart contents for the site under test"""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        parsed = urlparse(base_url)
+        self.origin = f"{parsed.scheme}://{parsed.netloc}"
+
+    def build(self, user: str = None, cart: list = None) -> dict:
+        """Build a storage state dict for a user session and a list of products in the cart"""
+        state = {"cookies": [], "origins": []}
+        if user:
+            state["cookies"].append({"name": SESSION_COOKIE, "value": user, "url": self.origin + "/"})
+        if cart is not None:
+            state["origins"].append({
+                "origin": self.origin,
+                "localStorage": [{"name": CART_STORAGE_KEY, "value": json.dumps([product_id(p) for p in cart])}]
+            })
+        return state
+
+    def seed(self, context, page, user: str = None, cart: list = None) -> dict:
+        """Seed the state into a context before the page's first navigation"""
+        state = self.build(user, cart)
+        apply_storage_state(context, page, state)
+        return state
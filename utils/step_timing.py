@@ -0,0 +1,137 @@
+"""Per-step timing for pytest-bdd scenarios, hot-step report and Chrome trace export"""
+import json
+import os
+import time
+from contextlib import contextmanager
+
+from utils.artifacts import artifact_dir, worker_id
+from utils.duration_history import percentile
+
+
+def _now_us() -> int:
+    """Monotonic clock in microseconds, the unit of the Chrome trace-event format"""
+    return time.perf_counter_ns() // 1000
+
+
+class StepTracer:
+    """Records complete ("X") trace events for scenarios, steps and page actions"""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        # Metadata event so each xdist worker shows up under its own name
+        self.events = [{"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": worker_id()}}]
+        self._open = {}
+
+    def begin(self, key, name: str, category: str, args: dict = None):
+        """Open a span that is closed later with end()"""
+        self._open[key] = (name, category, args or {}, _now_us())
+
+    def end(self, key) -> float:
+        """Close a span opened with begin(), returning its duration in seconds"""
+        if key not in self._open:
+            return 0.0
+        name, category, args, start = self._open.pop(key)
+        return self._add(name, category, args, start)
+
+    @contextmanager
+    def span(self, name: str, category: str, args: dict = None):
+        """Time a block of code as a nested span"""
+        start = _now_us()
+        try:
+            yield
+        finally:
+            self._add(name, category, args or {}, start)
+
+    def _add(self, name: str, category: str, args: dict, start: int) -> float:
+        """Append a complete event and return its duration in seconds"""
+        duration = _now_us() - start
+        self.events.append({
+            "name": name, "cat": category, "ph": "X", "ts": start, "dur": duration,
+            "pid": self.pid, "tid": 0, "args": args
+        })
+        return duration / 1_000_000
+
+    def write(self, path: str):
+        """Write the events as Chrome trace-event JSON (chrome://tracing, Perfetto, speedscope)"""
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, file)
+
+
+def hot_steps(step_timings: list) -> list:
+    """Aggregate (step text, seconds) samples into rows ranked by total time"""
+    by_step = {}
+    for step_text, seconds in step_timings:
+        by_step.setdefault(step_text, []).append(seconds)
+    rows = [{
+        "step": step_text,
+        "count": len(samples),
+        "total": sum(samples),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "max": max(samples)
+    } for step_text, samples in by_step.items()]
+    return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+
+class StepTimingPlugin:
+    """Pytest plugin timing every pytest-bdd step, aggregated by step text across the run"""
+
+    def __init__(self, tracer: StepTracer, top: int = 15, controller: bool = True):
+        self.tracer = tracer
+        self.top = top
+        self.controller = controller
+
+    def pytest_bdd_before_scenario(self, request, feature, scenario):
+        """Open the scenario span"""
+        self.tracer.begin((request.node.nodeid, "scenario"), scenario.name, "scenario", {"feature": feature.name})
+
+    def pytest_bdd_after_scenario(self, request, feature, scenario):
+        """Close the scenario span"""
+        self.tracer.end((request.node.nodeid, "scenario"))
+
+    def pytest_bdd_before_step(self, request, feature, scenario, step, step_func):
+        """Open the step span"""
+        self.tracer.begin((request.node.nodeid, id(step)), step.name, "step", {"function": step_func.__name__})
+
+    def pytest_bdd_after_step(self, request, feature, scenario, step, step_func, step_func_args):
+        """Close the step span"""
+        self._finish_step(request, step)
+
+    def pytest_bdd_step_error(self, request, feature, scenario, step, step_func, step_func_args, exception):
+        """Close the span of a failing step"""
+        self._finish_step(request, step)
+
+    def _finish_step(self, request, step):
+        """Close the step span and attach the sample to the report for run-wide aggregation"""
+        seconds = self.tracer.end((request.node.nodeid, id(step)))
+        request.node.user_properties.append(("step_timing", (step.name, seconds)))
+
+    def pytest_sessionfinish(self, session):
+        """Export this process' spans as a Chrome trace"""
+        if len(self.tracer.events) > 1:
+            self.tracer.write(os.path.join(artifact_dir("timing"), "trace.json"))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print the hot-step table from every report, including those of xdist workers"""
+        if not self.controller:
+            return
+        samples = []
+        for reports in terminalreporter.stats.values():
+            for report in reports:
+                if getattr(report, "when", None) != "teardown":
+                    continue
+                samples.extend(value for key, value in report.user_properties if key == "step_timing")
+        if not samples:
+            return
+
+        rows = hot_steps(samples)
+        terminalreporter.write_sep("=", "hot steps")
+        terminalreporter.write_line(f"{'total':>8} {'count':>5} {'p50':>7} {'p95':>7} {'max':>7}  step")
+        for row in rows[:self.top]:
+            terminalreporter.write_line(
+                f"{row['total']:>7.2f}s {row['count']:>5} {row['p50']:>6.2f}s {row['p95']:>6.2f}s "
+                f"{row['max']:>6.2f}s  {row['step']}"
+            )
+        os.makedirs(os.path.join("reports", "timing"), exist_ok=True)
+        with open(os.path.join("reports", "timing", "hot_steps.json"), "w") as file:
+            json.dump(rows, file, indent=2)
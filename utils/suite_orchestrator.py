@@ -0,0 +1,174 @@
+"""Run several tag selections as one deduplicated session and fan the results out per tag"""
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+
+import pytest
+from _pytest.mark.expression import Expression
+
+try:
+    from _pytest.mark.expression import ParseError
+except ImportError:
+    # pytest 9 reports malformed expressions as SyntaxError
+    ParseError = SyntaxError
+
+from utils.artifacts import REPORTS_DIR, base_nodeid, safe_filename
+
+# Suite name selecting every collected scenario, like `run_tests.py all`
+ALL_SUITE = "all"
+
+
+def parse_suites(value: str) -> list:
+    """Split a comma-separated list of tag expressions, dropping duplicates"""
+    suites = []
+    for suite in value.split(","):
+        suite = suite.strip()
+        if suite and suite not in suites:
+            suites.append(suite)
+    return suites
+
+
+def union_expression(suites: list) -> str:
+    """Marker expression selecting every scenario of any suite, or None when one suite is 'all'"""
+    if ALL_SUITE in suites:
+        return None
+    return " or ".join(f"({suite})" for suite in suites)
+
+
+class SuiteOrchestratorPlugin:
+    """Selects the union of several tag expressions, runs each scenario once, reports per tag
+
+    Every collected test is tagged with the suites it belongs to through a user property,
+    which reaches the xdist controller with the reports. The controller writes one JUnit
+    file per suite to reports/junit/suites/ and a summary to reports/suites/summary.json.
+    """
+
+    def __init__(self, suites: list, controller: bool = True):
+        self.suites = suites
+        self.controller = controller
+        self.expressions = {}
+        self.results = {}
+        self.started = None
+        for suite in suites:
+            if suite == ALL_SUITE:
+                continue
+            try:
+                self.expressions[suite] = Expression.compile(suite)
+            except ParseError as e:
+                raise pytest.UsageError(f"--suites: invalid tag expression {suite!r}: {e}")
+
+    def restrict(self, config):
+        """Narrow -m to the union of the suites"""
+        union = union_expression(self.suites)
+        if union:
+            given = config.option.markexpr
+            config.option.markexpr = f"({given}) and ({union})" if given else union
+
+    def _suites_of(self, item) -> list:
+        """Suites whose expression selects a test"""
+        names = {mark.name for mark in item.iter_markers()}
+        matcher = lambda name, **kwargs: name in names
+        return [suite for suite in self.suites
+                if suite == ALL_SUITE or self.expressions[suite].evaluate(matcher)]
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        """Tag every test with its suites"""
+        for item in items:
+            item.user_properties.append(("suites", self._suites_of(item)))
+
+    def pytest_sessionstart(self, session):
+        """Start the wall clock"""
+        self.started = time.perf_counter()
+
+    def pytest_runtest_logreport(self, report):
+        """Keep the final attempt's outcome of every test and its summed duration over all attempts"""
+        if not self.controller:
+            return
+        # Under --dist loadgroup the node id carries an @<group> suffix
+        result = self.results.setdefault(base_nodeid(report.nodeid), {"suites": [], "outcome": "passed", "message": None,
+                                                         "duration": 0.0, "attempt_time": 0.0})
+        if report.when == "setup":
+            result.update(outcome="passed", message=None, attempt_time=0.0)
+        result["duration"] += report.duration
+        result["attempt_time"] += report.duration
+        if report.outcome in ("failed", "rerun") and result["outcome"] != "failed":
+            result.update(outcome="failed", message=report.longreprtext)
+        elif report.skipped and result["outcome"] == "passed":
+            result.update(outcome="skipped", message=report.longreprtext)
+        for key, value in report.user_properties:
+            if key == "suites":
+                result["suites"] = value
+
+    def _suite_results(self, suite: str) -> dict:
+        """Results of the tests a suite selected"""
+        return {nodeid: result for nodeid, result in self.results.items() if suite in result["suites"]}
+
+    def _write_junit(self, suite: str, results: dict, directory: str) -> str:
+        """Write the JUnit report of one suite"""
+        counts = {outcome: sum(1 for result in results.values() if result["outcome"] == outcome)
+                  for outcome in ("failed", "skipped")}
+        testsuite = ET.Element("testsuite", name=suite, tests=str(len(results)), failures=str(counts["failed"]),
+                               skipped=str(counts["skipped"]), errors="0",
+                               time=f"{sum(result['attempt_time'] for result in results.values()):.3f}")
+        for nodeid, result in sorted(results.items()):
+            path, _, name = nodeid.rpartition("::")
+            module = path[:-3] if path.endswith(".py") else path
+            testcase = ET.SubElement(testsuite, "testcase", classname=module.replace("/", "."),
+                                     name=name, time=f"{result['attempt_time']:.3f}")
+            if result["outcome"] == "failed":
+                ET.SubElement(testcase, "failure", message="failed").text = result["message"]
+            elif result["outcome"] == "skipped":
+                ET.SubElement(testcase, "skipped", message=result["message"] or "skipped")
+        path = os.path.join(directory, f"{safe_filename(suite)}.xml")
+        ET.ElementTree(testsuite).write(path, encoding="utf-8", xml_declaration=True)
+        return path
+
+    def pytest_terminal_summary(self, terminalreporter, exitstatus, config):
+        """Per-suite outcome counts, the executions saved by deduplication, wall versus summed time"""
+        if not self.controller or not self.results:
+            return
+        wall_time = time.perf_counter() - self.started
+        summed = sum(result["duration"] for result in self.results.values())
+        junit_dir = os.path.join(REPORTS_DIR, "junit", "suites")
+        os.makedirs(junit_dir, exist_ok=True)
+
+        terminalreporter.write_sep("=", "suites")
+        suites, selected = {}, 0
+        for suite in self.suites:
+            results = self._suite_results(suite)
+            selected += len(results)
+            counts = {outcome: sum(1 for result in results.values() if result["outcome"] == outcome)
+                      for outcome in ("passed", "failed", "skipped")}
+            report = self._write_junit(suite, results, junit_dir)
+            suites[suite] = dict(counts, tests=len(results), report=report,
+                                 test_time=round(sum(result["attempt_time"] for result in results.values()), 3))
+            terminalreporter.write_line(
+                f"{suite:<24} {len(results):>4} tests  {counts['passed']:>4} passed  {counts['failed']:>4} failed  "
+                f"{counts['skipped']:>4} skipped  {suites[suite]['test_time']:>8.2f}s  {report}",
+                red=counts["failed"] > 0
+            )
+
+        workers = config.getoption("numprocesses", None) or 1
+        terminalreporter.write_line(
+            f"{len(self.results)} unique tests for {selected} suite selections "
+            f"({selected - len(self.results)} duplicate executions avoided)"
+        )
+        terminalreporter.write_line(
+            f"wall time {wall_time:.2f}s, summed test time {summed:.2f}s on {workers} workers "
+            f"({summed / wall_time if wall_time else 0:.2f}x)"
+        )
+        summary_dir = os.path.join(REPORTS_DIR, "suites")
+        os.makedirs(summary_dir, exist_ok=True)
+        with open(os.path.join(summary_dir, "summary.json"), "w") as file:
+            json.dump({
+                "suites": suites,
+                "unique_tests": len(self.results),
+                "suite_selections": selected,
+                "wall_time": round(wall_time, 3),
+                "summed_test_time": round(summed, 3),
+                "workers": workers,
+                "tests": {nodeid: {"outcome": result["outcome"], "suites": result["suites"],
+                                   "duration": round(result["duration"], 3)}
+                          for nodeid, result in sorted(self.results.items())}
+            }, file, indent=2)
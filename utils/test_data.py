@@ -0,0 +1,152 @@
+"""Workbook-driven test data: rows streamed from TestData/*.xlsx into an on-disk cache"""
+import functools
+import hashlib
+import json
+import os
+import shutil
+
+from utils.artifacts import safe_filename
+
+# Feature tag prefix that parametrizes a scenario with the rows of a sheet: @data:Credentials
+DATA_TAG_PREFIX = "data:"
+
+
+def _file_sha256(path: str) -> str:
+    """Content hash of a workbook, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_json(path: str, data):
+    """Atomically write a small JSON file"""
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w") as file:
+        json.dump(data, file)
+    os.replace(temporary, path)
+
+
+class SheetData:
+    """Rows of one cached sheet, read from disk one at a time
+
+    Only the header and the byte offset of every row are held in memory; a row is
+    parsed when a test asks for it.
+    """
+
+    def __init__(self, path: str, header: list, offsets: list):
+        self.path = path
+        self.header = header
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def row(self, index: int) -> dict:
+        """One row as a dict keyed by the header"""
+        with open(self.path, "rb") as file:
+            file.seek(self.offsets[index])
+            return dict(zip(self.header, json.loads(file.readline())))
+
+    def __iter__(self):
+        """Stream every row"""
+        with open(self.path, "rb") as file:
+            for offset in self.offsets:
+                file.seek(offset)
+                yield dict(zip(self.header, json.loads(file.readline())))
+
+
+class WorkbookData:
+    """A workbook converted once per content hash into JSON-lines files, one per sheet
+
+    The workbook is opened in openpyxl's read-only mode and streamed row by row, so
+    neither the conversion nor later runs hold the whole workbook in memory. Unchanged
+    files are recognised by mtime and size without re-hashing them.
+    """
+
+    def __init__(self, workbook_path: str, cache_dir: str):
+        self.workbook_path = workbook_path
+        self.cache_dir = os.path.join(cache_dir, safe_filename(os.path.basename(workbook_path)))
+        self._sheets = None
+
+    def _digest(self) -> str:
+        """Content hash of the workbook, reusing the last one while mtime and size match"""
+        stat = os.stat(self.workbook_path)
+        stamp_path = os.path.join(self.cache_dir, "stat.json")
+        try:
+            with open(stamp_path, "r") as file:
+                stamps = json.load(file)
+        except (OSError, ValueError):
+            stamps = {}
+        key = os.path.abspath(self.workbook_path)
+        stamp = stamps.get(key)
+        if stamp and stamp[:2] == [stat.st_mtime_ns, stat.st_size]:
+            return stamp[2]
+        digest = _file_sha256(self.workbook_path)
+        stamps[key] = [stat.st_mtime_ns, stat.st_size, digest]
+        _write_json(stamp_path, stamps)
+        return digest
+
+    def _convert(self, directory: str) -> dict:
+        """Stream every sheet into a JSON-lines file and return the sheet index"""
+        # openpyxl is only needed when a workbook changed
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(self.workbook_path, read_only=True, data_only=True)
+        sheets = {}
+        try:
+            for index, worksheet in enumerate(workbook.worksheets):
+                rows = worksheet.iter_rows(values_only=True)
+                header = [str(value).strip() if value is not None else f"column_{column + 1}"
+                          for column, value in enumerate(next(rows, ()))]
+                path = os.path.join(directory, f"sheet{index}.jsonl")
+                offsets = []
+                with open(f"{path}.{os.getpid()}.tmp", "wb") as file:
+                    for row in rows:
+                        values = list(row[:len(header)])
+                        if all(value is None or value == "" for value in values):
+                            continue
+                        offsets.append(file.tell())
+                        file.write(json.dumps(values, default=str, separators=(",", ":")).encode("utf-8") + b"\n")
+                os.replace(f"{path}.{os.getpid()}.tmp", path)
+                sheets[worksheet.title] = {"file": os.path.basename(path), "header": header, "offsets": offsets}
+        finally:
+            workbook.close()
+        return sheets
+
+    def _load(self) -> tuple:
+        """Cache directory and sheet index of the current workbook content, converting it on a miss"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        directory = os.path.join(self.cache_dir, self._digest()[:16])
+        index_path = os.path.join(directory, "index.json")
+        try:
+            with open(index_path, "r") as file:
+                return directory, json.load(file)
+        except (OSError, ValueError):
+            pass
+        os.makedirs(directory, exist_ok=True)
+        sheets = self._convert(directory)
+        _write_json(index_path, sheets)
+        # Conversions of earlier workbook versions are never read again
+        for entry in os.listdir(self.cache_dir):
+            stale = os.path.join(self.cache_dir, entry)
+            if os.path.isdir(stale) and stale != directory:
+                shutil.rmtree(stale, ignore_errors=True)
+        return directory, sheets
+
+    def sheet(self, name: str) -> SheetData:
+        """Cached rows of a sheet"""
+        if self._sheets is None:
+            self._sheets = self._load()
+        directory, sheets = self._sheets
+        if name not in sheets:
+            raise KeyError(f"Sheet '{name}' not found in {self.workbook_path}, available: {', '.join(sheets)}")
+        entry = sheets[name]
+        return SheetData(os.path.join(directory, entry["file"]), entry["header"], entry["offsets"])
+
+
+@functools.lru_cache(maxsize=None)
+def workbook_data(workbook_path: str, cache_dir: str) -> WorkbookData:
+    """Shared WorkbookData per workbook, so every scenario of a run reuses one sheet index"""
+    return WorkbookData(workbook_path, cache_dir)